@@ -0,0 +1,149 @@
+"""
+End-to-end documentation throughput benchmark against the local stub LLM.
+
+Builds synthetic SQLite schemas, profiles every table with SchemaExtractor and
+runs GlossaryChain and TableDescriptionChain through a GenerationRouter whose
+only target is the "Local Stub" provider, so no API credits are used.
+
+    python benchmarks/bench_chains.py --tables 10 100 1000 --latency 0.5
+
+Set GLOSSGEN_LLM_CASSETTE to replay recorded responses of a real provider
+instead (use --provider/--model to select it).
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+import pandas as pd
+from sqlalchemy import create_engine
+
+from glossgen.chains.glossary_chain import GlossaryChain, TableDescriptionChain
+from glossgen.config.app_config import AppConfig
+from glossgen.services.llm_registry import LLMClientRegistry
+from glossgen.services.llm_router import GenerationRouter
+from glossgen.tools.sql import SchemaExtractor
+
+
+def build_synthetic_database(path: str, n_tables: int, n_rows: int) -> None:
+    """Create n_tables tables sharing common columns, linked by customer_id"""
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE customers (customer_id INTEGER PRIMARY KEY, name TEXT, created_at TIMESTAMP)")
+    conn.executemany(
+        "INSERT INTO customers VALUES (?, ?, ?)",
+        [(i, f"Customer {i}", f"2024-01-{i % 28 + 1:02d} 10:00:00") for i in range(n_rows)]
+    )
+    for t in range(n_tables - 1):
+        conn.execute(
+            f"CREATE TABLE table_{t} (id INTEGER PRIMARY KEY, customer_id INTEGER, "
+            f"created_at TIMESTAMP, status TEXT, amount REAL, code_{t} TEXT)"
+        )
+        conn.executemany(
+            f"INSERT INTO table_{t} VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (i, i % n_rows, f"2024-02-{i % 28 + 1:02d} 12:00:00",
+                 ("open", "closed", "pending")[i % 3], i * 1.5, f"C{t}-{i}")
+                for i in range(n_rows)
+            ]
+        )
+    conn.commit()
+    conn.close()
+
+
+def run_benchmark(n_tables: int, n_rows: int, provider: str, model: str, workers: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "bench.db")
+        build_synthetic_database(db_path, n_tables, n_rows)
+        engine = create_engine(f"sqlite:///{db_path}")
+
+        LLMClientRegistry.clear()
+        router = GenerationRouter.from_settings({'provider': provider, 'model': model})
+        llm = router.targets[0].get_llm(router.temperature)
+        stats_before = dict(getattr(llm, 'stats', {}))
+
+        started = time.perf_counter()
+        extractor = SchemaExtractor(engine)
+        schema_tables = {
+            table: extractor.generate_schema_table_for_table(table)
+            for table in extractor.schema_info
+        }
+        profiled = time.perf_counter()
+
+        glossary_chain = GlossaryChain(router=router)
+        glossaries = {}
+        errors = 0
+        for table, response, error in router.map(
+            lambda table: glossary_chain.invoke(schema_tables[table]),
+            list(schema_tables),
+            max_workers=workers
+        ):
+            if error or isinstance(response, dict):
+                errors += 1
+                continue
+            glossaries[table] = pd.DataFrame(response)
+
+        description_chain = TableDescriptionChain(router=router)
+        for table, _, error in router.map(
+            lambda table: description_chain.invoke(table, glossaries[table], "{}"),
+            list(glossaries),
+            max_workers=workers
+        ):
+            if error:
+                errors += 1
+        finished = time.perf_counter()
+        engine.dispose()
+
+    stats = getattr(llm, 'stats', {})
+    requests = stats.get('requests', 0) - stats_before.get('requests', 0)
+    tokens = (
+        stats.get('prompt_tokens', 0) + stats.get('completion_tokens', 0)
+        - stats_before.get('prompt_tokens', 0) - stats_before.get('completion_tokens', 0)
+    )
+    generation_time = finished - profiled
+    return {
+        'tables': n_tables,
+        'total_seconds': round(finished - started, 3),
+        'profiling_seconds': round(profiled - started, 3),
+        'generation_seconds': round(generation_time, 3),
+        'requests': requests,
+        'requests_per_second': round(requests / generation_time, 2) if generation_time else None,
+        'tokens_per_second': round(tokens / generation_time, 1) if generation_time else None,
+        'errors': errors
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="GlossGen chain throughput benchmark")
+    parser.add_argument("--tables", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--rows", type=int, default=50)
+    parser.add_argument("--provider", default="Local Stub")
+    parser.add_argument("--model", default="stub-model")
+    parser.add_argument("--workers", type=int, default=AppConfig.GENERATION_MAX_WORKERS)
+    parser.add_argument("--latency", type=float, default=AppConfig.STUB_LLM_LATENCY_MEAN,
+                        help="Mean stub latency in seconds")
+    parser.add_argument("--tokens-per-second", type=float, default=AppConfig.STUB_LLM_TOKENS_PER_SECOND)
+    parser.add_argument("--error-rate", type=float, default=AppConfig.STUB_LLM_ERROR_RATE)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON lines")
+    args = parser.parse_args()
+
+    AppConfig.STUB_LLM_LATENCY_MEAN = args.latency
+    AppConfig.STUB_LLM_TOKENS_PER_SECOND = args.tokens_per_second
+    AppConfig.STUB_LLM_ERROR_RATE = args.error_rate
+
+    results = []
+    for n_tables in args.tables:
+        result = run_benchmark(n_tables, args.rows, args.provider, args.model, args.workers)
+        results.append(result)
+        if args.json:
+            print(json.dumps(result))
+            sys.stdout.flush()
+
+    if not args.json:
+        print(pd.DataFrame(results).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
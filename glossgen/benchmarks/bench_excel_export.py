@@ -0,0 +1,100 @@
+"""
+Peak memory of the glossary Excel export against the number of tables.
+
+Builds synthetic glossaries (profile statistics, samples and descriptions)
+in a GlossaryStore and exports them with the constant-memory xlsxwriter
+exporter, measuring peak Python allocations with tracemalloc. --legacy also
+runs the previous approach, every table through pd.ExcelWriter into a
+BytesIO, for comparison.
+
+    python benchmarks/bench_excel_export.py --tables 100 500 1500 --legacy
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from glossgen.services.exporters import excel_sheet_names, write_glossary_excel
+from glossgen.state.glossary_store import GlossaryStore
+
+
+def build_glossaries(n_tables: int, n_columns: int) -> GlossaryStore:
+    rng = np.random.default_rng(0)
+    glossaries = GlossaryStore()
+    for t in range(n_tables):
+        glossaries[f"warehouse_fact_table_with_a_long_name_{t}"] = pd.DataFrame({
+            'column_name': [f"column_{c}" for c in range(n_columns)],
+            'data_type': ["VARCHAR(255)", "INTEGER", "TIMESTAMP"] * (n_columns // 3) + ["REAL"] * (n_columns % 3),
+            'is_primary_key': [c == 0 for c in range(n_columns)],
+            'sample_data': [[f"value {c}-{i} for table {t}" for i in range(5)] for c in range(n_columns)],
+            'description': [f"Description of column {c} of table {t}. " * 3 for c in range(n_columns)],
+            'uniqueness_percentage': rng.random(n_columns) * 100,
+            'null_percentage': rng.random(n_columns) * 100,
+            'primary_key_confidence_score': rng.random(n_columns),
+        })
+    return glossaries
+
+
+def export_constant_memory(glossaries: GlossaryStore, path: str) -> None:
+    with open(path, 'wb') as export_file:
+        write_glossary_excel(glossaries, list(glossaries))(export_file)
+
+
+def export_legacy(glossaries: GlossaryStore, path: str) -> None:
+    sheet_names = excel_sheet_names(list(glossaries))
+    excel_buffer = io.BytesIO()
+    with pd.ExcelWriter(excel_buffer, engine="xlsxwriter") as writer:
+        for table in glossaries:
+            glossaries[table].to_excel(writer, index=False, sheet_name=sheet_names[table])
+    with open(path, 'wb') as export_file:
+        export_file.write(excel_buffer.getvalue())
+
+
+def measure(exporter, glossaries: GlossaryStore, tmp_dir: str) -> dict:
+    path = os.path.join(tmp_dir, f"{exporter.__name__}.xlsx")
+    tracemalloc.start()
+    started = time.perf_counter()
+    exporter(glossaries, path)
+    seconds = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'seconds': round(seconds, 2),
+        'peak_mb': round(peak / 1024 / 1024, 1),
+        'file_mb': round(os.path.getsize(path) / 1024 / 1024, 1)
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="GlossGen Excel export memory benchmark")
+    parser.add_argument("--tables", type=int, nargs="+", default=[100, 500, 1500])
+    parser.add_argument("--columns", type=int, default=30)
+    parser.add_argument("--legacy", action="store_true", help="Also measure the in-memory pd.ExcelWriter export")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON lines")
+    args = parser.parse_args()
+
+    exporters = [export_constant_memory] + ([export_legacy] if args.legacy else [])
+    results = []
+    for n_tables in args.tables:
+        glossaries = build_glossaries(n_tables, args.columns)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for exporter in exporters:
+                result = dict({'exporter': exporter.__name__, 'tables': n_tables}, **measure(exporter, glossaries, tmp_dir))
+                results.append(result)
+                if args.json:
+                    print(json.dumps(result))
+                    sys.stdout.flush()
+
+    if not args.json:
+        print(pd.DataFrame(results).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -32,6 +32,7 @@ setup(
         "xlsxwriter==3.2.2",
         "tabulate==0.9.0",
         "pandas>=1.5.3",
+        "pyarrow>=7.0.0",
         "sqlalchemy>=2.0.0",
         "psycopg2-binary",
     ],
@@ -6,9 +6,11 @@ from langchain.prompts import (
 import os
 from typing import Dict, Any, Optional
 
-from glossgen.utils.ai_utils import get_llm_client
-from glossgen.utils.utils import process_response
-from glossgen.state.session_state import SessionState
+import pandas as pd
+
+from glossgen.services.llm_router import GenerationRouter
+from glossgen.utils.utils import process_response, parse_glossary_response
+from glossgen.config.app_config import AppConfig
 
 example_schema_data = """[
 {{
@@ -99,8 +101,14 @@ Return the glossary table in JSON format.
 """
 
 class GlossaryChain(object):
-    def __init__(self):
-        """Initialize the GlossaryChain"""
+    def __init__(self, router: Optional[GenerationRouter] = None):
+        """
+        Initialize the GlossaryChain
+        
+        Args:
+            router: Generation router to use; built from the session on first
+                use if omitted. Pass one explicitly when invoking from worker threads.
+        """
         glossary_system_prompt = SystemMessagePromptTemplate(
             prompt=PromptTemplate(
                 input_variables=["schema_data"], template=glossary_system_template_str
@@ -114,44 +122,69 @@ class GlossaryChain(object):
             messages=messages,
         )
         
-        # LLM will be initialized when needed
-        self.llm = None
+        # Router will be initialized when needed
+        self.router = router
     
     def _initialize_llm(self):
-        """Initialize the LLM based on current session state"""
-        ai_settings = SessionState.get_ai_settings()
-        
-        self.llm = get_llm_client(
-            provider=ai_settings['provider'] or "OpenAI",
-            api_key=ai_settings['api_key'],
-            model=ai_settings['model'] or "gpt-3.5-turbo",
-            endpoint=ai_settings['endpoint'],
-            temperature=0.2
-        )
+        """Initialize the generation router based on current session state"""
+        self.router = GenerationRouter.from_session(temperature=0.2)
     
     def invoke(self, input: dict) -> dict:
         """
         Generate a glossary for the given schema data
         
+        Columns missing from the response (truncated or malformed objects) are
+        re-requested on their own, up to GLOSSARY_MAX_REPAIR_ROUNDS times.
+        
         Args:
             input: Dictionary containing schema_data
             
         Returns:
             Dictionary containing the generated glossary
         """
-        # Initialize LLM if not already done
-        if not self.llm:
+        # Initialize router if not already done
+        if not self.router:
             self._initialize_llm()
         
-        # Invoke the LLM with the prompt
-        response = self.llm.invoke(self.glossary_prompt_template.format(schema_data=input))
+        expected_columns = self._column_names(input)
+        items = []
+        schema_data = input
+        for _ in range(AppConfig.GLOSSARY_MAX_REPAIR_ROUNDS + 1):
+            # Invoke the LLM with the prompt
+            response = self.router.invoke(self.format_prompt(schema_data))
+            
+            # Keep every complete entry, even if the rest of the response is broken
+            round_items, missing = parse_glossary_response(response.content, expected_columns)
+            items.extend(round_items)
+            if not missing or not expected_columns:
+                break
+            expected_columns = missing
+            schema_data = self._select_columns(input, missing)
         
-        # Process and return the response
-        try:
-            return process_response(response)
-        except:
+        if not items:
             # If JSON parsing fails, return the raw content
             return {"error": response.content}
+        return process_response(items)
+    
+    def format_prompt(self, schema_data: Any) -> str:
+        """Render the glossary prompt for a schema table (used by batch jobs too)"""
+        return self.glossary_prompt_template.format(schema_data=schema_data)
+    
+    @staticmethod
+    def _column_names(schema_data: Any) -> list:
+        """Column names in a schema table (DataFrame or list of records)"""
+        if isinstance(schema_data, pd.DataFrame) and 'column_name' in schema_data.columns:
+            return schema_data['column_name'].tolist()
+        if isinstance(schema_data, list):
+            return [item['column_name'] for item in schema_data if isinstance(item, dict) and 'column_name' in item]
+        return []
+    
+    @staticmethod
+    def _select_columns(schema_data: Any, columns: list) -> Any:
+        """Restrict a schema table to the given columns"""
+        if isinstance(schema_data, pd.DataFrame):
+            return schema_data[schema_data['column_name'].isin(columns)].reset_index(drop=True)
+        return [item for item in schema_data if item.get('column_name') in columns]
 
 
 table_description_template_str = """You are a helpful assistant that generates clear and concise descriptions of database tables based on their glossary information and relationships.
@@ -178,8 +211,14 @@ Response should be direct prose, not JSON formatted."""
 
 
 class TableDescriptionChain(object):
-    def __init__(self):
-        """Initialize the TableDescriptionChain"""
+    def __init__(self, router: Optional[GenerationRouter] = None):
+        """
+        Initialize the TableDescriptionChain
+        
+        Args:
+            router: Generation router to use; built from the session on first
+                use if omitted. Pass one explicitly when invoking from worker threads.
+        """
         description_system_prompt = SystemMessagePromptTemplate(
             prompt=PromptTemplate(
                 input_variables=["table_name", "glossary_data", "relationship_data"], 
@@ -194,20 +233,12 @@ class TableDescriptionChain(object):
             messages=messages,
         )
         
-        # LLM will be initialized when needed
-        self.llm = None
+        # Router will be initialized when needed
+        self.router = router
     
     def _initialize_llm(self):
-        """Initialize the LLM based on current session state"""
-        ai_settings = SessionState.get_ai_settings()
-        
-        self.llm = get_llm_client(
-            provider=ai_settings['provider'] or "OpenAI",
-            api_key=ai_settings['api_key'],
-            model=ai_settings['model'] or "gpt-3.5-turbo",
-            endpoint=ai_settings['endpoint'],
-            temperature=0.2
-        )
+        """Initialize the generation router based on current session state"""
+        self.router = GenerationRouter.from_session(temperature=0.2)
     
     def invoke(self, table_name: str, glossary_data: dict, relationship_data: dict) -> str:
         """
@@ -222,18 +253,22 @@ class TableDescriptionChain(object):
         Returns:
             LLM response containing the generated description
         """
-        # Initialize LLM if not already done
-        if not self.llm:
+        # Initialize router if not already done
+        if not self.router:
             self._initialize_llm()
         
         
         # Invoke the LLM with the prompt
-        response = self.llm.invoke(
-            self.description_prompt_template.format(
-                table_name=table_name,
-                glossary_data=glossary_data,
-                relationship_data=relationship_data
-            )
+        response = self.router.invoke(
+            self.format_prompt(table_name, glossary_data, relationship_data)
         )
         
         return response.content
+    
+    def format_prompt(self, table_name: str, glossary_data: Any, relationship_data: Any) -> str:
+        """Render the description prompt for a table (used by batch jobs too)"""
+        return self.description_prompt_template.format(
+            table_name=table_name,
+            glossary_data=glossary_data,
+            relationship_data=relationship_data
+        )
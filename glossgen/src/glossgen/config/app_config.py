@@ -14,7 +14,7 @@ class AppConfig:
     
     # AI provider settings
     DEFAULT_AI_PROVIDER = "OpenAI"
-    AI_PROVIDERS = ["OpenAI", "Deepseek", "OpenAI Compatible", "Claude", "Google Gemini"]
+    AI_PROVIDERS = ["OpenAI", "Deepseek", "OpenAI Compatible", "Claude", "Google Gemini", "Local Stub"]
     
     # AI model settings by provider
     AI_MODELS: Dict[str, List[str]] = {
@@ -22,17 +22,19 @@ class AppConfig:
         "Deepseek": ["deepseek-chat", "deepseek-coder"],
         "OpenAI Compatible": ["custom-model"],
         "Claude": ["claude-3-opus-20240229", "claude-3-sonnet-20240229", "claude-3-haiku-20240307"],
-        "Google Gemini": ["gemini-pro", "gemini-1.5-pro"]
+        "Google Gemini": ["gemini-pro", "gemini-1.5-pro"],
+        "Local Stub": ["stub-model"]
     }
     DEFAULT_MODEL = "gpt-4o-mini"
-    IMPLETMENTED_AI_PROVIDERS = ["OpenAI", "OpenAI Compatible"]
+    IMPLETMENTED_AI_PROVIDERS = ["OpenAI", "OpenAI Compatible", "Local Stub"]
     # Default endpoints for API providers
     DEFAULT_ENDPOINTS = {
         "OpenAI": "https://api.openai.com/v1",
         "Deepseek": "https://api.deepseek.com/v1",
         "OpenAI Compatible": "",  # User will provide
         "Claude": "https://api.anthropic.com/v1",
-        "Google Gemini": "https://generativelanguage.googleapis.com/v1beta"
+        "Google Gemini": "https://generativelanguage.googleapis.com/v1beta",
+        "Local Stub": ""
     }
     
     # Environment variable names for API keys
@@ -42,7 +44,64 @@ class AppConfig:
         "Claude": "ANTHROPIC_API_KEY",
         "Google Gemini": "GOOGLE_API_KEY"
     }
-    
+
+    # LLM client pooling settings (shared by all sessions in the process)
+    LLM_CLIENT_CACHE_SIZE: int = 32
+    LLM_HTTP_MAX_CONNECTIONS: int = 20
+    LLM_HTTP_MAX_KEEPALIVE: int = 10
+    LLM_HTTP_KEEPALIVE_EXPIRY: float = 60.0
+    LLM_HTTP_TIMEOUT: float = 60.0
+
+    # LLM retry, throttling and circuit breaker settings (per provider)
+    LLM_MAX_RETRIES: int = 5
+    LLM_BACKOFF_BASE: float = 0.5
+    LLM_BACKOFF_MAX: float = 30.0
+    LLM_REQUEST_DEADLINE: float = 180.0
+    LLM_INITIAL_CONCURRENCY: int = 4
+    LLM_MIN_CONCURRENCY: int = 1
+    LLM_MAX_CONCURRENCY: int = 16
+    LLM_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    LLM_CIRCUIT_RESET_TIMEOUT: float = 30.0
+    LLM_LATENCY_WINDOW: int = 500
+
+    # Generation router settings (load balancing across provider targets)
+    GENERATION_MAX_WORKERS: int = 8
+    ROUTER_RETRIES_PER_TARGET: int = 1
+    ROUTER_EWMA_ALPHA: float = 0.2
+
+    # Follow-up requests for columns missing from a glossary response
+    GLOSSARY_MAX_REPAIR_ROUNDS: int = 2
+
+    # Local stub LLM ("Local Stub" provider) and record/replay cassettes
+    STUB_LLM_LATENCY_MEAN: float = float(os.environ.get("GLOSSGEN_STUB_LATENCY", "0.5"))
+    STUB_LLM_LATENCY_SIGMA: float = 0.3
+    STUB_LLM_TOKENS_PER_SECOND: float = float(os.environ.get("GLOSSGEN_STUB_TOKENS_PER_SECOND", "80"))
+    STUB_LLM_ERROR_RATE: float = float(os.environ.get("GLOSSGEN_STUB_ERROR_RATE", "0"))
+    STUB_LLM_SEED: int = int(os.environ.get("GLOSSGEN_STUB_SEED", "0"))
+    LLM_CASSETTE_PATH: str = os.environ.get("GLOSSGEN_LLM_CASSETTE", "")
+    LLM_CASSETTE_MODE: str = os.environ.get("GLOSSGEN_LLM_CASSETTE_MODE", "auto")
+
+    # Coalescing of identical concurrent profiling/generation work; set the
+    # directory to also coalesce across worker processes on one host
+    SINGLE_FLIGHT_DIR: str = os.environ.get("GLOSSGEN_SINGLE_FLIGHT_DIR", "")
+    SINGLE_FLIGHT_RESULT_TTL: float = 300.0  # age at which unread shared results are removed
+
+    # Background jobs (documentation, profiling, relationship analysis)
+    JOB_RUNNER_MAX_WORKERS: int = 4
+    JOB_RESULT_TTL: float = 3600.0
+    JOB_POLL_INTERVAL: float = 1.0
+    # Partition-parallel profiling: tables with at least PROFILE_PARTITION_MIN_ROWS
+    # estimated rows and an integer key (or SQLite rowid) are split into
+    # PROFILE_PARTITIONS key ranges, at most PROFILE_PARTITION_CONCURRENCY of
+    # them profiled at once per table
+    PROFILE_PARTITION_MIN_ROWS: int = 5000000
+    PROFILE_PARTITIONS: int = 16
+    PROFILE_PARTITION_CONCURRENCY: int = 4
+    PROFILE_SAMPLE_VALUES: int = 5
+
+    # Offline batch generation jobs (kept on disk so they survive restarts)
+    BATCH_JOBS_DIR: str = os.environ.get("GLOSSGEN_BATCH_DIR", "data/batch_jobs")
+
     # Database Settings
     SUPPORTED_DB_TYPES: List[str] = ["SQLite", "MySQL", "PostgreSQL", "SQL Server"]
     DEFAULT_PORTS: Dict[str, str] = {
@@ -51,6 +110,28 @@ class AppConfig:
         "SQL Server": "1433"
     }
     DEFAULT_SQLITE_PATH: str = "assets/adidas_webstore_shoe.db"
+    # Shared engines/extractors: session leases expire if not renewed by a
+    # rerun, unleased engines are disposed after the idle timeout (seconds)
+    RESOURCE_LEASE_TIMEOUT: float = 3600.0
+    RESOURCE_IDLE_TIMEOUT: float = 900.0
+    # Connection pools: one connection per background job plus the UI thread,
+    # overflow for bursts and partition-parallel profiling; statement timeouts
+    # are enforced by the server
+    DB_POOL_SIZE: int = JOB_RUNNER_MAX_WORKERS + 1
+    DB_MAX_OVERFLOW: int = JOB_RUNNER_MAX_WORKERS + PROFILE_PARTITION_CONCURRENCY
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_CONNECT_TIMEOUT: float = 10.0
+    DB_STATEMENT_TIMEOUT: float = float(os.environ.get("GLOSSGEN_STATEMENT_TIMEOUT", "600"))
+    DB_READ_ONLY: bool = os.environ.get("GLOSSGEN_DB_READ_ONLY", "").lower() in ("1", "true", "yes")
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    # Schema reflection: PostgreSQL and SQL Server reflect every schema that
+    # matches an include pattern (all if none) and no exclude pattern,
+    # e.g. GLOSSGEN_SCHEMA_EXCLUDE="staging_*,tmp"; one schema per worker
+    MULTI_SCHEMA_DIALECTS: List[str] = ["postgresql", "mssql"]
+    SCHEMA_INCLUDE: List[str] = [p.strip() for p in os.environ.get("GLOSSGEN_SCHEMA_INCLUDE", "").split(",") if p.strip()]
+    SCHEMA_EXCLUDE: List[str] = [p.strip() for p in os.environ.get("GLOSSGEN_SCHEMA_EXCLUDE", "").split(",") if p.strip()]
+    REFLECTION_MAX_WORKERS: int = DB_POOL_SIZE
     DEFAULT_HOST: str = "localhost"
     
     DEFAULT_MYSQL_HOST: str = os.environ.get("MYSQL_HOST", "")
@@ -60,14 +141,59 @@ class AppConfig:
     DEFAULT_MYSQL_PASSWORD: str = os.environ.get("MYSQL_PASSWORD", "")
 
     # File Export Settings
-    EXPORT_FORMATS: List[str] = ["csv", "json", "xlsx"]
+    EXPORT_FORMATS: List[str] = ["csv", "json", "jsonl", "xlsx"]
+    # Generated exports are cached on disk by content hash (default: system temp dir)
+    EXPORT_CACHE_DIR: str = os.environ.get("GLOSSGEN_EXPORT_DIR", "")
+    EXPORT_CACHE_MAX_FILES: int = 32
+    MARKDOWN_SECTION_CACHE_SIZE: int = 20000  # rendered table sections, shared by all sessions
+    # Saved projects (Parquet glossaries, relationships and descriptions)
+    PROJECTS_DIR: str = os.environ.get("GLOSSGEN_PROJECTS_DIR", "data/projects")
+    PROJECT_TABLES_PER_ROW_GROUP: int = 250
     TIMESTAMP_FORMAT: str = "%y%m%d%H%M"
     
+    # SQL query box: rows are fetched in pages from a streaming cursor
+    QUERY_PAGE_SIZE: int = 500
+    QUERY_MAX_ROWS: int = 10000
+    QUERY_MAX_BYTES: int = 50 * 1024 * 1024
+    QUERY_TIMEOUT: float = 60.0
+
+    # CSV import: files are streamed in chunks of CSV_CHUNK_ROWS rows, with
+    # column types inferred from the first CSV_SAMPLE_ROWS rows
+    CSV_CHUNK_ROWS: int = 50000
+    CSV_SAMPLE_ROWS: int = 10000
+    # Directory whose files may be imported or profiled by path instead of
+    # uploaded; reading server files is disabled while it is unset
+    SERVER_FILES_DIR: str = os.environ.get("GLOSSGEN_SERVER_FILES_DIR", "")
+
+    # Profiling CSV/Parquet files without a database: one streaming pass of
+    # PROFILE_CHUNK_ROWS rows at a time; distinct counts are exact up to
+    # PROFILE_EXACT_DISTINCT_LIMIT values per column, then HyperLogLog estimates
+    PROFILE_CHUNK_ROWS: int = 100000
+    PROFILE_EXACT_DISTINCT_LIMIT: int = 50000
+    PROFILE_HLL_PRECISION: int = 14
+    PROFILE_PREVIEW_ROWS: int = 100  # rows kept per file for previews and relationship matching
+
     # Table Preview Settings
     DEFAULT_PREVIEW_ROWS: int = 5
+    PREVIEW_CACHE_TTL: float = 300.0
+    PREVIEW_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    # Previews and samples fetch at most SAMPLE_VALUE_MAX_CHARS characters per
+    # text value (binaries and geometries are summarized), and a table's sample
+    # values are shrunk to SAMPLE_TABLE_MAX_BYTES, keeping at least
+    # SAMPLE_VALUE_MIN_CHARS per value
+    SAMPLE_VALUE_MAX_CHARS: int = 200
+    SAMPLE_VALUE_MIN_CHARS: int = 16
+    SAMPLE_TABLE_MAX_BYTES: int = 16 * 1024
+    # Recently viewed tables are profiled first in the background
+    RECENT_TABLES_LIMIT: int = 20
     
     # Relationship Analysis Settings
     MIN_CONFIDENCE_SCORE: float = 0.5
+    RELATIONSHIP_CACHE_SIZE: int = 20000  # table pairs, shared by all sessions
+    
+    # Glossary store: samples kept per column in session state
+    GLOSSARY_SAMPLE_VALUES: int = 5
+    GLOSSARY_SAMPLE_CHARS: int = 80
     
     @classmethod
     def get_db_port(cls, db_type: str) -> str:
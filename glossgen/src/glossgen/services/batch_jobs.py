@@ -0,0 +1,332 @@
+import json
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from glossgen.config.app_config import AppConfig
+from glossgen.utils.utils import parse_glossary_response
+
+GLOSSARY_PHASE = "glossary"
+DESCRIPTION_PHASE = "description"
+
+
+def _custom_id(phase: str, table: str) -> str:
+    return f"{phase}:{table}"
+
+
+def _split_custom_id(custom_id: str) -> List[str]:
+    return custom_id.split(":", 1)
+
+
+class BatchJob:
+    """
+    Directory-backed batch generation job for a whole database
+
+    Prompts are written to JSONL request files in the OpenAI batch format
+    (custom_id, method, url, body), one file per phase: column glossaries
+    first, then table descriptions built from the merged glossaries. Results
+    use the batch output format and are appended line by line, so a job can be
+    processed by the provider's batch API or by the local worker, survives
+    Streamlit restarts, and resumes by skipping requests that already have a
+    successful result.
+    """
+
+    def __init__(self, job_dir: str):
+        self.job_dir = job_dir
+        self._lock = threading.Lock()
+        with open(self._path('manifest.json'), encoding='utf-8') as manifest:
+            self.manifest = json.load(manifest)
+
+    @property
+    def job_id(self) -> str:
+        return self.manifest['job_id']
+
+    @property
+    def phase(self) -> str:
+        return self.manifest['phase']
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.job_dir, name)
+
+    def _save_manifest(self) -> None:
+        tmp_path = self._path('manifest.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as manifest:
+            json.dump(self.manifest, manifest, indent=2)
+        os.replace(tmp_path, self._path('manifest.json'))
+
+    @staticmethod
+    def _request_line(custom_id: str, model: str, prompt: str) -> Dict[str, Any]:
+        return {
+            'custom_id': custom_id,
+            'method': 'POST',
+            'url': '/v1/chat/completions',
+            'body': {
+                'model': model,
+                'temperature': 0.2,
+                'messages': [{'role': 'system', 'content': prompt}]
+            }
+        }
+
+    @classmethod
+    def create(
+        cls,
+        db_name: str,
+        schema_tables: Dict[str, pd.DataFrame],
+        glossary_chain: Any,
+        model: str,
+        root: str = AppConfig.BATCH_JOBS_DIR
+    ) -> "BatchJob":
+        """Write the glossary request file for every profiled table"""
+        job_id = f"{db_name or 'database'}_{time.strftime('%Y%m%d%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        job_dir = os.path.join(root, job_id)
+        os.makedirs(job_dir, exist_ok=True)
+
+        with open(os.path.join(job_dir, 'schema_tables.jsonl'), 'w', encoding='utf-8') as schema_file, \
+                open(os.path.join(job_dir, f'{GLOSSARY_PHASE}_requests.jsonl'), 'w', encoding='utf-8') as requests:
+            for table, schema_df in schema_tables.items():
+                schema_file.write(json.dumps({
+                    'table': table,
+                    'records': json.loads(schema_df.to_json(orient='records', default_handler=str))
+                }) + "\n")
+                requests.write(json.dumps(cls._request_line(
+                    _custom_id(GLOSSARY_PHASE, table), model, glossary_chain.format_prompt(schema_df)
+                )) + "\n")
+
+        manifest = {
+            'job_id': job_id,
+            'db_name': db_name,
+            'model': model,
+            'created_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'phase': GLOSSARY_PHASE,
+            'tables': list(schema_tables)
+        }
+        with open(os.path.join(job_dir, 'manifest.json'), 'w', encoding='utf-8') as manifest_file:
+            json.dump(manifest, manifest_file, indent=2)
+        return cls(job_dir)
+
+    @classmethod
+    def list_jobs(cls, db_name: Optional[str] = None, root: str = AppConfig.BATCH_JOBS_DIR) -> List["BatchJob"]:
+        """Return existing jobs, newest first, optionally for one database"""
+        if not os.path.isdir(root):
+            return []
+        jobs = []
+        for name in sorted(os.listdir(root), reverse=True):
+            if os.path.exists(os.path.join(root, name, 'manifest.json')):
+                job = cls(os.path.join(root, name))
+                if db_name is None or job.manifest.get('db_name') == db_name:
+                    jobs.append(job)
+        return jobs
+
+    def request_file(self, phase: Optional[str] = None) -> str:
+        return self._path(f"{phase or self.phase}_requests.jsonl")
+
+    def result_file(self, phase: Optional[str] = None) -> str:
+        return self._path(f"{phase or self.phase}_results.jsonl")
+
+    @staticmethod
+    def _read_jsonl(path: str) -> Iterable[Dict[str, Any]]:
+        if not os.path.exists(path):
+            return
+        with open(path, encoding='utf-8') as lines:
+            for line in lines:
+                if line.strip():
+                    yield json.loads(line)
+
+    @staticmethod
+    def _content(result: Dict[str, Any]) -> Optional[str]:
+        """Message content of a successful batch output line, else None"""
+        response = result.get('response') or {}
+        if result.get('error') or response.get('status_code') != 200:
+            return None
+        try:
+            return response['body']['choices'][0]['message']['content']
+        except (KeyError, IndexError, TypeError):
+            return None
+
+    def completed(self, phase: Optional[str] = None) -> Dict[str, str]:
+        """custom_id -> content of every successful result"""
+        completed = {}
+        for result in self._read_jsonl(self.result_file(phase)):
+            content = self._content(result)
+            if content is not None:
+                completed[result['custom_id']] = content
+        return completed
+
+    def pending_requests(self, phase: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Requests without a successful result yet"""
+        done = self.completed(phase)
+        return [request for request in self._read_jsonl(self.request_file(phase)) if request['custom_id'] not in done]
+
+    def progress(self, phase: Optional[str] = None) -> Dict[str, int]:
+        total = sum(1 for _ in self._read_jsonl(self.request_file(phase)))
+        return {'total': total, 'completed': len(self.completed(phase))}
+
+    def append_result(self, custom_id: str, content: Optional[str] = None, error: Optional[str] = None,
+                      phase: Optional[str] = None) -> None:
+        """Append one result line in the batch output format"""
+        line = {
+            'id': f"local_{uuid.uuid4().hex[:12]}",
+            'custom_id': custom_id,
+            'response': None if error else {
+                'status_code': 200,
+                'body': {'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': content}}]}
+            },
+            'error': {'message': error} if error else None
+        }
+        with self._lock:
+            with open(self.result_file(phase), 'a', encoding='utf-8') as results:
+                results.write(json.dumps(line) + "\n")
+                results.flush()
+
+    def import_results(self, lines: Iterable[str], phase: Optional[str] = None) -> int:
+        """Append a provider batch output file to this job's results"""
+        imported = 0
+        with self._lock:
+            with open(self.result_file(phase), 'a', encoding='utf-8') as results:
+                for line in lines:
+                    if isinstance(line, bytes):
+                        line = line.decode('utf-8')
+                    if line.strip() and 'custom_id' in json.loads(line):
+                        results.write(line.strip() + "\n")
+                        imported += 1
+        return imported
+
+    def run_local_worker(
+        self,
+        router: Any,
+        max_workers: int = AppConfig.GENERATION_MAX_WORKERS,
+        stop_event: Optional[threading.Event] = None
+    ) -> Dict[str, int]:
+        """
+        Process pending requests of the current phase through a GenerationRouter
+
+        Each result is appended as soon as it arrives, so an interrupted worker
+        loses at most the requests that were in flight.
+        """
+        phase = self.phase
+        counts = {'succeeded': 0, 'failed': 0}
+
+        def process(request: Dict[str, Any]) -> None:
+            if stop_event is not None and stop_event.is_set():
+                return
+            prompt = request['body']['messages'][0]['content']
+            try:
+                response = router.invoke(prompt)
+                self.append_result(request['custom_id'], content=response.content, phase=phase)
+                counts['succeeded'] += 1
+            except Exception as e:
+                self.append_result(request['custom_id'], error=str(e), phase=phase)
+                counts['failed'] += 1
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(process, self.pending_requests(phase)))
+        return counts
+
+    def load_schema_tables(self) -> Dict[str, pd.DataFrame]:
+        return {
+            entry['table']: pd.DataFrame(entry['records'])
+            for entry in self._read_jsonl(self._path('schema_tables.jsonl'))
+        }
+
+    def merge_glossaries(self, glossary_dicts: Dict[str, pd.DataFrame]) -> Dict[str, int]:
+        """
+        Merge completed glossary results into glossary_dicts in place
+
+        Returns:
+            Counts of merged tables and of columns the responses did not cover
+        """
+        schema_tables = None
+        merged_tables = 0
+        missing_columns = 0
+        for custom_id, content in self.completed(GLOSSARY_PHASE).items():
+            table = _split_custom_id(custom_id)[1]
+            glossary_df = glossary_dicts.get(table)
+            if not isinstance(glossary_df, pd.DataFrame) or glossary_df.empty:
+                if schema_tables is None:
+                    schema_tables = self.load_schema_tables()
+                if table not in schema_tables:
+                    continue
+                glossary_df = schema_tables[table]
+            if 'description' not in glossary_df.columns:
+                glossary_df['description'] = None
+
+            items, missing = parse_glossary_response(content, glossary_df['column_name'].tolist())
+            by_column = {item['column_name']: item['description'] for item in items}
+            glossary_df['description'] = glossary_df['column_name'].map(by_column).combine_first(
+                glossary_df['description']
+            )
+            glossary_dicts[table] = glossary_df
+            merged_tables += 1
+            missing_columns += len(missing)
+        return {'tables': merged_tables, 'missing_columns': missing_columns}
+
+    def prepare_descriptions(
+        self,
+        glossary_dicts: Dict[str, pd.DataFrame],
+        relationship_data: str,
+        description_chain: Any
+    ) -> int:
+        """Write description requests from the merged glossaries and switch phase"""
+        written = 0
+        with open(self.request_file(DESCRIPTION_PHASE), 'w', encoding='utf-8') as requests:
+            for table in self.manifest['tables']:
+                if table not in glossary_dicts:
+                    continue
+                requests.write(json.dumps(self._request_line(
+                    _custom_id(DESCRIPTION_PHASE, table),
+                    self.manifest['model'],
+                    description_chain.format_prompt(table, glossary_dicts[table], relationship_data)
+                )) + "\n")
+                written += 1
+        self.manifest['phase'] = DESCRIPTION_PHASE
+        self._save_manifest()
+        return written
+
+    def merge_descriptions(self, table_descriptions: Dict[str, str]) -> int:
+        """Merge completed description results into table_descriptions in place"""
+        completed = self.completed(DESCRIPTION_PHASE)
+        for custom_id, content in completed.items():
+            table_descriptions[_split_custom_id(custom_id)[1]] = content
+        if completed and not self.pending_requests(DESCRIPTION_PHASE):
+            self.manifest['phase'] = "done"
+            self._save_manifest()
+        return len(completed)
+
+
+# Local workers keep running across Streamlit reruns; at most one per job
+_workers: Dict[str, threading.Thread] = {}
+_stop_events: Dict[str, threading.Event] = {}
+_workers_lock = threading.Lock()
+
+
+def start_local_worker(job: BatchJob, router: Any) -> bool:
+    """Start a background worker for the job unless one is already running"""
+    with _workers_lock:
+        if job.job_id in _workers and _workers[job.job_id].is_alive():
+            return False
+        stop_event = threading.Event()
+        thread = threading.Thread(
+            target=job.run_local_worker,
+            kwargs={'router': router, 'max_workers': router.max_workers(), 'stop_event': stop_event},
+            daemon=True
+        )
+        _workers[job.job_id] = thread
+        _stop_events[job.job_id] = stop_event
+        thread.start()
+        return True
+
+
+def is_worker_running(job_id: str) -> bool:
+    with _workers_lock:
+        return job_id in _workers and _workers[job_id].is_alive()
+
+
+def stop_local_worker(job_id: str) -> None:
+    with _workers_lock:
+        if job_id in _stop_events:
+            _stop_events[job_id].set()
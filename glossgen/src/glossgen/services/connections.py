@@ -0,0 +1,193 @@
+import os
+import threading
+import weakref
+from typing import Any, Dict, Union
+from urllib.parse import quote
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, Engine, make_url
+
+from glossgen.config.app_config import AppConfig
+
+
+def sqlite_file_url(path: str, read_only: bool = False, immutable: bool = False) -> str:
+    """
+    URL of a SQLite file; read-only files are opened through a file: URI
+
+    mode=ro makes SQLite refuse writes, and immutable=1 additionally tells it
+    the file cannot change, so it skips locking and change detection
+    entirely (only safe for files no other process writes to).
+    """
+    if not read_only:
+        return f'sqlite:///{path}'
+    query = {'mode': 'ro', 'uri': 'true'}
+    if immutable:
+        query['immutable'] = '1'
+    url = URL.create('sqlite', database=f"file:{quote(os.path.abspath(path))}", query=query)
+    return url.render_as_string(hide_password=False)
+
+
+def statement_timeout_ms() -> int:
+    """Server-side statement timeout applied to every connection, 0 if disabled"""
+    return max(0, int(AppConfig.DB_STATEMENT_TIMEOUT * 1000))
+
+
+def _connect_args(dialect: str, read_only: bool) -> Dict[str, Any]:
+    timeout_ms = statement_timeout_ms()
+    connect_timeout = int(AppConfig.DB_CONNECT_TIMEOUT)
+    if dialect == 'postgresql':
+        settings = [f"-c statement_timeout={timeout_ms}"]
+        if read_only:
+            settings.append("-c default_transaction_read_only=on")
+        return {'connect_timeout': connect_timeout, 'options': " ".join(settings)}
+    if dialect == 'mysql':
+        # Session settings differ between MySQL and MariaDB, see _configure_mysql
+        return {'connect_timeout': connect_timeout}
+    if dialect == 'mssql':
+        # pymssql has no read-only application intent; timeout is per query, in
+        # whole seconds, and 0 means none, so shorter timeouts round up to 1
+        return {'login_timeout': connect_timeout, 'timeout': max(1, timeout_ms // 1000) if timeout_ms else 0}
+    return {}
+
+
+def mysql_statement_timeout(is_mariadb: bool, timeout_ms: int) -> str:
+    """
+    Statement limiting run time on a MySQL or MariaDB session
+
+    MAX_EXECUTION_TIME (MySQL, milliseconds) limits SELECT statements, which
+    is all profiling runs; MariaDB rejects it and has max_statement_time, in
+    seconds, instead.
+    """
+    if is_mariadb:
+        return f"SET SESSION max_statement_time = {timeout_ms / 1000:g}"
+    return f"SET SESSION MAX_EXECUTION_TIME = {int(timeout_ms)}"
+
+
+def engine_options(url: Union[str, URL], read_only: bool = False) -> Dict[str, Any]:
+    """
+    create_engine keyword arguments tuned for the URL's dialect
+
+    Server databases get a pool sized for the background jobs that profile
+    concurrently, pre-ping (so connections dropped by the server or a
+    firewall are replaced instead of failing a job), recycling, connect and
+    statement timeouts, and read-only transactions if requested. SQLite files
+    get the pool sizing only; in-memory databases keep SQLAlchemy's
+    single-connection pool.
+    """
+    url = make_url(url) if isinstance(url, str) else url
+    dialect = url.get_backend_name()
+    options: Dict[str, Any] = {'echo': False}
+    if dialect == 'sqlite':
+        if url.database and url.database != ':memory:':
+            options.update(pool_size=AppConfig.DB_POOL_SIZE, max_overflow=AppConfig.DB_MAX_OVERFLOW)
+        return options
+    options.update(
+        pool_size=AppConfig.DB_POOL_SIZE,
+        max_overflow=AppConfig.DB_MAX_OVERFLOW,
+        pool_timeout=AppConfig.DB_POOL_TIMEOUT,
+        pool_recycle=AppConfig.DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+        connect_args=_connect_args(dialect, read_only)
+    )
+    return options
+
+
+def _configure_sqlite(engine: Engine, read_only: bool) -> None:
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        # Memory-mapped reads avoid copying pages through SQLite's page cache
+        cursor.execute(f"PRAGMA mmap_size = {int(AppConfig.SQLITE_MMAP_SIZE)}")
+        if read_only:
+            cursor.execute("PRAGMA query_only = ON")
+        cursor.close()
+
+
+def _configure_mysql(engine: Engine, read_only: bool) -> None:
+    @event.listens_for(engine, "connect")
+    def set_session(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("SELECT VERSION()")
+            is_mariadb = 'mariadb' in str(cursor.fetchone()[0]).lower()
+            try:
+                cursor.execute(mysql_statement_timeout(is_mariadb, statement_timeout_ms()))
+            except Exception as e:
+                # Older servers have neither setting; queries then run unlimited
+                print(f"Could not set the statement timeout: {str(e)}")
+            if read_only:
+                cursor.execute("SET SESSION TRANSACTION READ ONLY")
+        finally:
+            cursor.close()
+
+
+class PoolMetrics:
+    """Counters of an engine's connection pool, collected from pool events"""
+
+    _lock = threading.Lock()
+    _engines: "weakref.WeakKeyDictionary[Engine, PoolMetrics]" = weakref.WeakKeyDictionary()
+
+    def __init__(self, read_only: bool):
+        self.read_only = read_only
+        self.connects = 0
+        self.checkouts = 0
+        self.invalidations = 0
+
+    @classmethod
+    def track(cls, engine: Engine, read_only: bool) -> None:
+        metrics = cls(read_only)
+        with cls._lock:
+            cls._engines[engine] = metrics
+
+        def count(name: str):
+            def listener(*args: Any) -> None:
+                with cls._lock:
+                    setattr(metrics, name, getattr(metrics, name) + 1)
+            return listener
+
+        event.listen(engine, "connect", count('connects'))
+        event.listen(engine, "checkout", count('checkouts'))
+        # Includes connections pre-ping found dead
+        event.listen(engine, "invalidate", count('invalidations'))
+
+    @classmethod
+    def get(cls, engine: Engine) -> "PoolMetrics":
+        with cls._lock:
+            return cls._engines.get(engine) or cls(False)
+
+
+def create_tuned_engine(url: Union[str, URL], read_only: bool = False) -> Engine:
+    """Create an engine with engine_options, SQLite pragmas or MySQL session settings, and pool metrics"""
+    engine = create_engine(url, **engine_options(url, read_only))
+    if engine.dialect.name == 'sqlite':
+        _configure_sqlite(engine, read_only)
+    elif engine.dialect.name == 'mysql':
+        _configure_mysql(engine, read_only)
+    PoolMetrics.track(engine, read_only)
+    return engine
+
+
+def pool_status(engine: Engine) -> Dict[str, Any]:
+    """Current pool occupancy and lifetime counters of an engine, for display"""
+    pool = engine.pool
+    metrics = PoolMetrics.get(engine)
+
+    def gauge(name: str) -> Any:
+        # SingletonThreadPool and NullPool do not report occupancy
+        method = getattr(pool, name, None)
+        return method() if callable(method) else None
+
+    overflow = gauge('overflow')
+
+    return {
+        'pool': type(pool).__name__,
+        'read_only': metrics.read_only,
+        'pool_size': gauge('size'),
+        'checked_out': gauge('checkedout'),
+        'idle': gauge('checkedin'),
+        # QueuePool reports overflow as negative while below pool_size
+        'overflow': max(0, overflow) if overflow is not None else None,
+        'connects': metrics.connects,
+        'checkouts': metrics.checkouts,
+        'invalidations': metrics.invalidations
+    }
@@ -0,0 +1,244 @@
+import io
+import os
+import re
+import uuid
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+from pandas.api import types as ptypes
+from sqlalchemy import inspect
+
+from glossgen.config.app_config import AppConfig
+from glossgen.services.job_runner import Job
+
+TABLE_RESULT = "table:"
+
+# Bound on bind parameters per INSERT statement (SQL Server allows 2100)
+MAX_INSERT_PARAMS = {'mssql': 2000, 'postgresql': 30000, 'mysql': 30000}
+
+CsvSource = Tuple[str, Union[str, Any]]  # (table name, path or binary file object)
+
+
+def table_name_for(file_name: str) -> str:
+    """A table name from a file name: the stem, reduced to letters, digits and underscores"""
+    stem = os.path.basename(file_name).split('.')[0]
+    name = re.sub(r'\W+', '_', stem).strip('_').lower() or "uploaded_data"
+    return f"t_{name}" if name[0].isdigit() else name
+
+
+def unique_table_names(file_names: List[str]) -> List[str]:
+    """One table name per file; repeated names get a numeric suffix"""
+    tables, used = [], set()
+    for file_name in file_names:
+        table = table_name_for(file_name)
+        while table in used:
+            table = f"{table}_{len(used)}"
+        used.add(table)
+        tables.append(table)
+    return tables
+
+
+def _size(source: Any) -> Optional[int]:
+    if isinstance(source, str):
+        return os.path.getsize(source)
+    size = getattr(source, 'size', None)
+    if size is None and hasattr(source, 'seek'):
+        position = source.tell()
+        size = source.seek(0, io.SEEK_END)
+        source.seek(position)
+    return size
+
+
+def infer_dtypes(source: Any, sample_rows: int = AppConfig.CSV_SAMPLE_ROWS) -> Dict[str, Any]:
+    """
+    Column dtypes for the whole file, inferred from its first sample_rows rows
+
+    Integers become nullable Int64 so missing values in later chunks do not
+    turn the column into floats halfway through the load, and anything not
+    numeric or boolean is read as text.
+    """
+    sample = pd.read_csv(source, nrows=sample_rows)
+    if not isinstance(source, str):
+        source.seek(0)
+    dtypes = {}
+    for column, dtype in sample.dtypes.items():
+        if ptypes.is_bool_dtype(dtype):
+            dtypes[column] = 'boolean'
+        elif ptypes.is_integer_dtype(dtype):
+            dtypes[column] = 'Int64'
+        elif ptypes.is_float_dtype(dtype):
+            dtypes[column] = 'float64'
+        else:
+            dtypes[column] = 'string'
+    return dtypes
+
+
+def _prepare_sqlite(conn: Any) -> Optional[Tuple[str, int]]:
+    """
+    Switch SQLite to WAL with relaxed syncing for the load
+
+    Returns the journal mode and synchronous setting to restore afterwards.
+    """
+    if conn.dialect.name != 'sqlite':
+        return None
+    settings = (
+        conn.exec_driver_sql("PRAGMA journal_mode").scalar(),
+        conn.exec_driver_sql("PRAGMA synchronous").scalar()
+    )
+    conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+    conn.exec_driver_sql("PRAGMA synchronous=OFF")
+    conn.commit()
+    return settings
+
+
+def _restore_sqlite(conn: Any, settings: Tuple[str, int]) -> None:
+    journal_mode, synchronous = settings
+    try:
+        conn.exec_driver_sql(f"PRAGMA synchronous={int(synchronous)}")
+        conn.exec_driver_sql(f"PRAGMA journal_mode={journal_mode}")
+        conn.commit()
+    except Exception as e:
+        print(f"Could not restore SQLite settings after the load: {str(e)}")
+
+
+def _insert_options(dialect: str, n_columns: int) -> Dict[str, Any]:
+    if dialect == 'sqlite':
+        # executemany of one prepared statement is the fastest path for sqlite3
+        return {'method': None, 'chunksize': None}
+    rows = max(1, MAX_INSERT_PARAMS.get(dialect, 30000) // max(1, n_columns))
+    return {'method': 'multi', 'chunksize': rows}
+
+
+def ingest_csv(
+    job: Job,
+    conn: Any,
+    table: str,
+    source: Any,
+    if_exists: str,
+    chunk_rows: int,
+    name: Optional[str] = None
+) -> int:
+    """
+    Load one CSV into table chunk by chunk on conn; returns the number of rows read
+
+    name is the table name shown in progress and errors, if table is a staging table.
+    """
+    name = name or table
+    dtypes = infer_dtypes(source)
+    options = _insert_options(conn.dialect.name, len(dtypes))
+    rows = 0
+    position = 0
+    reader = pd.read_csv(source, dtype=dtypes, chunksize=chunk_rows)
+    try:
+        for index, chunk in enumerate(reader):
+            job.check_cancelled()
+            chunk.to_sql(table, conn, if_exists=if_exists if index == 0 else 'append', index=False, **options)
+            rows += len(chunk)
+            job.set_current(f"{name}: {rows:,} rows")
+            if not isinstance(source, str) and hasattr(source, 'tell'):
+                job.advance(source.tell() - position)
+                position = source.tell()
+    except (ValueError, TypeError) as e:
+        raise ValueError(
+            f"Could not load {name} after {rows:,} rows: {str(e)}. "
+            f"Column types were inferred from the first {AppConfig.CSV_SAMPLE_ROWS:,} rows."
+        ) from e
+    finally:
+        reader.close()
+    return rows
+
+
+def _staging_table(index: int) -> str:
+    # Short enough for every dialect's identifier limit
+    return f"_glossgen_import_{uuid.uuid4().hex[:8]}_{index}"
+
+
+def _publish_staged(conn: Any, staged: List[Tuple[str, str]], if_exists: str) -> None:
+    """Move loaded staging tables to their target names in one transaction"""
+    preparer = conn.dialect.identifier_preparer
+    existing = set(inspect(conn).get_table_names())
+    conn.rollback()  # end the transaction reflection autobegan
+    with conn.begin():
+        if conn.dialect.name == 'sqlite':
+            # pysqlite runs DDL outside transactions unless one was begun explicitly
+            conn.exec_driver_sql("BEGIN")
+        for staging, table in staged:
+            staging_sql, table_sql = preparer.quote(staging), preparer.quote(table)
+            if if_exists == 'append' and table in existing:
+                columns = ", ".join(preparer.quote(column['name']) for column in inspect(conn).get_columns(staging))
+                conn.exec_driver_sql(f"INSERT INTO {table_sql} ({columns}) SELECT {columns} FROM {staging_sql}")
+                conn.exec_driver_sql(f"DROP TABLE {staging_sql}")
+                continue
+            if table in existing:
+                conn.exec_driver_sql(f"DROP TABLE {table_sql}")
+            if conn.dialect.name == 'mssql':
+                conn.exec_driver_sql(f"EXEC sp_rename '{staging}', '{table}'")
+            else:
+                conn.exec_driver_sql(f"ALTER TABLE {staging_sql} RENAME TO {table_sql}")
+
+
+def _drop_staged(conn: Any, staged: List[Tuple[str, str]]) -> None:
+    preparer = conn.dialect.identifier_preparer
+    try:
+        conn.rollback()
+        existing = set(inspect(conn).get_table_names())
+        conn.rollback()
+        with conn.begin():
+            for staging, _ in staged:
+                if staging in existing:
+                    conn.exec_driver_sql(f"DROP TABLE {preparer.quote(staging)}")
+    except Exception as e:
+        print(f"Could not remove staging tables of a failed import: {str(e)}")
+
+
+def run_csv_import_job(
+    job: Job,
+    engine: Any,
+    sources: List[CsvSource],
+    if_exists: str = 'replace',
+    chunk_rows: int = AppConfig.CSV_CHUNK_ROWS
+) -> Dict[str, int]:
+    """
+    Stream CSV files into the database, one table per file
+
+    Each file is read chunk_rows rows at a time with dtypes inferred from its
+    leading sample, so memory is bounded by the chunk size rather than the
+    file size. Files are loaded into staging tables first; only once all of
+    them loaded are the staging tables renamed to (or, for append, copied
+    into) their target tables in one transaction. A failure or cancellation
+    drops the staging tables and leaves existing tables untouched, also on
+    SQLite and MySQL, which commit DDL outside the load's transaction.
+    Progress is reported in bytes read.
+    """
+    sizes = [_size(source) or 0 for _, source in sources]
+    job.set_total(sum(sizes))
+    loaded = {}
+    staged: List[Tuple[str, str]] = []
+    with engine.connect() as conn:
+        if if_exists == 'fail':
+            existing = set(inspect(conn).get_table_names()) & {table for table, _ in sources}
+            if existing:
+                raise ValueError(f"Table(s) already exist: {', '.join(sorted(existing))}")
+        sqlite_settings = _prepare_sqlite(conn)
+        try:
+            done = 0
+            for index, ((table, source), size) in enumerate(zip(sources, sizes)):
+                staging = _staging_table(index)
+                staged.append((staging, table))
+                with conn.begin():
+                    loaded[table] = ingest_csv(job, conn, staging, source, 'replace', chunk_rows, name=table)
+                # Files read by path report progress per file
+                done += size
+                job.advance(done - job.completed)
+            job.check_cancelled()
+            _publish_staged(conn, staged, if_exists)
+            for table, rows in loaded.items():
+                job.add_result(f"{TABLE_RESULT}{table}", rows, advance=False)
+        except BaseException:
+            _drop_staged(conn, staged)
+            raise
+        finally:
+            if sqlite_settings is not None:
+                _restore_sqlite(conn, sqlite_settings)
+    job.set_current(None)
+    return loaded
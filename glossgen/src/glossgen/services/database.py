@@ -1,30 +1,49 @@
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import streamlit as st
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.exc import SQLAlchemyError
 
 from glossgen.state.session_state import SessionState
 from glossgen.config.app_config import AppConfig
-from glossgen.tools.sql import SchemaExtractor
+from glossgen.tools.sql import SchemaExtractor, preview_cache
+from glossgen.tools.file_profiler import FileSchemaExtractor, FileSource
+from glossgen.services.resource_cache import SharedResourceCache, normalize_connection_url
+from glossgen.services.connections import create_tuned_engine, sqlite_file_url
 
 class DatabaseService:
     """Service for handling database connections and operations"""
     
     def __init__(self):
         self.config = AppConfig()
-        self.engine: Optional[Engine] = None
-        self.schema_extractor: Optional[SchemaExtractor] = None
+        self.engine: Optional[Engine] = st.session_state.get('engine')
+        self.schema_extractor: Optional[SchemaExtractor] = st.session_state.get('extractor')
 
-    def connect(self, db_type: str, **connection_params) -> bool:
+    def connect(
+        self,
+        db_type: str,
+        read_only: bool = False,
+        include_schemas: Optional[List[str]] = None,
+        exclude_schemas: Optional[List[str]] = None,
+        **connection_params
+    ) -> bool:
         """
         Establish database connection based on type and parameters
         Returns True if connection successful, False otherwise
         """
+        self.release()
         try:
-            self.engine = self._create_engine(db_type, **connection_params)
-            self._test_connection()
-            self.schema_extractor = SchemaExtractor(self.engine)
+            url = self._build_url(db_type, read_only=read_only, **connection_params)
+            options = {
+                'read_only': read_only,
+                'include_schemas': include_schemas,
+                'exclude_schemas': exclude_schemas
+            }
+            key = self._resource_key(url, options)
+            self.engine, self.schema_extractor = SharedResourceCache.acquire(
+                key, SessionState.get_session_id(), lambda: self._create_resources(url, options)
+            )
+            SessionState.set_resource(key, url, options)
 
             SessionState.update_db_connection(True, self.engine, self.get_database_name())
             SessionState.set_extractor(self.schema_extractor)
@@ -34,12 +53,100 @@ class DatabaseService:
             st.error(f"Connection failed: {str(e)}")
             SessionState.update_db_connection(False)
             return False
-    
-    def _create_engine(self, db_type: str, **params) -> Engine:
+
+    def open_files(self, sources: List[FileSource], name: str) -> bool:
+        """
+        Profile CSV/Parquet files directly, one table per file, without a database
+        Returns True if the files could be read, False otherwise
+        """
+        self.release()
+        try:
+            self.schema_extractor = FileSchemaExtractor(sources, name)
+            self.engine = None
+            SessionState.update_db_connection(True, None, name)
+            SessionState.set_extractor(self.schema_extractor)
+            return True
+        except Exception as e:
+            st.error(f"Could not read files: {str(e)}")
+            SessionState.update_db_connection(False)
+            return False
+
+    def keep_alive(self) -> None:
+        """
+        Renew this session's lease on the shared engine
+
+        Called on every rerun. If the entry was evicted or invalidated in the
+        meantime, the session reconnects to a fresh one.
+        """
+        key, url, options = SessionState.get_resource()
+        if not key or SharedResourceCache.touch(key, SessionState.get_session_id()):
+            return
+        SharedResourceCache.release(key, SessionState.get_session_id())
+        try:
+            self.engine, self.schema_extractor = SharedResourceCache.acquire(
+                key, SessionState.get_session_id(), lambda: self._create_resources(url, options)
+            )
+            SessionState.set_extractor(self.schema_extractor)
+            st.session_state['engine'] = self.engine
+        except Exception as e:
+            st.error(f"Reconnection failed: {str(e)}")
+            SessionState.set_resource("", None)
+            SessionState.update_db_connection(False)
+
+    def refresh_schema(self) -> None:
+        """Drop the shared engine, reflected schema and this connection's cached previews and samples, then reconnect"""
+        key, _, _ = SessionState.get_resource()
+        if key:
+            extractor = st.session_state.get('extractor')
+            SharedResourceCache.invalidate(key)
+            if extractor is not None:
+                # Previews of other connections stay cached
+                preview_cache.clear((extractor.connection_id,))
+            if isinstance(extractor, SchemaExtractor):
+                # Sessions still holding the old extractor until their next rerun get fresh samples too
+                extractor.clear_cached_profiles()
+            self.keep_alive()
+
+    def release(self) -> None:
+        """Release this session's lease on the shared engine"""
+        key, _, _ = SessionState.get_resource()
+        if key:
+            SharedResourceCache.release(key, SessionState.get_session_id())
+            SessionState.set_resource("", None)
+
+    @staticmethod
+    def _resource_key(url: str, options: Dict[str, Any]) -> str:
+        """
+        Shared cache key; read-only and read-write connections, and different
+        schema filters, get separate engines and extractors
+        """
+        key = normalize_connection_url(url)
+        include, exclude = options.get('include_schemas'), options.get('exclude_schemas')
+        if include or exclude:
+            key = f"schemas[{','.join(include or ['*'])}-{','.join(exclude or [])}]:{key}"
+        return f"read-only:{key}" if options.get('read_only') else key
+
+    def _create_resources(self, url: str, options: Dict[str, Any]) -> Tuple[Engine, SchemaExtractor]:
+        """Create, test and reflect a new engine (runs once per cached URL)"""
+        self.engine = create_tuned_engine(url, options.get('read_only', False))
+        try:
+            self._test_connection()
+            return self.engine, SchemaExtractor(
+                self.engine, options.get('include_schemas'), options.get('exclude_schemas')
+            )
+        except Exception:
+            self.engine.dispose()
+            raise
+
+    def _create_engine(self, db_type: str, read_only: bool = False, **params) -> Engine:
         """Create SQLAlchemy engine based on database type"""
+        return create_tuned_engine(self._build_url(db_type, read_only=read_only, **params), read_only)
+
+    def _build_url(self, db_type: str, read_only: bool = False, **params) -> str:
+        """Build the SQLAlchemy connection URL based on database type"""
         if db_type == "SQLite":
             db_path = params.get('db_path', self.config.DEFAULT_SQLITE_PATH)
-            return create_engine(f'sqlite:///{db_path}', echo=False)
+            return sqlite_file_url(db_path, read_only, params.get('immutable', False))
         
         # Build connection string for other database types
         user = params.get('user', '')
@@ -49,17 +156,11 @@ class DatabaseService:
         database = params.get('database', '')
         
         if db_type == "PostgreSQL":
-            return create_engine(
-                f'postgresql://{user}:{password}@{host}:{port}/{database}'
-            )
+            return f'postgresql://{user}:{password}@{host}:{port}/{database}'
         elif db_type == "MySQL":
-            return create_engine(
-                f'mysql+pymysql://{user}:{password}@{host}:{port}/{database}'
-            )
+            return f'mysql+pymysql://{user}:{password}@{host}:{port}/{database}'
         elif db_type == "SQL Server":
-            return create_engine(
-                f'mssql+pymssql://{user}:{password}@{host}:{port}/{database}'
-            )
+            return f'mssql+pymssql://{user}:{password}@{host}:{port}/{database}'
         else:
             raise ValueError(f"Unsupported database type: {db_type}")
     
@@ -77,6 +178,8 @@ class DatabaseService:
             raise ValueError("No database engine available")
         
         df.to_sql(table_name, self.engine, if_exists=if_exists, index=False)
+        # The reflected schema is shared with other sessions, so re-reflect it
+        self.refresh_schema()
     
     def execute_query(self, query: str) -> Any:
         """Execute a SQL query and return results"""
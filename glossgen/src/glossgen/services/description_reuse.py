@@ -0,0 +1,243 @@
+import hashlib
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+TYPE_FAMILIES = [
+    ('boolean', ('BOOL', 'BIT')),
+    ('integer', ('INT', 'SERIAL')),
+    ('decimal', ('DEC', 'NUMERIC', 'FLOAT', 'DOUBLE', 'REAL', 'MONEY')),
+    ('datetime', ('TIMESTAMP', 'DATETIME')),
+    ('date', ('DATE',)),
+    ('time', ('TIME',)),
+    ('uuid', ('UUID', 'UNIQUEIDENTIFIER')),
+    ('json', ('JSON',)),
+    ('binary', ('BLOB', 'BINARY', 'BYTEA', 'IMAGE')),
+    ('text', ('CHAR', 'TEXT', 'STRING', 'CLOB')),
+]
+
+
+def normalize_column_name(column_name: str) -> str:
+    """Normalize a column name: camelCase to snake_case, lower case, single underscores"""
+    name = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', str(column_name).strip('"`[] '))
+    return re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_')
+
+
+def type_family(data_type: Any) -> str:
+    """Map a SQL type name (e.g. VARCHAR(255), NUMERIC(10, 2)) to a coarse family"""
+    type_name = str(data_type).upper()
+    for family, markers in TYPE_FAMILIES:
+        if any(marker in type_name for marker in markers):
+            return family
+    return 'other'
+
+
+def _value_shape(value: Any) -> str:
+    """Reduce a value to its shape: digit runs become 9, letter runs become a"""
+    shape = re.sub(r'[0-9]+', '9', str(value))
+    return re.sub(r'[^\W\d_]+', 'a', shape)[:32]
+
+
+def sample_signature(sample_data: Any) -> str:
+    """Short hash of the set of value shapes in a column's sample data"""
+    if not isinstance(sample_data, (list, tuple)) or not sample_data:
+        return ''
+    shapes = sorted({_value_shape(value) for value in sample_data if value is not None})
+    if not shapes:
+        return ''
+    return hashlib.sha1('|'.join(shapes).encode('utf-8')).hexdigest()[:12]
+
+
+def column_fingerprint(column_name: str, data_type: Any, sample_data: Any) -> str:
+    """Fingerprint a column by normalized name, type family and sample-value signature"""
+    return '|'.join([
+        normalize_column_name(column_name),
+        type_family(data_type),
+        sample_signature(sample_data)
+    ])
+
+
+def _has_description(description: Any) -> bool:
+    return isinstance(description, str) and description.strip() != ''
+
+
+class DescriptionReuseIndex:
+    """
+    Index of known column descriptions used to skip redundant LLM calls
+
+    Descriptions are found by exact column (including ones propagated along
+    relationship edges from the other side of a foreign key) or by column
+    fingerprint. Lookups never return a table's own descriptions, so
+    regenerating a table still asks the LLM for it.
+    """
+
+    def __init__(self):
+        self._by_fingerprint: Dict[str, Tuple[str, str]] = {}
+        self._by_column: Dict[Tuple[str, str], Tuple[str, str]] = {}
+
+    @classmethod
+    def from_glossaries(
+        cls,
+        glossary_dicts: Dict[str, pd.DataFrame],
+        relationship_matrix: Optional[pd.DataFrame] = None
+    ) -> "DescriptionReuseIndex":
+        """Build an index from the session's glossaries and relationship matrix"""
+        index = cls()
+        for table, glossary_df in glossary_dicts.items():
+            index.add_glossary(table, glossary_df)
+        if relationship_matrix is not None:
+            index.propagate_relationships(relationship_matrix)
+        return index
+
+    def add(self, table: str, column_name: str, fingerprint: str, description: Any) -> None:
+        """Record a description for a column"""
+        if not _has_description(description):
+            return
+        self._by_column[(table, column_name)] = (table, description)
+        self._by_fingerprint.setdefault(fingerprint, (table, description))
+
+    def add_glossary(self, table: str, glossary_df: pd.DataFrame) -> None:
+        """Record every described column of a glossary DataFrame"""
+        if not isinstance(glossary_df, pd.DataFrame) or 'description' not in glossary_df.columns:
+            return
+        for row in glossary_df.to_dict(orient='records'):
+            self.add(
+                table,
+                row['column_name'],
+                column_fingerprint(row['column_name'], row.get('data_type', ''), row.get('sample_data')),
+                row.get('description')
+            )
+
+    def propagate_relationships(self, relationship_matrix: pd.DataFrame) -> None:
+        """Copy descriptions across relationship edges to undescribed columns"""
+        if relationship_matrix is None or relationship_matrix.empty:
+            return
+        edges = relationship_matrix[['table1', 'column1', 'table2', 'column2']].dropna()
+        for table1, column1, table2, column2 in edges.itertuples(index=False):
+            left = self._by_column.get((table1, column1))
+            right = self._by_column.get((table2, column2))
+            if left and not right:
+                self._by_column[(table2, column2)] = left
+            elif right and not left:
+                self._by_column[(table1, column1)] = right
+
+    def lookup(self, table: str, column_name: str, fingerprint: str) -> Optional[str]:
+        """Return a reusable description from another table, if any"""
+        for entry in (self._by_column.get((table, column_name)), self._by_fingerprint.get(fingerprint)):
+            if entry and entry[0] != table:
+                return entry[1]
+        return None
+
+    def plan(self, schema_tables: Dict[str, pd.DataFrame]) -> "ReusePlan":
+        """
+        Decide which columns need the LLM for a set of profiled tables
+
+        Columns with a known description are reused. Among the remaining ones
+        each fingerprint is requested only once per run, from the first table
+        it appears in; the other occurrences are filled in after generation.
+        """
+        plan = ReusePlan()
+        claimed: Dict[str, str] = {}
+        for table, schema_df in schema_tables.items():
+            novel_rows = []
+            for position, row in enumerate(schema_df.to_dict(orient='records')):
+                column_name = row['column_name']
+                fingerprint = column_fingerprint(column_name, row.get('data_type', ''), row.get('sample_data'))
+                plan.total_columns += 1
+
+                description = self.lookup(table, column_name, fingerprint)
+                if description is not None:
+                    plan.reused.setdefault(table, {})[column_name] = description
+                elif fingerprint in claimed and claimed[fingerprint] != table:
+                    plan.deferred.setdefault(table, {})[column_name] = fingerprint
+                else:
+                    claimed.setdefault(fingerprint, table)
+                    plan.fingerprints[(table, column_name)] = fingerprint
+                    novel_rows.append(position)
+
+            if novel_rows:
+                plan.requests[table] = schema_df.iloc[novel_rows].reset_index(drop=True)
+        return plan
+
+
+class ReusePlan:
+    """Outcome of DescriptionReuseIndex.plan for one generation run"""
+
+    def __init__(self):
+        self.requests: Dict[str, pd.DataFrame] = {}
+        self.reused: Dict[str, Dict[str, str]] = {}
+        self.deferred: Dict[str, Dict[str, str]] = {}
+        self.fingerprints: Dict[Tuple[str, str], str] = {}
+        self.total_columns = 0
+        self._generated: Dict[str, str] = {}
+
+    def record_generated(self, table: str, descriptions: Iterable[Dict[str, Any]]) -> None:
+        """Remember LLM descriptions so deferred duplicates can use them"""
+        for item in descriptions:
+            fingerprint = self.fingerprints.get((table, item.get('column_name')))
+            if fingerprint and _has_description(item.get('description')):
+                self._generated.setdefault(fingerprint, item['description'])
+
+    def take_unresolved(self, schema_tables: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+        """
+        Requests for deferred columns whose claiming table produced no description
+
+        Called once the first round of generation finished: each such column is
+        requested from its own table instead (once per fingerprint again), so
+        it no longer depends on the table that failed or left it out.
+        """
+        requests: Dict[str, pd.DataFrame] = {}
+        claimed: Dict[str, str] = {}
+        for table, columns in self.deferred.items():
+            novel = []
+            for column_name, fingerprint in list(columns.items()):
+                if fingerprint in self._generated or claimed.setdefault(fingerprint, table) != table:
+                    continue
+                del columns[column_name]
+                self.fingerprints[(table, column_name)] = fingerprint
+                novel.append(column_name)
+            if novel:
+                schema_df = schema_tables[table]
+                requests[table] = schema_df[schema_df['column_name'].isin(novel)].reset_index(drop=True)
+                self.requests[table] = pd.concat(
+                    [self.requests[table], requests[table]], ignore_index=True
+                ) if table in self.requests else requests[table]
+        return requests
+
+    def unresolved_tables(self) -> List[str]:
+        """Tables with deferred columns that still have no description"""
+        return sorted(
+            table for table, columns in self.deferred.items()
+            if any(fingerprint not in self._generated for fingerprint in columns.values())
+        )
+
+    def descriptions_for(self, table: str) -> List[Dict[str, str]]:
+        """Reused and deferred descriptions for a table as column_name/description records"""
+        records = [
+            {'column_name': column_name, 'description': description}
+            for column_name, description in self.reused.get(table, {}).items()
+        ]
+        for column_name, fingerprint in self.deferred.get(table, {}).items():
+            if fingerprint in self._generated:
+                records.append({'column_name': column_name, 'description': self._generated[fingerprint]})
+        return records
+
+    @property
+    def reused_columns(self) -> int:
+        deferred = sum(
+            1 for columns in self.deferred.values()
+            for fingerprint in columns.values() if fingerprint in self._generated
+        )
+        return sum(len(columns) for columns in self.reused.values()) + deferred
+
+    @property
+    def requested_columns(self) -> int:
+        return sum(len(df) for df in self.requests.values())
+
+    @property
+    def reuse_rate(self) -> float:
+        """Share of columns (0-100) that did not need their own LLM request"""
+        if not self.total_columns:
+            return 0.0
+        return self.reused_columns / self.total_columns * 100
@@ -0,0 +1,251 @@
+import threading
+from typing import Any, Dict, List, Optional, Set
+
+import pandas as pd
+
+from glossgen.chains.glossary_chain import GlossaryChain, TableDescriptionChain
+from glossgen.services.description_reuse import DescriptionReuseIndex
+from glossgen.services.job_runner import Job
+from glossgen.services.single_flight import profile_table, generate_glossary, generate_description
+
+GLOSSARY_RESULT = "glossary:"
+DESCRIPTION_RESULT = "description:"
+
+
+def merge_descriptions(glossary_df: Any, schema_df: pd.DataFrame, descriptions: list) -> pd.DataFrame:
+    """Merge column_name/description records into a table's glossary"""
+    if not isinstance(glossary_df, pd.DataFrame) or glossary_df.empty:
+        glossary_df = schema_df.copy()
+    else:
+        glossary_df = glossary_df.copy()
+    if 'description' not in glossary_df.columns:
+        glossary_df['description'] = None
+
+    by_column = {item['column_name']: item['description'] for item in descriptions}
+    glossary_df['description'] = glossary_df['column_name'].map(by_column).combine_first(
+        glossary_df['description']
+    )
+    return glossary_df
+
+
+def prioritize_tables(extractor: Any, tables: List[str], recent_tables: List[str] = ()) -> List[str]:
+    """
+    Order tables for background profiling
+
+    Recently viewed tables come first (most recent first), then the rest from
+    the smallest estimated row count up; tables without statistics go last,
+    narrowest first.
+    """
+    recent = [table for table in recent_tables if table in tables]
+    rest = [table for table in tables if table not in recent]
+    estimates = extractor.estimate_row_counts()
+    rest.sort(key=lambda table: (
+        table not in estimates,
+        estimates.get(table, 0),
+        len(extractor.schema_info.get(table, {}).get('columns', []))
+    ))
+    return recent + rest
+
+
+class ProfilingQueue:
+    """
+    Tables waiting for background profiling, shared by the UI and the job
+
+    The UI moves tables the user opens to the front and marks tables it
+    profiled on the main thread as done; the job takes the next table on
+    every step, so both take effect while it runs. Tables moved to the front
+    go before the job's own order, most recently moved first.
+    """
+
+    def __init__(self, tables: List[str], recent_tables: List[str] = ()):
+        self._lock = threading.Lock()
+        self._order = list(tables)
+        self._urgent = [table for table in recent_tables if table in tables]
+        self._done: Set[str] = set()
+
+    def set_order(self, tables: List[str]) -> None:
+        with self._lock:
+            self._order = list(tables)
+
+    def prioritize(self, table: str) -> None:
+        with self._lock:
+            if table in self._order and table not in self._done:
+                self._urgent = [table] + [name for name in self._urgent if name != table]
+
+    def mark_done(self, table: str) -> None:
+        with self._lock:
+            self._done.add(table)
+
+    def is_done(self, table: str) -> bool:
+        with self._lock:
+            return table in self._done
+
+    def take(self) -> Optional[str]:
+        """The next table to profile, or None once every table was taken"""
+        with self._lock:
+            for table in self._urgent + self._order:
+                if table not in self._done:
+                    self._done.add(table)
+                    return table
+            return None
+
+
+def run_profiling_job(job: Job, extractor: Any, queue: ProfilingQueue, tables: List[str]) -> None:
+    """
+    Profile tables in priority order, publishing each schema table as a partial result
+
+    The order is recomputed as the queue changes: tables the user opens move
+    to the front, and tables already profiled elsewhere are skipped.
+    """
+    job.set_total(len(tables))
+    queue.set_order(prioritize_tables(extractor, tables))
+    while True:
+        job.check_cancelled()
+        table = queue.take()
+        if table is None:
+            break
+        job.set_current(table)
+        try:
+            job.add_result(table, profile_table(extractor, table))
+        except Exception as e:
+            job.warn(f"Could not profile {table}: {str(e)}")
+            job.advance()
+    # Tables the UI profiled itself
+    job.advance(max(0, job.total - job.completed))
+    job.set_current(None)
+
+
+def _generate_glossaries(
+    job: Job,
+    router: Any,
+    glossary_chain: GlossaryChain,
+    extractor: Any,
+    reuse_plan: Any,
+    requests: Dict[str, pd.DataFrame],
+    failed_tables: List[str],
+    advance: bool = True
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Generate descriptions for the requested columns of each table, recording them in reuse_plan"""
+    def generate(table):
+        job.check_cancelled()
+        return generate_glossary(glossary_chain, extractor, table, requests[table])
+
+    generated = {}
+    for table, response, error in router.map(generate, list(requests)):
+        if advance:
+            job.advance()
+        try:
+            if error:
+                raise error
+            if isinstance(response, dict) and 'error' in response:
+                raise ValueError("Could not parse the AI response")
+            df_res = pd.DataFrame(response)[['column_name', 'description']]
+        except Exception as e:
+            # One throttled or failed table must not abort the whole run
+            if not job.cancelled:
+                failed_tables.append(table)
+                job.warn(f"Skipped glossary for {table}: {str(e)}")
+            continue
+        generated[table] = df_res.to_dict(orient='records')
+        reuse_plan.record_generated(table, generated[table])
+    job.check_cancelled()
+    return generated
+
+
+def run_documentation_job(
+    job: Job,
+    router: Any,
+    extractor: Any,
+    tables: List[str],
+    glossary_dicts: Dict[str, pd.DataFrame],
+    relationship_matrix: pd.DataFrame
+) -> Dict[str, Any]:
+    """
+    Profile every table and generate glossaries and table descriptions
+
+    Runs in the job runner, so everything session-specific is passed in: the
+    router resolved on the main thread and snapshots of the session's
+    glossaries and relationships. Each finished glossary and description is
+    published as a partial result ("glossary:<table>", "description:<table>")
+    so the UI can apply them while the job is still running.
+    """
+    job.set_total(len(tables) * 3)
+    failed_tables = []
+    # Targets that failed over show up as job warnings
+    router.on_failover = job.warn
+
+    def checked(fn):
+        def run(table):
+            job.check_cancelled()
+            return fn(table)
+        return run
+
+    # Profiling runs against the database rather than the LLM pool, so it stays sequential
+    schema_tables = {}
+    for table in tables:
+        job.check_cancelled()
+        try:
+            schema_tables[table] = profile_table(extractor, table)
+        except Exception as e:
+            failed_tables.append(table)
+            job.warn(f"Skipped glossary for {table}: {str(e)}")
+        job.advance()
+
+    # Reuse known descriptions and only send novel columns to the AI
+    reuse_plan = DescriptionReuseIndex.from_glossaries(glossary_dicts, relationship_matrix).plan(schema_tables)
+    job.advance(len(tables) - len(reuse_plan.requests))
+
+    # Get column descriptions using GlossaryChain, spread over the router's targets
+    glossary_chain = GlossaryChain(router=router)
+    generated = _generate_glossaries(job, router, glossary_chain, extractor, reuse_plan, reuse_plan.requests,
+                                     failed_tables)
+
+    # Duplicates deferred to a table that failed or left them out are requested from their own table
+    retry_requests = reuse_plan.take_unresolved(schema_tables)
+    for table, items in _generate_glossaries(job, router, glossary_chain, extractor, reuse_plan, retry_requests,
+                                             failed_tables, advance=False).items():
+        generated[table] = generated.get(table, []) + items
+    for table in reuse_plan.unresolved_tables():
+        failed_tables.append(table)
+        job.warn(f"Some columns of {table} got no description")
+
+    # Merge generated and reused descriptions into the glossaries
+    merged = {}
+    for table, schema_df in schema_tables.items():
+        merged[table] = merge_descriptions(
+            glossary_dicts.get(table),
+            schema_df,
+            generated.get(table, []) + reuse_plan.descriptions_for(table)
+        )
+        job.add_result(GLOSSARY_RESULT + table, merged[table], advance=False)
+
+    # Generate descriptions for all tables
+    job.advance(len(tables) - len(merged))
+    description_chain = TableDescriptionChain(router=router)
+    relationship_json = relationship_matrix.to_json()
+    for table, description, error in router.map(
+        checked(lambda table: generate_description(
+            description_chain,
+            extractor,
+            table,
+            merged[table],
+            relationship_json
+        )),
+        [table for table in tables if table in merged]
+    ):
+        if error:
+            if not job.cancelled:
+                failed_tables.append(table)
+                job.warn(f"Skipped description for {table}: {str(error)}")
+            job.advance()
+            continue
+        job.add_result(DESCRIPTION_RESULT + table, description)
+    job.check_cancelled()
+
+    return {
+        'failed_tables': sorted(set(failed_tables)),
+        'reused_columns': reuse_plan.reused_columns,
+        'total_columns': reuse_plan.total_columns,
+        'requested_columns': reuse_plan.requested_columns,
+        'reuse_rate': reuse_plan.reuse_rate
+    }
@@ -0,0 +1,224 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+import xlsxwriter
+
+from glossgen.config.app_config import AppConfig
+from glossgen.services.single_flight import content_fingerprint
+from glossgen.state.glossary_store import GlossaryStore
+
+
+class ExportCache:
+    """
+    Process-wide directory of generated export files keyed by content hash
+
+    Exports are written chunk by chunk straight to disk, so building one never
+    holds the whole document in memory, and a download of unchanged glossaries
+    or documentation is served from the existing file. The oldest files are
+    removed once there are more than EXPORT_CACHE_MAX_FILES.
+    """
+
+    _lock = threading.Lock()
+    _building: Dict[str, threading.Lock] = {}
+
+    @staticmethod
+    def _directory() -> str:
+        directory = AppConfig.EXPORT_CACHE_DIR or os.path.join(tempfile.gettempdir(), "glossgen_exports")
+        os.makedirs(directory, exist_ok=True)
+        return directory
+
+    @classmethod
+    def path(cls, key: str, suffix: str) -> str:
+        return os.path.join(cls._directory(), f"{key}{suffix}")
+
+    @classmethod
+    def lookup(cls, key: str, suffix: str) -> Optional[str]:
+        """Path of an already generated export, or None"""
+        path = cls.path(key, suffix)
+        return path if os.path.exists(path) else None
+
+    @classmethod
+    def get_or_build(cls, key: str, suffix: str, write: Callable[[BinaryIO], None]) -> str:
+        """Path of the export for key, calling write(file) to generate it if needed"""
+        with cls._lock:
+            building = cls._building.setdefault(key + suffix, threading.Lock())
+        with building:
+            path = cls.lookup(key, suffix)
+            if path is not None:
+                return path
+            path = cls.path(key, suffix)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            try:
+                with open(tmp_path, 'wb') as export_file:
+                    write(export_file)
+                os.replace(tmp_path, path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        cls._evict()
+        return path
+
+    @classmethod
+    def _evict(cls) -> None:
+        directory = cls._directory()
+        with cls._lock:
+            files = [
+                os.path.join(directory, name) for name in os.listdir(directory)
+                if not name.endswith('.tmp')
+            ]
+            files.sort(key=os.path.getmtime)
+            for path in files[:max(0, len(files) - AppConfig.EXPORT_CACHE_MAX_FILES)]:
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    print(f"Could not remove cached export {path}: {str(e)}")
+
+
+def write_chunks(chunks: Iterable[str]) -> Callable[[BinaryIO], None]:
+    """File writer for a text exporter, encoding and writing one chunk at a time"""
+    def write(export_file: BinaryIO) -> None:
+        for chunk in chunks:
+            export_file.write(chunk.encode('utf-8'))
+    return write
+
+
+def _glossary_header(glossaries: GlossaryStore, tables: List[str]) -> List[str]:
+    header = []
+    for table in tables:
+        header += [column for column in glossaries.columns(table) if column not in header]
+    return header
+
+
+def iter_glossary_csv(glossaries: GlossaryStore, tables: List[str]) -> Iterator[str]:
+    """All glossaries as one CSV with a table_name column, one table per chunk"""
+    header = _glossary_header(glossaries, tables)
+    yield pd.DataFrame(columns=header + ['table_name']).to_csv(index=False)
+    for table in tables:
+        df = glossaries[table].reindex(columns=header)
+        df['table_name'] = table
+        yield df.to_csv(index=False, header=False)
+
+
+def _json_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Records of a glossary with missing values as None, since NaN is not valid JSON"""
+    return df.astype(object).where(df.notna(), None).to_dict(orient='records')
+
+
+def iter_glossary_json(glossaries: GlossaryStore, tables: List[str]) -> Iterator[str]:
+    """All glossaries as a JSON object of table name to records, one table per chunk"""
+    yield "{"
+    for index, table in enumerate(tables):
+        records = json.dumps(_json_records(glossaries[table]), indent=2, default=str)
+        separator = "," if index else ""
+        yield f"{separator}\n  {json.dumps(table)}: " + records.replace("\n", "\n  ")
+    yield "\n}\n"
+
+
+def iter_glossary_jsonl(glossaries: GlossaryStore, tables: List[str]) -> Iterator[str]:
+    """One JSON record per glossary column, with a table_name field, one table per chunk"""
+    for table in tables:
+        df = glossaries[table]
+        df['table_name'] = table
+        yield "".join(
+            json.dumps(record, default=str) + "\n" for record in _json_records(df)
+        )
+
+
+EXCEL_SHEET_NAME_LIMIT = 31
+EXCEL_INVALID_SHEET_CHARS = re.compile(r'[\[\]:*?/\\]')
+EXCEL_INDEX_SHEET = "Index"
+
+
+def excel_sheet_names(tables: List[str]) -> Dict[str, str]:
+    """
+    Unique, valid Excel sheet names for tables
+
+    Characters Excel rejects are replaced and names longer than 31 characters
+    (or colliding, case-insensitively, with an earlier one) are cut and given a
+    short hash of the full table name, so every table keeps a stable sheet.
+    """
+    used = {EXCEL_INDEX_SHEET.lower()}
+    names = {}
+    for table in tables:
+        name = EXCEL_INVALID_SHEET_CHARS.sub('_', str(table)).strip("'") or "table"
+        if len(name) > EXCEL_SHEET_NAME_LIMIT or name.lower() in used:
+            digest = hashlib.sha1(str(table).encode('utf-8')).hexdigest()[:8]
+            name = f"{name[:EXCEL_SHEET_NAME_LIMIT - len(digest) - 1]}~{digest}"
+        names[table] = name
+        used.add(name.lower())
+    return names
+
+
+def _excel_value(value: Any) -> Any:
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+    if isinstance(value, (list, tuple)):
+        return str(list(value))
+    if isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def write_glossary_excel(glossaries: GlossaryStore, tables: List[str]) -> Callable[[BinaryIO], None]:
+    """
+    File writer for an Excel workbook with an index sheet and one sheet per table
+
+    Uses xlsxwriter's constant_memory mode, which flushes each row to a temp
+    file as soon as the next one starts, and writes row by row from one
+    table's DataFrame at a time, so memory stays flat however many tables
+    there are.
+    """
+    def write(export_file: BinaryIO) -> None:
+        sheet_names = excel_sheet_names(tables)
+        workbook = xlsxwriter.Workbook(export_file, {'constant_memory': True})
+        header = workbook.add_format({'bold': True})
+
+        index = workbook.add_worksheet(EXCEL_INDEX_SHEET)
+        index.write_row(0, 0, ["Table", "Sheet", "Columns"], header)
+        # Rows must be written in order in constant_memory mode
+        for row, table in enumerate(tables, start=1):
+            index.write_string(row, 0, str(table))
+            quoted = sheet_names[table].replace("'", "''")
+            index.write_url(row, 1, f"internal:'{quoted}'!A1", string=sheet_names[table])
+            index.write_number(row, 2, len(glossaries.compact(table)))
+
+        for table in tables:
+            sheet = workbook.add_worksheet(sheet_names[table])
+            df = glossaries[table]
+            sheet.write_row(0, 0, [str(column) for column in df.columns], header)
+            for row, values in enumerate(df.itertuples(index=False, name=None), start=1):
+                sheet.write_row(row, 0, [_excel_value(value) for value in values])
+            # xlsxwriter keeps each sheet's row file open until the workbook is
+            # closed; close it now (it is reopened when the file is assembled)
+            # so large schemas do not run out of file descriptors
+            close_rows = getattr(sheet, '_opt_close', None)
+            if close_rows is not None:
+                close_rows()
+        workbook.close()
+    return write
+
+
+# format: (file suffix, mime type, writer factory)
+GLOSSARY_EXPORTERS: Dict[str, Any] = {
+    "csv": (".csv", "text/csv", lambda g, t: write_chunks(iter_glossary_csv(g, t))),
+    "json": (".json", "application/json", lambda g, t: write_chunks(iter_glossary_json(g, t))),
+    "jsonl": (".jsonl", "application/jsonl", lambda g, t: write_chunks(iter_glossary_jsonl(g, t))),
+    "xlsx": (
+        ".xlsx",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        write_glossary_excel
+    ),
+}
+
+
+def glossary_export_key(file_format: str, glossaries: GlossaryStore, tables: List[str]) -> str:
+    return content_fingerprint("glossary", file_format, glossaries.fingerprint(tables))
@@ -0,0 +1,205 @@
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from glossgen.config.app_config import AppConfig
+
+
+def prompt_to_text(prompt: Any) -> str:
+    """Render a LangChain prompt value, message list or string as plain text"""
+    if hasattr(prompt, 'to_string'):
+        return prompt.to_string()
+    if isinstance(prompt, list):
+        return "\n".join(str(getattr(message, 'content', message)) for message in prompt)
+    return str(prompt)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token)"""
+    return max(1, len(text) // 4)
+
+
+class FakeResponse:
+    """Minimal stand-in for a LangChain AIMessage"""
+
+    def __init__(self, content: str, prompt_tokens: int = 0, completion_tokens: int = 0):
+        self.content = content
+        self.usage_metadata = {
+            'input_tokens': prompt_tokens,
+            'output_tokens': completion_tokens,
+            'total_tokens': prompt_tokens + completion_tokens
+        }
+
+
+class FakeLLMError(Exception):
+    """Injected error that looks like an HTTP error from a provider SDK"""
+
+    def __init__(self, status_code: int, retry_after: Optional[float] = None):
+        super().__init__(f"Injected error {status_code}")
+        self.status_code = status_code
+        headers = {'retry-after': f"{retry_after:g}"} if retry_after is not None else {}
+        self.response = type('FakeHTTPResponse', (), {'status_code': status_code, 'headers': headers})()
+
+
+class FakeChatModel:
+    """
+    Deterministic local LLM for development and benchmarks
+
+    Glossary prompts get a JSON description for every column named in the
+    schema section, other prompts get fixed prose. Each call sleeps for a
+    log-normal "time to first token" plus output tokens / tokens_per_second,
+    and fails with a 429 or 503 at error_rate. Latency and injected errors
+    follow a fixed seed, so runs are reproducible; pass seed=None to vary them.
+    """
+
+    def __init__(
+        self,
+        model: str = "stub-model",
+        latency_mean: float = AppConfig.STUB_LLM_LATENCY_MEAN,
+        latency_sigma: float = AppConfig.STUB_LLM_LATENCY_SIGMA,
+        tokens_per_second: float = AppConfig.STUB_LLM_TOKENS_PER_SECOND,
+        error_rate: float = AppConfig.STUB_LLM_ERROR_RATE,
+        seed: Optional[int] = AppConfig.STUB_LLM_SEED
+    ):
+        self.model_name = model
+        self.latency_mean = latency_mean
+        self.latency_sigma = latency_sigma
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.stats = {'requests': 0, 'errors': 0, 'prompt_tokens': 0, 'completion_tokens': 0}
+        self._lock = threading.Lock()
+
+    def _latency(self) -> float:
+        if self.latency_mean <= 0:
+            return 0.0
+        # Log-normal with the configured mean
+        mu = math.log(self.latency_mean) - self.latency_sigma ** 2 / 2
+        with self._lock:
+            return self.random.lognormvariate(mu, self.latency_sigma)
+
+    @staticmethod
+    def _schema_columns(schema_section: str) -> List[str]:
+        """Column names in the prompt's schema data: JSON records or a DataFrame printout"""
+        columns = re.findall(r'"column_name"\s*:\s*"([^"]+)"', schema_section)
+        if not columns:
+            # A printed DataFrame: a header line starting with column_name, then "<index> <name> ..." rows
+            lines = iter(schema_section.splitlines())
+            for line in lines:
+                if line.split()[:1] == ['column_name']:
+                    break
+            for line in lines:
+                match = re.match(r'\s*\d+\s+(\S+)', line)
+                if match:
+                    columns.append(match.group(1))
+                elif not line.strip().startswith('..'):
+                    # Rows pandas left out are shown as "..."; anything else ends the table
+                    break
+        return list(dict.fromkeys(columns))
+
+    @classmethod
+    def _respond(cls, text: str) -> str:
+        if "data glossary table" in text:
+            schema_section = text.split("## Database Information:")[-1]
+            columns = cls._schema_columns(schema_section)
+            return json.dumps([
+                {
+                    'column_name': column,
+                    'description': f"Synthetic description of the {column} column."
+                }
+                for column in columns
+            ], indent=2)
+
+        match = re.search(r"Table Name:\s*(\S+)", text)
+        table = match.group(1) if match else "this table"
+        return (
+            f"The {table} table stores synthetic records generated for testing. "
+            f"Its columns and relationships are described in the glossary."
+        )
+
+    def invoke(self, prompt: Any) -> FakeResponse:
+        text = prompt_to_text(prompt)
+        with self._lock:
+            self.stats['requests'] += 1
+            roll = self.random.random()
+        if roll < self.error_rate:
+            with self._lock:
+                self.stats['errors'] += 1
+            status_code = 429 if roll < self.error_rate / 2 else 503
+            raise FakeLLMError(status_code, retry_after=0.1 if status_code == 429 else None)
+
+        content = self._respond(text)
+        prompt_tokens = estimate_tokens(text)
+        completion_tokens = estimate_tokens(content)
+        delay = self._latency()
+        if self.tokens_per_second > 0:
+            delay += completion_tokens / self.tokens_per_second
+        time.sleep(delay)
+
+        with self._lock:
+            self.stats['prompt_tokens'] += prompt_tokens
+            self.stats['completion_tokens'] += completion_tokens
+        return FakeResponse(content, prompt_tokens, completion_tokens)
+
+
+class CassetteLLM:
+    """
+    Record/replay wrapper around any LLM client
+
+    In "record" mode every call goes to the wrapped client and its response is
+    appended to a JSONL cassette; "replay" serves responses from the cassette
+    only and never calls the wrapped client; "auto" replays what it has and
+    records the rest. Entries are keyed by a hash of model and prompt text.
+    """
+
+    MODES = ("record", "replay", "auto")
+
+    def __init__(self, inner: Any, path: str, mode: str = "auto", model: str = ""):
+        if mode not in self.MODES:
+            raise ValueError(f"Unsupported cassette mode: {mode}")
+        self.inner = inner
+        self.path = path
+        self.mode = mode
+        self.model = model
+        self._entries: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding='utf-8') as cassette:
+            for line in cassette:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._entries[entry['key']] = entry['content']
+
+    def _key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model}\n{text}".encode('utf-8')).hexdigest()
+
+    def invoke(self, prompt: Any) -> Any:
+        text = prompt_to_text(prompt)
+        key = self._key(text)
+        if self.mode != "record":
+            with self._lock:
+                content = self._entries.get(key)
+            if content is not None:
+                return FakeResponse(content, estimate_tokens(text), estimate_tokens(content))
+            if self.mode == "replay":
+                raise KeyError(f"No cassette entry for prompt {key[:12]} in {self.path}")
+
+        response = self.inner.invoke(prompt)
+        with self._lock:
+            self._entries[key] = response.content
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as cassette:
+                cassette.write(json.dumps({'key': key, 'model': self.model, 'content': response.content}) + "\n")
+        return response
@@ -0,0 +1,225 @@
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from glossgen.config.app_config import AppConfig
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = (DONE, FAILED, CANCELLED)
+
+
+class JobCancelled(Exception):
+    """Raised inside a job function when the job has been cancelled"""
+
+
+class Job:
+    """
+    A long operation running outside the Streamlit script
+
+    The job function receives the Job and reports through it: set_total and
+    advance for progress, add_result for partial results keyed by item (for
+    example one glossary per table) and warn for non-fatal problems. It should
+    call check_cancelled between items. Jobs never touch st.session_state;
+    the UI reads them on each rerun and copies results into the session.
+    """
+
+    def __init__(self, kind: str, owner: str, label: str = ""):
+        self.job_id = f"{kind}_{uuid.uuid4().hex[:10]}"
+        self.kind = kind
+        self.owner = owner
+        self.label = label or kind
+        self.status = PENDING
+        self.total = 0
+        self.completed = 0
+        self.results: Dict[str, Any] = {}
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.warnings: List[str] = []
+        self.current_item: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._cancel_event = threading.Event()
+        self._cancel_callbacks: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    # Reporting, called from the job function
+
+    def set_total(self, total: int) -> None:
+        with self._lock:
+            self.total = total
+
+    def advance(self, count: int = 1) -> None:
+        with self._lock:
+            self.completed += count
+
+    def set_current(self, item: Optional[str]) -> None:
+        """Name the item being worked on, for display"""
+        self.current_item = item
+
+    def add_result(self, key: str, value: Any, advance: bool = True) -> None:
+        with self._lock:
+            self.results[key] = value
+            if advance:
+                self.completed += 1
+
+    def warn(self, message: str) -> None:
+        with self._lock:
+            self.warnings.append(message)
+
+    def on_cancel(self, callback: Callable[[], None]) -> None:
+        """Call callback when the job is cancelled, e.g. to interrupt a blocking call"""
+        with self._lock:
+            self._cancel_callbacks.append(callback)
+        if self.cancelled:
+            callback()
+
+    def check_cancelled(self) -> None:
+        if self._cancel_event.is_set():
+            raise JobCancelled(self.job_id)
+
+    # Control and inspection, called from the UI
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+        with self._lock:
+            callbacks = list(self._cancel_callbacks)
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error cancelling job {self.job_id}: {str(e)}")
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    @property
+    def progress(self) -> float:
+        with self._lock:
+            if not self.total:
+                return 1.0 if self.finished else 0.0
+            return min(1.0, self.completed / self.total)
+
+    def snapshot_results(self) -> Dict[str, Any]:
+        """Copy of the partial results gathered so far"""
+        with self._lock:
+            return dict(self.results)
+
+    def summary(self) -> Dict[str, Any]:
+        elapsed = (self.finished_at or time.time()) - (self.started_at or self.created_at)
+        return {
+            'job': self.label,
+            'status': self.status,
+            'progress': f"{self.completed}/{self.total}" if self.total else "",
+            'seconds': round(elapsed, 1)
+        }
+
+
+class JobRunner:
+    """
+    Process-wide thread pool and results store for background jobs
+
+    Jobs keep running across Streamlit reruns and widget interactions, and are
+    owned by a session id so each session only lists its own jobs. Finished
+    jobs are kept for JOB_RESULT_TTL seconds so their results can be collected
+    on a later rerun.
+    """
+
+    def __init__(self, max_workers: int = AppConfig.JOB_RUNNER_MAX_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="glossgen-job")
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, kind: str, fn: Callable[..., Any], owner: str, label: str = "", **kwargs) -> Job:
+        """Run fn(job, **kwargs) in the pool and return the Job immediately"""
+        self.purge()
+        job = Job(kind, owner, label)
+        with self._lock:
+            self._jobs[job.job_id] = job
+        self._executor.submit(self._run, job, fn, kwargs)
+        return job
+
+    @staticmethod
+    def _run(job: Job, fn: Callable[..., Any], kwargs: Dict[str, Any]) -> None:
+        if job.cancelled:
+            job.status = CANCELLED
+            job.finished_at = time.time()
+            return
+        job.status = RUNNING
+        job.started_at = time.time()
+        try:
+            job.result = fn(job, **kwargs)
+            job.status = CANCELLED if job.cancelled else DONE
+        except JobCancelled:
+            job.status = CANCELLED
+        except Exception as e:
+            if job.cancelled:
+                # Interrupted blocking calls surface as driver errors
+                job.status = CANCELLED
+                return
+            job.error = str(e)
+            job.status = FAILED
+            print(f"Job {job.job_id} failed: {traceback.format_exc()}")
+        finally:
+            job.finished_at = time.time()
+
+    def get(self, job_id: Optional[str]) -> Optional[Job]:
+        if not job_id:
+            return None
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> None:
+        job = self.get(job_id)
+        if job is not None:
+            job.cancel()
+
+    def remove(self, job_id: str) -> None:
+        """Cancel a job and drop it with its results"""
+        with self._lock:
+            job = self._jobs.pop(job_id, None)
+        if job is not None and not job.finished:
+            job.cancel()
+
+    def list_jobs(self, owner: Optional[str] = None) -> List[Job]:
+        """Jobs of one session (or all), newest first"""
+        with self._lock:
+            jobs = [job for job in self._jobs.values() if owner is None or job.owner == owner]
+        return sorted(jobs, key=lambda job: job.created_at, reverse=True)
+
+    def purge(self, ttl: float = AppConfig.JOB_RESULT_TTL) -> int:
+        """Forget finished jobs older than ttl seconds"""
+        now = time.time()
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job.finished and now - (job.finished_at or now) > ttl
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+        return len(expired)
+
+
+_job_runner: Optional[JobRunner] = None
+_job_runner_lock = threading.Lock()
+
+
+def get_job_runner() -> JobRunner:
+    """Return the process-wide job runner"""
+    global _job_runner
+    with _job_runner_lock:
+        if _job_runner is None:
+            _job_runner = JobRunner()
+        return _job_runner
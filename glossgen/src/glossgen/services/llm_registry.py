@@ -0,0 +1,118 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from glossgen.config.app_config import AppConfig
+
+
+def hash_api_key(api_key: Optional[str]) -> str:
+    """Return a short, non-reversible fingerprint of an API key"""
+    if not api_key:
+        return ""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+class LLMClientRegistry:
+    """
+    Process-wide registry of LLM clients and their HTTP connection pools.
+
+    Streamlit reruns the script for every interaction and every session gets its
+    own chain objects, so clients are cached here instead of on the chains. A
+    client is keyed by provider, model, endpoint, temperature and a hash of the
+    API key (the key itself is never stored in the cache key). HTTP clients are
+    keyed by endpoint only, so different models on the same endpoint share one
+    keep-alive pool.
+    """
+
+    _lock = threading.Lock()
+    _clients: "OrderedDict[Tuple, Any]" = OrderedDict()
+    _http_clients: Dict[str, Any] = {}
+    _building: Dict[Tuple, threading.Lock] = {}
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        endpoint: Optional[str],
+        api_key: Optional[str],
+        temperature: float
+    ) -> Tuple:
+        """Build the cache key for an LLM client"""
+        return (provider, model, endpoint or "", hash_api_key(api_key), float(temperature))
+
+    @classmethod
+    def get_or_create(cls, key: Tuple, factory: Callable[[], Any]) -> Any:
+        """
+        Return the cached client for key, creating it with factory on a miss.
+
+        The factory runs under a lock per key, not the registry lock (it may
+        call get_http_client), so concurrent sessions asking for the same
+        client do not build it twice and other keys are not blocked meanwhile.
+        """
+        with cls._lock:
+            client = cls._clients.get(key)
+            if client is not None:
+                cls._clients.move_to_end(key)
+                return client
+            building = cls._building.setdefault(key, threading.Lock())
+
+        with building:
+            with cls._lock:
+                client = cls._clients.get(key)
+            if client is not None:
+                return client
+            client = None
+            try:
+                client = factory()
+            finally:
+                with cls._lock:
+                    if client is not None:
+                        cls._clients[key] = client
+                        # Evicted clients are only dereferenced, never closed: a chain may
+                        # still hold them and their HTTP pool is shared by endpoint anyway.
+                        while len(cls._clients) > AppConfig.LLM_CLIENT_CACHE_SIZE:
+                            cls._clients.popitem(last=False)
+                    cls._building.pop(key, None)
+            return client
+
+    @classmethod
+    def get_http_client(cls, base_url: Optional[str]) -> Any:
+        """Return the shared keep-alive httpx client for an endpoint"""
+        import httpx
+
+        pool_key = (base_url or "").rstrip("/")
+        with cls._lock:
+            http_client = cls._http_clients.get(pool_key)
+            if http_client is None or http_client.is_closed:
+                http_client = httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=AppConfig.LLM_HTTP_MAX_CONNECTIONS,
+                        max_keepalive_connections=AppConfig.LLM_HTTP_MAX_KEEPALIVE,
+                        keepalive_expiry=AppConfig.LLM_HTTP_KEEPALIVE_EXPIRY
+                    ),
+                    timeout=AppConfig.LLM_HTTP_TIMEOUT
+                )
+                cls._http_clients[pool_key] = http_client
+            return http_client
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all cached clients and close the shared HTTP pools"""
+        with cls._lock:
+            cls._clients.clear()
+            for http_client in cls._http_clients.values():
+                try:
+                    http_client.close()
+                except Exception as e:
+                    print(f"Error closing HTTP client: {str(e)}")
+            cls._http_clients.clear()
+
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        """Return the number of cached LLM clients and HTTP pools"""
+        with cls._lock:
+            return {
+                'llm_clients': len(cls._clients),
+                'http_pools': len(cls._http_clients)
+            }
@@ -0,0 +1,447 @@
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from glossgen.config.app_config import AppConfig
+
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """Raised when a provider's circuit breaker is open"""
+
+    def __init__(self, provider: str, retry_in: float):
+        super().__init__(f"Circuit for {provider} is open, retry in {retry_in:.0f}s")
+        self.provider = provider
+        self.retry_in = retry_in
+
+
+class DeadlineExceededError(Exception):
+    """Raised when a call cannot finish before its deadline"""
+
+
+def _start_call(fn: Callable[[], Any]) -> Future:
+    """
+    Run fn on its own daemon thread
+
+    The caller waits on the future with a timeout, so a request that hangs
+    cannot hold it past its deadline; the request itself then finishes (or
+    hits the HTTP client's timeout) in the background.
+    """
+    future: Future = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn())
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=run, name="llm-call", daemon=True).start()
+    return future
+
+
+def _parse_retry_after(headers: Any) -> Optional[float]:
+    """Read Retry-After (seconds or HTTP date) or retry-after-ms from headers"""
+    if not headers:
+        return None
+    try:
+        retry_after_ms = headers.get('retry-after-ms')
+        if retry_after_ms:
+            return float(retry_after_ms) / 1000
+        retry_after = headers.get('retry-after')
+        if not retry_after:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            retry_at = parsedate_to_datetime(retry_after)
+            return max(0.0, retry_at.timestamp() - time.time())
+    except Exception:
+        return None
+
+
+def classify_error(exc: Exception) -> Tuple[Optional[int], Optional[float], bool]:
+    """
+    Classify an exception raised by an LLM client
+
+    Works with openai/anthropic SDK errors (status_code and response attributes),
+    httpx errors and plain timeouts without importing any provider SDK.
+
+    Returns:
+        Tuple of (status_code, retry_after_seconds, is_retryable)
+    """
+    response = getattr(exc, 'response', None)
+    status_code = getattr(exc, 'status_code', None) or getattr(response, 'status_code', None)
+    retry_after = _parse_retry_after(getattr(response, 'headers', None))
+
+    if status_code is not None:
+        return status_code, retry_after, status_code in RETRYABLE_STATUS_CODES
+
+    # Timeouts and dropped connections have no status code but are transient
+    error_name = type(exc).__name__
+    transient = (
+        isinstance(exc, (TimeoutError, ConnectionError))
+        or 'Timeout' in error_name
+        or 'Connection' in error_name
+    )
+    return None, retry_after, transient
+
+
+def is_outage(status_code: Optional[int], retryable: bool) -> bool:
+    """
+    Whether an error says the provider itself is failing: a 5xx, a request
+    timeout, or a timeout or dropped connection without a status code.
+    Throttling and client errors (bad key, bad request) are not outages, so
+    one session's mistakes do not open the circuit for everyone.
+    """
+    if status_code is None:
+        return retryable
+    return status_code >= 500 or status_code == 408
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limit for one provider
+
+    Every success raises the limit by roughly one slot per window of calls,
+    every throttle (429) or server error halves it. Decreases are rate limited
+    so one burst of 429s from the same window only halves the limit once.
+    """
+
+    def __init__(
+        self,
+        initial: int = AppConfig.LLM_INITIAL_CONCURRENCY,
+        minimum: int = AppConfig.LLM_MIN_CONCURRENCY,
+        maximum: int = AppConfig.LLM_MAX_CONCURRENCY,
+        decrease_factor: float = 0.5
+    ):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease_factor = decrease_factor
+        self.limit = float(initial)
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self, deadline: Optional[float] = None) -> None:
+        """Block until a slot is free and no Retry-After pause is active"""
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                if deadline is not None and now >= deadline:
+                    raise DeadlineExceededError("Deadline exceeded waiting for a concurrency slot")
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                elif self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    return
+                else:
+                    wait = 1.0
+                if deadline is not None:
+                    wait = min(wait, deadline - now)
+                self._condition.wait(timeout=max(wait, 0.01))
+
+    def release(self) -> None:
+        with self._condition:
+            self.in_flight = max(0, self.in_flight - 1)
+            self._condition.notify_all()
+
+    def on_success(self) -> None:
+        with self._condition:
+            self.limit = min(self.maximum, self.limit + 1.0 / max(self.limit, 1.0))
+            self._condition.notify_all()
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        with self._condition:
+            now = time.monotonic()
+            if retry_after:
+                self.paused_until = max(self.paused_until, now + retry_after)
+            # One multiplicative decrease per "round trip" of in-flight calls
+            if now - self._last_decrease >= 1.0:
+                self.limit = max(self.minimum, self.limit * self.decrease_factor)
+                self._last_decrease = now
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one provider
+
+    After failure_threshold consecutive failures the circuit opens and calls
+    fail fast for reset_timeout seconds; then a single probe call is allowed
+    through (half-open) and its outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = AppConfig.LLM_CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = AppConfig.LLM_CIRCUIT_RESET_TIMEOUT
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> Tuple[bool, float]:
+        """Return (allowed, seconds until the next probe is allowed)"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True, 0.0
+            elapsed = time.monotonic() - self.opened_at
+            if self.state == self.OPEN and elapsed >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True, 0.0
+            return False, max(0.0, self.reset_timeout - elapsed)
+
+    def is_available(self) -> bool:
+        """Return whether a call would currently be let through, without claiming a probe"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                return time.monotonic() - self.opened_at >= self.reset_timeout
+            return not self._probe_in_flight
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Give back a half-open probe whose call said nothing about the provider's health"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+
+class LatencyTracker:
+    """Sliding-window latency percentiles and outcome counters per provider/model"""
+
+    def __init__(self, window: int = AppConfig.LLM_LATENCY_WINDOW):
+        self.window = window
+        self._samples: Dict[Tuple[str, str], deque] = {}
+        self._counters: Dict[Tuple[str, str], Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, provider: str, model: str, latency: float, outcome: str) -> None:
+        key = (provider, model)
+        with self._lock:
+            counters = self._counters.setdefault(
+                key, {'success': 0, 'throttled': 0, 'error': 0}
+            )
+            counters[outcome] = counters.get(outcome, 0) + 1
+            if outcome == 'success':
+                self._samples.setdefault(key, deque(maxlen=self.window)).append(latency)
+
+    @staticmethod
+    def _percentile(sorted_values: List[float], pct: float) -> float:
+        if not sorted_values:
+            return 0.0
+        index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+        return sorted_values[index]
+
+    def report(self) -> List[Dict[str, Any]]:
+        """Return one row per provider/model with p50/p90/p99 latency in seconds"""
+        with self._lock:
+            rows = []
+            for key, counters in self._counters.items():
+                values = sorted(self._samples.get(key, []))
+                rows.append({
+                    'provider': key[0],
+                    'model': key[1],
+                    'p50': self._percentile(values, 50),
+                    'p90': self._percentile(values, 90),
+                    'p99': self._percentile(values, 99),
+                    **counters
+                })
+            return rows
+
+
+class ResilientCaller:
+    """
+    Retry, throttling and circuit-breaking wrapper around LLM calls
+
+    State is kept per provider so a throttled provider does not slow down the
+    others. Use get_resilient_caller() for the process-wide instance.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = AppConfig.LLM_MAX_RETRIES,
+        backoff_base: float = AppConfig.LLM_BACKOFF_BASE,
+        backoff_max: float = AppConfig.LLM_BACKOFF_MAX,
+        deadline: float = AppConfig.LLM_REQUEST_DEADLINE
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.deadline = deadline
+        self.latency = LatencyTracker()
+        self._limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def limiter(self, provider: str) -> AdaptiveConcurrencyLimiter:
+        with self._lock:
+            if provider not in self._limiters:
+                self._limiters[provider] = AdaptiveConcurrencyLimiter()
+            return self._limiters[provider]
+
+    def breaker(self, provider: str) -> CircuitBreaker:
+        with self._lock:
+            if provider not in self._breakers:
+                self._breakers[provider] = CircuitBreaker()
+            return self._breakers[provider]
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given attempt (0-based)"""
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    def call(
+        self,
+        fn: Callable[[], Any],
+        provider: str,
+        model: str,
+        deadline: Optional[float] = None,
+        max_retries: Optional[int] = None
+    ) -> Any:
+        """
+        Call fn with retries, adaptive concurrency and a circuit breaker
+
+        Args:
+            fn: Zero-argument callable performing the LLM request
+            provider: Provider name used to key limiter, breaker and metrics
+            model: Model name used to key metrics
+            deadline: Seconds the whole call (including retries) may take; an
+                attempt still running then is abandoned with DeadlineExceededError
+            max_retries: Override of the retry budget for this call
+
+        Returns:
+            Whatever fn returns
+        """
+        limiter = self.limiter(provider)
+        breaker = self.breaker(provider)
+        expires_at = time.monotonic() + (deadline or self.deadline)
+        if max_retries is None:
+            max_retries = self.max_retries
+
+        attempt = 0
+        while True:
+            allowed, retry_in = breaker.allow()
+            if not allowed:
+                raise CircuitOpenError(provider, retry_in)
+
+            try:
+                limiter.acquire(expires_at)
+            except DeadlineExceededError:
+                breaker.release_probe()
+                raise
+            started = time.monotonic()
+            future = _start_call(fn)
+            abandoned = False
+            try:
+                result = future.result(timeout=max(0.0, expires_at - started))
+            except FutureTimeoutError:
+                # A hung request counts as a timeout; it keeps its slot until it returns
+                abandoned = True
+                future.add_done_callback(lambda _: limiter.release())
+                breaker.record_failure()
+                self.latency.record(provider, model, time.monotonic() - started, 'error')
+                raise DeadlineExceededError(
+                    f"{provider} did not respond within the {deadline or self.deadline:g}s deadline"
+                ) from None
+            except Exception as exc:
+                elapsed = time.monotonic() - started
+                status_code, retry_after, retryable = classify_error(exc)
+                if status_code == 429:
+                    limiter.on_throttle(retry_after)
+                    # Throttling is not an outage, nor a sign of recovery
+                    breaker.release_probe()
+                    self.latency.record(provider, model, elapsed, 'throttled')
+                else:
+                    if retryable:
+                        limiter.on_throttle(retry_after)
+                    if is_outage(status_code, retryable):
+                        breaker.record_failure()
+                    else:
+                        breaker.release_probe()
+                    self.latency.record(provider, model, elapsed, 'error')
+
+                delay = max(retry_after or 0.0, self.backoff(attempt))
+                if (
+                    not retryable
+                    or attempt >= max_retries
+                    or time.monotonic() + delay >= expires_at
+                ):
+                    raise
+            else:
+                limiter.on_success()
+                breaker.record_success()
+                self.latency.record(provider, model, time.monotonic() - started, 'success')
+                return result
+            finally:
+                if not abandoned:
+                    limiter.release()
+
+            # Back off outside the slot so other calls can use it meanwhile
+            attempt += 1
+            time.sleep(delay)
+
+    def status(self) -> List[Dict[str, Any]]:
+        """Return the current concurrency limit and circuit state per provider"""
+        with self._lock:
+            providers = sorted(set(self._limiters) | set(self._breakers))
+            limiters = dict(self._limiters)
+            breakers = dict(self._breakers)
+        return [
+            {
+                'provider': provider,
+                'concurrency_limit': int(limiters[provider].limit) if provider in limiters else None,
+                'in_flight': limiters[provider].in_flight if provider in limiters else 0,
+                'circuit': breakers[provider].state if provider in breakers else CircuitBreaker.CLOSED
+            }
+            for provider in providers
+        ]
+
+
+_resilient_caller: Optional[ResilientCaller] = None
+_resilient_caller_lock = threading.Lock()
+
+
+def get_resilient_caller() -> ResilientCaller:
+    """Return the process-wide ResilientCaller"""
+    global _resilient_caller
+    with _resilient_caller_lock:
+        if _resilient_caller is None:
+            _resilient_caller = ResilientCaller()
+        return _resilient_caller
+
+
+def invoke_llm(llm: Any, prompt: Any, provider: str, model: str) -> Any:
+    """Invoke a LangChain chat model through the process-wide ResilientCaller"""
+    return get_resilient_caller().call(lambda: llm.invoke(prompt), provider, model)
@@ -0,0 +1,252 @@
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from glossgen.config.app_config import AppConfig
+from glossgen.services.llm_resilience import get_resilient_caller
+from glossgen.utils.ai_utils import get_llm_client
+
+
+class GenerationTarget:
+    """One provider/model/endpoint that generation requests can be sent to"""
+
+    def __init__(
+        self,
+        provider: str,
+        model: str,
+        endpoint: str = "",
+        api_key: str = "",
+        weight: float = 1.0,
+        api_key_env: str = ""
+    ):
+        self.provider = provider
+        self.model = model
+        self.endpoint = endpoint or ""
+        # A key typed in, or the name of an environment variable holding it
+        self.api_key = api_key or (os.environ.get(api_key_env, "") if api_key_env else "")
+        self.weight = max(float(weight), 0.0)
+
+    @property
+    def key(self) -> Tuple[str, str, str]:
+        return (self.provider, self.model, self.endpoint)
+
+    @property
+    def name(self) -> str:
+        """Name used to key throttling and circuit state for this endpoint"""
+        return f"{self.provider}@{self.endpoint}" if self.endpoint else self.provider
+
+    def get_llm(self, temperature: float) -> Any:
+        return get_llm_client(
+            provider=self.provider,
+            api_key=self.api_key,
+            model=self.model,
+            endpoint=self.endpoint or None,
+            temperature=temperature
+        )
+
+
+class _TargetStats:
+    """EWMA latency and error rate observed for one target"""
+
+    def __init__(self):
+        self.latency = 1.0
+        self.error_rate = 0.0
+        self.in_flight = 0
+        self.calls = 0
+
+    def record(self, latency: Optional[float], failed: bool) -> None:
+        alpha = AppConfig.ROUTER_EWMA_ALPHA
+        if latency is not None:
+            self.latency = latency if self.calls == 0 else (1 - alpha) * self.latency + alpha * latency
+        self.error_rate = (1 - alpha) * self.error_rate + alpha * (1.0 if failed else 0.0)
+        self.calls += 1
+
+
+# Observations are shared by all sessions so every router learns from all traffic
+_stats: Dict[Tuple[str, str, str], _TargetStats] = {}
+_stats_lock = threading.Lock()
+
+
+class GenerationRouter:
+    """
+    Spreads generation requests over a weighted pool of targets
+
+    Each request picks a target at random with probability proportional to
+    weight / (latency * (1 + in_flight) * (1 + 4 * error_rate)), so faster and
+    healthier endpoints get more traffic. When a target fails (after a short
+    retry budget) or its circuit is open, the request fails over to the next
+    best target. Failovers are reported to on_failover (e.g. Job.warn) when
+    set; the error of the last target is raised.
+    """
+
+    def __init__(
+        self,
+        targets: List[GenerationTarget],
+        temperature: float = 0.2,
+        on_failover: Optional[Callable[[str], None]] = None
+    ):
+        targets = [target for target in targets if target.weight > 0]
+        if not targets:
+            raise ValueError("No generation targets configured")
+        self.targets = targets
+        self.temperature = temperature
+        self.on_failover = on_failover
+
+    @classmethod
+    def from_settings(
+        cls,
+        ai_settings: Dict[str, str],
+        extra_targets: Optional[Iterable[Dict[str, Any]]] = None,
+        temperature: float = 0.2
+    ) -> "GenerationRouter":
+        """Build a router from the primary AI settings plus optional pool entries"""
+        targets = [GenerationTarget(
+            provider=ai_settings.get('provider') or "OpenAI",
+            model=ai_settings.get('model') or "gpt-3.5-turbo",
+            endpoint=ai_settings.get('endpoint', ""),
+            api_key=ai_settings.get('api_key', "")
+        )]
+        seen = {targets[0].key}
+        for entry in extra_targets or []:
+            if not entry.get('provider') or not entry.get('model'):
+                continue
+            target = GenerationTarget(
+                provider=entry['provider'],
+                model=entry['model'],
+                endpoint=entry.get('endpoint') or "",
+                api_key=entry.get('api_key') or "",
+                api_key_env=entry.get('api_key_env') or "",
+                weight=entry.get('weight', 1.0) if entry.get('weight') is not None else 1.0
+            )
+            if target.key not in seen:
+                seen.add(target.key)
+                targets.append(target)
+        return cls(targets, temperature=temperature)
+
+    @classmethod
+    def from_session(cls, temperature: float = 0.2) -> "GenerationRouter":
+        """Build a router from the current Streamlit session (main thread only)"""
+        from glossgen.state.session_state import SessionState
+
+        return cls.from_settings(
+            SessionState.get_ai_settings(),
+            SessionState.get_generation_targets(),
+            temperature=temperature
+        )
+
+    @staticmethod
+    def _stats_for(target: GenerationTarget) -> _TargetStats:
+        with _stats_lock:
+            if target.key not in _stats:
+                _stats[target.key] = _TargetStats()
+            return _stats[target.key]
+
+    def _score(self, target: GenerationTarget) -> float:
+        stats = self._stats_for(target)
+        if not get_resilient_caller().breaker(target.name).is_available():
+            return 0.0
+        return target.weight / (
+            max(stats.latency, 0.01) * (1 + stats.in_flight) * (1 + 4 * stats.error_rate)
+        )
+
+    def _ordered_targets(self) -> List[GenerationTarget]:
+        """Weighted random first choice, remaining targets as failover by score"""
+        scored = [(self._score(target), target) for target in self.targets]
+        healthy = [(score, target) for score, target in scored if score > 0]
+        if not healthy:
+            # Every circuit is open: still try them, best weight first
+            return sorted(self.targets, key=lambda target: -target.weight)
+
+        pick = random.uniform(0, sum(score for score, _ in healthy))
+        first = healthy[-1][1]
+        for score, target in healthy:
+            pick -= score
+            if pick <= 0:
+                first = target
+                break
+        rest = sorted(
+            (target for _, target in scored if target is not first),
+            key=lambda target: -self._score(target)
+        )
+        return [first] + rest
+
+    def invoke(self, prompt: Any) -> Any:
+        """Send prompt to the best available target, failing over on errors"""
+        caller = get_resilient_caller()
+        retries = AppConfig.ROUTER_RETRIES_PER_TARGET if len(self.targets) > 1 else None
+        last_error: Optional[Exception] = None
+
+        for target in self._ordered_targets():
+            stats = self._stats_for(target)
+            with _stats_lock:
+                stats.in_flight += 1
+            started = time.monotonic()
+            try:
+                llm = target.get_llm(self.temperature)
+                response = caller.call(
+                    lambda: llm.invoke(prompt),
+                    target.name,
+                    target.model,
+                    max_retries=retries
+                )
+            except Exception as e:
+                last_error = e
+                with _stats_lock:
+                    stats.in_flight -= 1
+                    stats.record(None, failed=True)
+                if self.on_failover is not None:
+                    self.on_failover(f"Generation target {target.name}/{target.model} failed: {str(e)}")
+                continue
+
+            with _stats_lock:
+                stats.in_flight -= 1
+                stats.record(time.monotonic() - started, failed=False)
+            return response
+
+        raise last_error if last_error else RuntimeError("No generation target succeeded")
+
+    def max_workers(self) -> int:
+        """Suggested number of concurrent requests for bulk generation"""
+        caller = get_resilient_caller()
+        capacity = sum(int(caller.limiter(target.name).limit) for target in self.targets)
+        return max(1, min(AppConfig.GENERATION_MAX_WORKERS * len(self.targets), capacity))
+
+    def map(
+        self,
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        max_workers: Optional[int] = None
+    ) -> Iterator[Tuple[Any, Any, Optional[Exception]]]:
+        """
+        Run fn over items concurrently, yielding (item, result, error) as they finish
+
+        fn runs in worker threads, so it must not touch st.session_state; resolve
+        everything it needs on the main thread first.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers or self.max_workers()) as executor:
+            futures = {executor.submit(fn, item): item for item in items}
+            for future in as_completed(futures):
+                item = futures[future]
+                try:
+                    yield item, future.result(), None
+                except Exception as e:
+                    yield item, None, e
+
+    def report(self) -> List[Dict[str, Any]]:
+        """Return the observed latency and error rate per target"""
+        rows = []
+        for target in self.targets:
+            stats = self._stats_for(target)
+            rows.append({
+                'provider': target.provider,
+                'model': target.model,
+                'endpoint': target.endpoint,
+                'weight': target.weight,
+                'ewma_latency': round(stats.latency, 3),
+                'error_rate': round(stats.error_rate, 3),
+                'calls': stats.calls
+            })
+        return rows
@@ -0,0 +1,196 @@
+import hashlib
+import re
+import threading
+import zipfile
+from collections import OrderedDict
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional
+
+import pandas as pd
+
+from glossgen.config.app_config import AppConfig
+from glossgen.services.single_flight import content_fingerprint
+from glossgen.state.glossary_store import GlossaryStore
+
+NO_DESCRIPTION = 'No description defined.'
+NO_RELATIONSHIPS = "No relationships defined.\n"
+
+
+class SectionCache:
+    """
+    Process-wide LRU of rendered Markdown sections keyed by content hash
+
+    A table's section is keyed by its glossary digest, description and
+    relationship lines, so after an edit only the changed tables are
+    rendered again, and sessions documenting the same database share them.
+    """
+
+    _lock = threading.Lock()
+    _sections: "OrderedDict[str, str]" = OrderedDict()
+    stats = {'hits': 0, 'misses': 0}
+
+    @classmethod
+    def get_or_render(cls, key: str, render: Callable[[], str]) -> str:
+        with cls._lock:
+            section = cls._sections.get(key)
+            if section is not None:
+                cls._sections.move_to_end(key)
+                cls.stats['hits'] += 1
+                return section
+            cls.stats['misses'] += 1
+        section = render()
+        with cls._lock:
+            cls._sections[key] = section
+            while len(cls._sections) > AppConfig.MARKDOWN_SECTION_CACHE_SIZE:
+                cls._sections.popitem(last=False)
+        return section
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._sections.clear()
+
+
+def relationship_lines(relationship_matrix: Optional[pd.DataFrame]) -> pd.Series:
+    """One Markdown list item per relationship, built with vectorized string operations"""
+    if relationship_matrix is None or relationship_matrix.empty:
+        return pd.Series([], dtype=object)
+    rm = relationship_matrix.astype({column: str for column in relationship_matrix.columns})
+    return (
+        "- " + rm['table1'] + "." + rm['column1'] + " → " + rm['table2'] + "." + rm['column2']
+        + " (Confidence: " + rm['confidence'] + "%)\n"
+    )
+
+
+def relationship_lines_by_table(relationship_matrix: Optional[pd.DataFrame]) -> Dict[str, str]:
+    """The relationship list of every table that takes part in one, joined per table"""
+    lines = relationship_lines(relationship_matrix)
+    if lines.empty:
+        return {}
+    involved = pd.concat([
+        pd.DataFrame({'table': relationship_matrix['table1'].astype(str).values, 'line': lines.values}),
+        pd.DataFrame({'table': relationship_matrix['table2'].astype(str).values, 'line': lines.values}),
+    ])
+    # A relationship of a table with itself is listed once
+    involved = involved.drop_duplicates()
+    return involved.groupby('table', sort=False)['line'].agg("\n".join).to_dict()
+
+
+def _markdown_cell(value: Any) -> str:
+    # Escape | characters; line breaks would end the row
+    return re.sub(r'[\r\n]+', ' ', str(value).replace('|', '\\|'))
+
+
+def _markdown_table(glossary_df: pd.DataFrame) -> str:
+    """Pipe table of a glossary; glossaries are small, so plain string joins beat DataFrame ops"""
+    header = "| " + " | ".join(_markdown_cell(column) for column in glossary_df.columns) + " |"
+    separator = "|" + "|".join(":---" for _ in glossary_df.columns) + "|"
+    rows = [
+        "| " + " | ".join(_markdown_cell(value) for value in row) + " |"
+        for row in glossary_df.itertuples(index=False, name=None)
+    ]
+    return "\n".join([header, separator] + rows)
+
+
+def _file_names(tables: List[str]) -> Dict[str, str]:
+    """Unique, file-system safe Markdown file names for tables"""
+    used = set()
+    names = {}
+    for table in tables:
+        name = re.sub(r'[^A-Za-z0-9_.-]+', '_', str(table)).strip('._') or "table"
+        if name.lower() in used:
+            name = f"{name}_{hashlib.sha1(str(table).encode('utf-8')).hexdigest()[:8]}"
+        used.add(name.lower())
+        names[table] = f"{name}.md"
+    return names
+
+
+class DocumentationRenderer:
+    """
+    Complete Markdown documentation built from cached per-table sections
+
+    The overview and relationship list are cheap and rendered as a whole; each
+    table's section (description, relationships, glossary) comes from the
+    SectionCache. The same sections make up the single document and the
+    split-per-table zip.
+    """
+
+    def __init__(
+        self,
+        db_name: str,
+        tables: List[str],
+        descriptions: Dict[str, str],
+        relationship_matrix: Optional[pd.DataFrame],
+        glossaries: GlossaryStore
+    ):
+        self.db_name = db_name
+        self.tables = sorted(tables)
+        self.descriptions = descriptions
+        self.relationship_matrix = relationship_matrix
+        self.glossaries = glossaries
+        self._relationships = relationship_lines(relationship_matrix)
+        self._relationships_by_table = relationship_lines_by_table(relationship_matrix)
+        self._section_keys = {table: self._section_key(table) for table in self.tables}
+
+    def _section_key(self, table: str) -> str:
+        glossary = self.glossaries.compact(table).digest() if table in self.glossaries else ""
+        return content_fingerprint(
+            "section",
+            table,
+            glossary,
+            self.descriptions.get(table, NO_DESCRIPTION),
+            self._relationships_by_table.get(table, "")
+        )
+
+    def key(self) -> str:
+        """Content hash of the whole documentation"""
+        return content_fingerprint("documentation", self.db_name, *self._section_keys.values())
+
+    def overview(self) -> str:
+        content = [f"# Database Documentation: {self.db_name}\n", "## Tables Overview\n"]
+        for table in self.tables:
+            # Get first sentence for short description
+            short_desc = self.descriptions.get(table, NO_DESCRIPTION).split('.')[0] + '.'
+            content.append(f"- **{table}**: {short_desc}\n")
+        return "\n".join(content) + "\n"
+
+    def relationships(self) -> str:
+        lines = "\n".join(self._relationships) if not self._relationships.empty else NO_RELATIONSHIPS
+        return "\n## Table Relationships\n\n" + lines + "\n"
+
+    def section(self, table: str) -> str:
+        return SectionCache.get_or_render(self._section_keys[table], lambda: self._render_section(table))
+
+    def _render_section(self, table: str) -> str:
+        content = [
+            f"\n### {table}\n",
+            f"#### Description\n{self.descriptions.get(table, NO_DESCRIPTION)}\n",
+            "#### Relationships\n",
+            self._relationships_by_table.get(table, NO_RELATIONSHIPS),
+            "#### Glossary\n"
+        ]
+        glossary_df = self.glossaries.get(table)
+        if isinstance(glossary_df, pd.DataFrame) and not glossary_df.empty:
+            content.append(_markdown_table(glossary_df) + "\n")
+        else:
+            content.append("No glossary entries available.\n")
+        return "\n".join(content) + "\n"
+
+    def sections(self) -> Iterator[str]:
+        """The single document, yielded section by section"""
+        yield self.overview()
+        yield self.relationships()
+        yield "\n## Detailed Table Documentation\n\n"
+        for table in self.tables:
+            yield self.section(table)
+
+    def write_split_archive(self) -> Callable[[BinaryIO], None]:
+        """File writer for a zip with an index document and one Markdown file per table"""
+        def write(archive_file: BinaryIO) -> None:
+            file_names = _file_names(self.tables)
+            with zipfile.ZipFile(archive_file, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+                index = [self.overview(), self.relationships(), "\n## Table Documents\n\n"]
+                index += [f"- [{table}](tables/{file_names[table]})\n" for table in self.tables]
+                archive.writestr("README.md", "".join(index))
+                for table in self.tables:
+                    archive.writestr(f"tables/{file_names[table]}", self.section(table).lstrip("\n"))
+        return write
@@ -0,0 +1,294 @@
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+import zipfile
+from typing import Any, BinaryIO, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from glossgen.config.app_config import AppConfig
+from glossgen.services.relationships import RELATIONSHIP_COLUMNS, KEY_COLUMNS
+from glossgen.state.glossary_store import (
+    BOOL_COLUMNS,
+    INTERNED_COLUMNS,
+    SAMPLE_COLUMN,
+    STAT_COLUMNS,
+    TEXT_COLUMNS,
+    CompactGlossary,
+    GlossaryStore,
+)
+
+PROJECT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+GLOSSARY_FILE = "glossary.parquet"
+RELATIONSHIPS_FILE = "relationships.parquet"
+DESCRIPTIONS_FILE = "descriptions.parquet"
+PROJECT_SUFFIX = ".glossgen.zip"
+
+
+def _arrow_type(column: str) -> pa.DataType:
+    if column in STAT_COLUMNS:
+        return pa.float32()
+    if column in BOOL_COLUMNS:
+        return pa.bool_()
+    if column == SAMPLE_COLUMN:
+        return pa.list_(pa.string())
+    # Names, types, text and columns outside the glossary layout are stored as strings
+    return pa.string()
+
+
+def _column_values(glossary: CompactGlossary, column: str, rows: int) -> Any:
+    """Values of one column of a compact glossary in a form pyarrow accepts"""
+    if column not in glossary.data:
+        return np.full(rows, np.nan, dtype=np.float32) if column in STAT_COLUMNS else [None] * rows
+    values = glossary.data[column]
+    if column in BOOL_COLUMNS:
+        return [None if value < 0 else bool(value) for value in values]
+    if column in STAT_COLUMNS or column == SAMPLE_COLUMN or column in INTERNED_COLUMNS + TEXT_COLUMNS:
+        return values
+    return [None if value is None else str(value) for value in values]
+
+
+def _glossary_batch(glossaries: GlossaryStore, tables: List[str], schema: pa.Schema) -> pa.RecordBatch:
+    arrays = []
+    compacts = [glossaries.compact(table) for table in tables]
+    sizes = [len(compact) for compact in compacts]
+    for field in schema:
+        if field.name == 'table_name':
+            values = [table for table, rows in zip(tables, sizes) for _ in range(rows)]
+            arrays.append(pa.array(values, type=field.type))
+            continue
+        chunks = [_column_values(compact, field.name, rows) for compact, rows in zip(compacts, sizes)]
+        if field.name in STAT_COLUMNS:
+            values = np.concatenate(chunks) if chunks else np.array([], dtype=np.float32)
+            arrays.append(pa.array(values, type=field.type, from_pandas=True))
+        else:
+            arrays.append(pa.array([value for chunk in chunks for value in chunk], type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def save_project(
+    directory: str,
+    db_name: str,
+    glossaries: GlossaryStore,
+    descriptions: Dict[str, str],
+    relationship_matrix: Optional[pd.DataFrame]
+) -> Dict[str, Any]:
+    """
+    Write the documentation state as a project directory
+
+    The glossaries of all tables go to one Parquet file in table order, a few
+    hundred tables per row group, so saving converts the compact glossaries
+    batch by batch. The manifest records each table's row count and column
+    layout, which lets loading slice the columns per table without scanning
+    the table_name column.
+    """
+    os.makedirs(directory, exist_ok=True)
+    tables = list(glossaries)
+    columns: List[str] = []
+    for table in tables:
+        columns += [column for column in glossaries.columns(table) if column not in columns]
+    schema = pa.schema(
+        [pa.field('table_name', pa.string())] + [pa.field(column, _arrow_type(column)) for column in columns]
+    )
+
+    manifest_tables = []
+    with pq.ParquetWriter(os.path.join(directory, GLOSSARY_FILE), schema) as writer:
+        batch_size = AppConfig.PROJECT_TABLES_PER_ROW_GROUP
+        for start in range(0, len(tables), batch_size):
+            batch = _glossary_batch(glossaries, tables[start:start + batch_size], schema)
+            writer.write_table(pa.Table.from_batches([batch]))
+        for table in tables:
+            compact = glossaries.compact(table)
+            manifest_tables.append({'name': table, 'rows': len(compact), 'columns': list(compact.columns)})
+
+    relationships = relationship_matrix if relationship_matrix is not None else pd.DataFrame()
+    relationships = relationships.reindex(columns=RELATIONSHIP_COLUMNS)
+    relationships = relationships.astype({column: str for column in KEY_COLUMNS}).astype({'confidence': float})
+    pq.write_table(pa.Table.from_pandas(relationships, preserve_index=False), os.path.join(directory, RELATIONSHIPS_FILE))
+
+    description_items = [(table, str(text)) for table, text in descriptions.items()]
+    pq.write_table(
+        pa.table({
+            'table_name': pa.array([table for table, _ in description_items], type=pa.string()),
+            'description': pa.array([text for _, text in description_items], type=pa.string())
+        }),
+        os.path.join(directory, DESCRIPTIONS_FILE)
+    )
+
+    manifest = {
+        'version': PROJECT_VERSION,
+        'db_name': db_name,
+        'created_at': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'tables': manifest_tables,
+        'relationships': len(relationships),
+        'descriptions': len(description_items)
+    }
+    tmp_path = os.path.join(directory, f"{MANIFEST_FILE}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as manifest_file:
+        json.dump(manifest, manifest_file)
+    os.replace(tmp_path, os.path.join(directory, MANIFEST_FILE))
+    return manifest
+
+
+def read_manifest(directory: str) -> Dict[str, Any]:
+    with open(os.path.join(directory, MANIFEST_FILE), encoding='utf-8') as manifest_file:
+        manifest = json.load(manifest_file)
+    if manifest.get('version') != PROJECT_VERSION:
+        raise ValueError(f"Unsupported project version: {manifest.get('version')}")
+    return manifest
+
+
+def _compact_column(column: str, values: pa.ChunkedArray) -> Any:
+    """Convert a whole Parquet column once to the compact glossary representation"""
+    if column in STAT_COLUMNS:
+        return values.to_numpy().astype(np.float32, copy=False)
+    if column in BOOL_COLUMNS:
+        return pc.fill_null(pc.cast(values, pa.int8()), -1).to_numpy()
+    if column == SAMPLE_COLUMN:
+        # Flatten once and cut the tuples at the list offsets
+        values = values.combine_chunks()
+        items = pc.list_flatten(values).to_numpy(zero_copy_only=False).tolist()
+        offsets = pc.subtract(values.offsets, values.offsets[0]).to_numpy().tolist()
+        return [tuple(items[offsets[i]:offsets[i + 1]]) for i in range(len(values))]
+    values = values.to_numpy(zero_copy_only=False).tolist()
+    if column in INTERNED_COLUMNS:
+        return [None if value is None else sys.intern(value) for value in values]
+    return values
+
+
+def _table_slice(column: str, values: Any, start: int, end: int) -> Any:
+    """One table's rows of a converted column, in the container CompactGlossary uses for it"""
+    if isinstance(values, np.ndarray):
+        return values[start:end]
+    if column in INTERNED_COLUMNS + TEXT_COLUMNS or column == SAMPLE_COLUMN:
+        return tuple(values[start:end])
+    # Columns outside the glossary layout are plain lists, so digests match the saved glossary
+    return values[start:end]
+
+
+def load_project(
+    directory: str,
+    columns: Optional[List[str]] = None,
+    tables: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Read a project directory back into session state objects
+
+    Parquet files are memory-mapped and only the requested glossary columns
+    (default: all) and tables (default: all) are read. Each column is
+    converted once and sliced per table using the row counts in the manifest,
+    so no per-table DataFrame is built until a table is viewed.
+    """
+    manifest = read_manifest(directory)
+    selected = set(tables) if tables is not None else None
+    entries = [entry for entry in manifest['tables'] if selected is None or entry['name'] in selected]
+
+    glossary_path = os.path.join(directory, GLOSSARY_FILE)
+    available = [name for name in pq.read_schema(glossary_path).names if name != 'table_name']
+    projection = [name for name in available if columns is None or name in columns]
+    filters = [('table_name', 'in', sorted(selected))] if selected is not None else None
+    glossary_table = pq.read_table(glossary_path, columns=projection, memory_map=True, filters=filters)
+    data = {name: _compact_column(name, glossary_table.column(name)) for name in projection}
+
+    glossaries = GlossaryStore()
+    offset = 0
+    for entry in entries:
+        end = offset + entry['rows']
+        table_columns = [name for name in entry['columns'] if name in data]
+        glossaries[entry['name']] = CompactGlossary.from_columns(
+            table_columns,
+            {name: _table_slice(name, data[name], offset, end) for name in table_columns}
+        )
+        offset = end
+
+    relationship_matrix = pq.read_table(
+        os.path.join(directory, RELATIONSHIPS_FILE), memory_map=True
+    ).to_pandas()
+    description_table = pq.read_table(os.path.join(directory, DESCRIPTIONS_FILE), memory_map=True)
+    descriptions = dict(zip(
+        description_table.column('table_name').to_pylist(),
+        description_table.column('description').to_pylist()
+    ))
+    if selected is not None:
+        descriptions = {table: text for table, text in descriptions.items() if table in selected}
+        relationship_matrix = relationship_matrix[
+            relationship_matrix['table1'].isin(selected) & relationship_matrix['table2'].isin(selected)
+        ].reset_index(drop=True)
+
+    return {
+        'db_name': manifest['db_name'],
+        'glossaries': glossaries,
+        'descriptions': descriptions,
+        'relationship_matrix': relationship_matrix,
+        'manifest': manifest
+    }
+
+
+def write_project_archive(directory: str) -> Callable[[BinaryIO], None]:
+    """File writer for a zip of a project directory, for download"""
+    def write(archive_file: BinaryIO) -> None:
+        # Parquet is already compressed; store the members as they are
+        with zipfile.ZipFile(archive_file, 'w', compression=zipfile.ZIP_STORED) as archive:
+            for name in (MANIFEST_FILE, GLOSSARY_FILE, RELATIONSHIPS_FILE, DESCRIPTIONS_FILE):
+                archive.write(os.path.join(directory, name), arcname=name)
+    return write
+
+
+def project_archive_writer(
+    db_name: str,
+    glossaries: GlossaryStore,
+    descriptions: Dict[str, str],
+    relationship_matrix: Optional[pd.DataFrame]
+) -> Callable[[BinaryIO], None]:
+    """File writer that saves the state to a scratch project and zips it"""
+    def write(archive_file: BinaryIO) -> None:
+        with tempfile.TemporaryDirectory(prefix="glossgen_project_") as directory:
+            save_project(directory, db_name, glossaries, descriptions, relationship_matrix)
+            write_project_archive(directory)(archive_file)
+    return write
+
+
+def extract_project_archive(archive_file: BinaryIO, directory: Optional[str] = None) -> str:
+    """
+    Unpack an uploaded project zip and return the directory it was unpacked to
+
+    The default is a new private temporary directory (the caller removes it).
+    Saved projects are never replaced: an existing non-empty directory is an error.
+    """
+    with zipfile.ZipFile(archive_file) as archive:
+        names = set(archive.namelist())
+        required = {MANIFEST_FILE, GLOSSARY_FILE, RELATIONSHIPS_FILE, DESCRIPTIONS_FILE}
+        if not required <= names:
+            raise ValueError(f"Not a GlossGen project, missing: {', '.join(sorted(required - names))}")
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix="glossgen_project_")
+        elif os.path.isdir(directory) and os.listdir(directory):
+            raise ValueError(f"{directory} already exists")
+        else:
+            os.makedirs(directory, exist_ok=True)
+        for name in required:
+            archive.extract(name, directory)
+    return directory
+
+
+def project_directory(name: str) -> str:
+    """Directory of a named project under PROJECTS_DIR"""
+    safe_name = re.sub(r'[^A-Za-z0-9_.-]+', '_', name).strip('._') or "project"
+    return os.path.join(AppConfig.PROJECTS_DIR, safe_name)
+
+
+def list_projects() -> List[str]:
+    """Names of the saved projects under PROJECTS_DIR, newest first"""
+    root = AppConfig.PROJECTS_DIR
+    if not os.path.isdir(root):
+        return []
+    names = [name for name in os.listdir(root) if os.path.exists(os.path.join(root, name, MANIFEST_FILE))]
+    return sorted(names, key=lambda name: os.path.getmtime(os.path.join(root, name, MANIFEST_FILE)), reverse=True)
@@ -0,0 +1,151 @@
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+from sqlalchemy import text
+
+from glossgen.config.app_config import AppConfig
+from glossgen.services.connections import mysql_statement_timeout, statement_timeout_ms
+from glossgen.services.job_runner import Job
+
+PAGE_RESULT = "page:"
+
+
+def page_key(index: int) -> str:
+    return f"{PAGE_RESULT}{index:06d}"
+
+
+def _interrupter(conn: Any, dbapi_connection: Any, engine: Any) -> Optional[Callable[[], None]]:
+    """
+    A function that aborts the statement running on conn, or None if the driver cannot
+
+    psycopg2 and pymssql cancel through the connection itself and sqlite3
+    interrupts it; MySQL has no such call, so the statement is killed by id
+    from a second pooled connection.
+    """
+    if conn.dialect.name == 'mysql':
+        connection_id = conn.execute(text("SELECT CONNECTION_ID()")).scalar()
+
+        def kill_query() -> None:
+            with engine.connect() as killer:
+                killer.execute(text(f"KILL QUERY {int(connection_id)}"))
+        return kill_query
+    if hasattr(dbapi_connection, 'cancel'):  # psycopg2, pymssql
+        return dbapi_connection.cancel
+    if hasattr(dbapi_connection, 'interrupt'):  # sqlite3
+        return dbapi_connection.interrupt
+    return None
+
+
+def _interrupt(interrupt: Callable[[], None], lock: threading.Lock, running: List[bool]) -> None:
+    """Abort the running statement; never once the connection went back to the pool"""
+    with lock:
+        if not running[0]:
+            return
+        try:
+            interrupt()
+        except Exception as e:
+            print(f"Could not interrupt query: {str(e)}")
+
+
+def _apply_statement_timeout(conn: Any, dbapi_connection: Any, timeout: float, deadline: float) -> Optional[str]:
+    """
+    Limit statement run time on this connection
+
+    Returns a statement that restores the pool's default, if one is needed
+    before the connection goes back to the pool. SQL Server has no
+    per-session statement timeout, so only cancellation applies there.
+    """
+    dialect = conn.dialect.name
+    if dialect == 'postgresql':
+        # SET LOCAL ends with the transaction, which is rolled back on close
+        conn.execute(text(f"SET LOCAL statement_timeout = {int(timeout * 1000)}"))
+    elif dialect == 'mysql':
+        is_mariadb = bool(getattr(conn.dialect, 'is_mariadb', False))
+        conn.execute(text(mysql_statement_timeout(is_mariadb, int(timeout * 1000))))
+        return mysql_statement_timeout(is_mariadb, statement_timeout_ms())
+    elif dialect == 'sqlite' and hasattr(dbapi_connection, 'set_progress_handler'):
+        dbapi_connection.set_progress_handler(lambda: int(time.monotonic() > deadline), 10000)
+    return None
+
+
+def run_query_job(
+    job: Job,
+    engine: Any,
+    sql: str,
+    page_size: int = AppConfig.QUERY_PAGE_SIZE,
+    max_rows: int = AppConfig.QUERY_MAX_ROWS,
+    max_bytes: int = AppConfig.QUERY_MAX_BYTES,
+    timeout: float = AppConfig.QUERY_TIMEOUT
+) -> Dict[str, Any]:
+    """
+    Run a SQL statement and publish its rows page by page
+
+    Rows are read through a streaming (server-side where the driver supports
+    it) cursor with fetchmany, so only the pages kept in memory are ever
+    transferred. Reading stops at max_rows or max_bytes; the statement is
+    limited to timeout seconds and cancelling the job interrupts it on the
+    server (PostgreSQL, MySQL, SQL Server through pymssql, SQLite). Pages are
+    published as partial results ("page:000000", ...) so the first one can be
+    shown while the rest are still being fetched. The transaction is never
+    committed.
+    """
+    job.set_total(max_rows)
+    summary = {'columns': [], 'rows': 0, 'bytes': 0, 'truncated': None, 'rowcount': None}
+    deadline = time.monotonic() + timeout
+
+    with engine.connect() as conn:
+        dbapi_connection = conn.connection.dbapi_connection
+        interrupt = _interrupter(conn, dbapi_connection, engine)
+        # A MySQL KILL QUERY must not reach whatever statement the pooled connection runs next
+        lock, running = threading.Lock(), [True]
+        if interrupt is None:
+            job.warn("This database driver cannot cancel a running statement; it stops at the statement timeout.")
+        else:
+            job.on_cancel(lambda: _interrupt(interrupt, lock, running))
+        reset = _apply_statement_timeout(conn, dbapi_connection, timeout, deadline)
+        try:
+            result = conn.execution_options(stream_results=True, max_row_buffer=page_size).execute(text(sql))
+            if not result.returns_rows:
+                summary['rowcount'] = result.rowcount
+                return summary
+
+            summary['columns'] = list(result.keys())
+            index = 0
+            while True:
+                job.check_cancelled()
+                if time.monotonic() > deadline:
+                    summary['truncated'] = f"statement timeout ({timeout:g}s)"
+                    break
+                rows = result.fetchmany(min(page_size, max_rows - summary['rows']))
+                if not rows:
+                    break
+                page = pd.DataFrame(rows, columns=summary['columns'])
+                summary['rows'] += len(page)
+                summary['bytes'] += int(page.memory_usage(deep=True).sum())
+                job.add_result(page_key(index), page, advance=False)
+                job.advance(len(page))
+                index += 1
+                if summary['rows'] >= max_rows:
+                    summary['truncated'] = f"row limit ({max_rows:,} rows)"
+                    break
+                if summary['bytes'] >= max_bytes:
+                    summary['truncated'] = f"size limit ({max_bytes / 1024 / 1024:.0f} MB)"
+                    break
+            result.close()
+            return summary
+        except Exception as e:
+            if not job.cancelled and time.monotonic() > deadline:
+                raise TimeoutError(f"Query exceeded the statement timeout of {timeout:g}s") from e
+            raise
+        finally:
+            with lock:
+                running[0] = False
+            if hasattr(dbapi_connection, 'set_progress_handler'):
+                dbapi_connection.set_progress_handler(None, 0)
+            if reset:
+                try:
+                    conn.execute(text(reset))
+                except Exception as e:
+                    print(f"Could not reset statement timeout: {str(e)}")
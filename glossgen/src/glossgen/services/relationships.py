@@ -0,0 +1,137 @@
+import threading
+from collections import OrderedDict
+from itertools import combinations
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from glossgen.config.app_config import AppConfig
+from glossgen.services.job_runner import Job
+from glossgen.services.resource_cache import extractor_source_key
+
+RELATIONSHIP_COLUMNS = ['table1', 'column1', 'table2', 'column2', 'confidence']
+KEY_COLUMNS = ['table1', 'column1', 'table2', 'column2']
+
+
+class RelationshipCache:
+    """
+    Process-wide cache of inferred relationships per table pair
+
+    Pairs are keyed by connection, schema fingerprint and the sorted table
+    names, so any selection of tables is assembled from cached pairs and a
+    changed selection only analyzes the pairs it has not seen. A schema change
+    produces a new fingerprint, which leaves old pairs to age out of the LRU.
+    """
+
+    _lock = threading.Lock()
+    _pairs: "OrderedDict[Tuple, pd.DataFrame]" = OrderedDict()
+
+    @staticmethod
+    def pairs(tables: List[str]) -> List[Tuple[str, str]]:
+        return list(combinations(sorted(set(tables)), 2))
+
+    @staticmethod
+    def _key(extractor: Any, pair: Tuple[str, str]) -> Tuple:
+        return (extractor_source_key(extractor), extractor.schema_fingerprint) + pair
+
+    @classmethod
+    def missing_pairs(cls, extractor: Any, tables: List[str]) -> List[Tuple[str, str]]:
+        with cls._lock:
+            return [pair for pair in cls.pairs(tables) if cls._key(extractor, pair) not in cls._pairs]
+
+    @classmethod
+    def put(cls, extractor: Any, pair: Tuple[str, str], relationships: pd.DataFrame) -> None:
+        with cls._lock:
+            cls._pairs[cls._key(extractor, pair)] = relationships
+            while len(cls._pairs) > AppConfig.RELATIONSHIP_CACHE_SIZE:
+                cls._pairs.popitem(last=False)
+
+    @classmethod
+    def matrix(cls, extractor: Any, tables: List[str]) -> Optional[pd.DataFrame]:
+        """The relationship matrix for tables, or None if any pair is not analyzed yet"""
+        frames = []
+        with cls._lock:
+            for pair in cls.pairs(tables):
+                key = cls._key(extractor, pair)
+                if key not in cls._pairs:
+                    return None
+                cls._pairs.move_to_end(key)
+                if not cls._pairs[key].empty:
+                    frames.append(cls._pairs[key])
+        if not frames:
+            return pd.DataFrame(columns=RELATIONSHIP_COLUMNS)
+        return pd.concat(frames, ignore_index=True)
+
+
+def run_relationship_job(job: Job, extractor: Any, tables: List[str]) -> pd.DataFrame:
+    """Analyze the table pairs missing from the cache, reporting progress per pair"""
+    missing = RelationshipCache.missing_pairs(extractor, tables)
+    job.set_total(len(missing))
+    for table1, table2 in missing:
+        job.check_cancelled()
+        job.set_current(f"{table1} ↔ {table2}")
+        relationships = extractor.get_relationship_matrix_for_two_tables(table1, table2)
+        RelationshipCache.put(extractor, (table1, table2), relationships)
+        job.advance()
+    job.set_current(None)
+    return RelationshipCache.matrix(extractor, tables)
+
+
+def _row_key(row: Dict[str, Any]) -> Tuple:
+    return tuple(str(row.get(column)) for column in KEY_COLUMNS)
+
+
+def empty_overlay() -> Dict[str, Any]:
+    return {'removed': set(), 'rows': {}}
+
+
+def overlay_from_matrix(relationship_matrix: pd.DataFrame) -> Dict[str, Any]:
+    """An overlay that pins every row of a matrix, e.g. one restored from a saved project"""
+    rows = relationship_matrix.dropna(subset=KEY_COLUMNS).to_dict(orient='records')
+    return {'removed': set(), 'rows': {_row_key(row): row for row in rows}}
+
+
+def diff_overlay(
+    base: pd.DataFrame,
+    edited: pd.DataFrame,
+    overlay: Dict[str, Any],
+    tables: List[str]
+) -> Dict[str, Any]:
+    """
+    Record the user's edits of the displayed matrix as an overlay on the computed one
+
+    Rows of base missing from edited become removals; added rows and rows
+    whose confidence changed become overrides. Overlay entries for tables
+    outside the current selection were not displayed and are kept as they are.
+    """
+    selected = set(tables)
+    base_rows = {_row_key(row): row for row in base.to_dict(orient='records')}
+    edited_rows = {
+        _row_key(row): row for row in edited.dropna(subset=KEY_COLUMNS).to_dict(orient='records')
+    }
+    displayed = set(base_rows) | {
+        key for key, row in overlay['rows'].items()
+        if row.get('table1') in selected and row.get('table2') in selected
+    }
+
+    removed = {key for key in overlay['removed'] if key not in displayed}
+    removed |= {key for key in base_rows if key not in edited_rows}
+    rows = {key: row for key, row in overlay['rows'].items() if key not in displayed}
+    for key, row in edited_rows.items():
+        if key not in base_rows or row.get('confidence') != base_rows[key].get('confidence'):
+            rows[key] = row
+    return {'removed': removed, 'rows': rows}
+
+
+def apply_overlay(base: pd.DataFrame, overlay: Dict[str, Any], tables: List[str]) -> pd.DataFrame:
+    """The computed matrix with the user's removals and overrides for the selected tables applied"""
+    selected = set(tables)
+    rows = [
+        row for row in base.to_dict(orient='records')
+        if _row_key(row) not in overlay['removed'] and _row_key(row) not in overlay['rows']
+    ]
+    rows += [
+        row for row in overlay['rows'].values()
+        if row.get('table1') in selected and row.get('table2') in selected
+    ]
+    return pd.DataFrame(rows, columns=RELATIONSHIP_COLUMNS)
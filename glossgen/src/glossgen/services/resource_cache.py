@@ -0,0 +1,222 @@
+import hashlib
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.engine import make_url
+
+from glossgen.config.app_config import AppConfig
+from glossgen.services.connections import pool_status
+
+
+def normalize_connection_url(url: Any) -> str:
+    """
+    Return a stable cache key for a connection URL
+
+    Driver and host are lower-cased, SQLite paths are made absolute and the
+    password is replaced by a short hash, so the key can be logged or shown
+    without leaking credentials while different passwords still get
+    different entries.
+    """
+    url = make_url(str(url)) if not hasattr(url, 'drivername') else url
+    password = url.password
+    if url.get_backend_name() == 'sqlite':
+        database = url.database
+        if database and database != ':memory:' and not database.startswith('file:'):
+            database = os.path.abspath(database)
+        url = url.set(database=database)
+    if url.host:
+        url = url.set(host=url.host.lower())
+    url = url.set(drivername=url.drivername.lower())
+
+    key = url.render_as_string(hide_password=True)
+    if password:
+        key += "#" + hashlib.sha256(str(password).encode("utf-8")).hexdigest()[:16]
+    return key
+
+
+def extractor_source_key(extractor: Any) -> str:
+    """Cache key of the data an extractor reads: its connection URL, or the files it profiles"""
+    source_key = getattr(extractor, 'source_key', None)
+    if source_key is not None:
+        return source_key
+    return normalize_connection_url(extractor.engine.url)
+
+
+class _ResourceEntry:
+    """Engine and extractor shared by every session connected to one URL"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.engine: Any = None
+        self.extractor: Any = None
+        self.leases: Dict[str, float] = {}
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.stale = False
+
+    def live_leases(self, now: float) -> int:
+        return sum(
+            1 for last_seen in list(self.leases.values())
+            if now - last_seen < AppConfig.RESOURCE_LEASE_TIMEOUT
+        )
+
+    def dispose(self) -> None:
+        if self.engine is not None:
+            try:
+                self.engine.dispose()
+            except Exception as e:
+                print(f"Error disposing engine: {str(e)}")
+
+
+class SharedResourceCache:
+    """
+    Process-wide cache of database engines and schema extractors
+
+    Every Streamlit session used to build its own engine, pool and reflected
+    schema, so ten analysts on one warehouse meant ten reflections and ten
+    pools. Entries are keyed by normalize_connection_url and reference counted
+    by session leases: a session acquires an entry on connect, keeps its lease
+    alive on every rerun and releases it on disconnect. Streamlit has no
+    session-end hook, so leases that are not renewed within
+    RESOURCE_LEASE_TIMEOUT stop counting, and entries without live leases are
+    disposed after RESOURCE_IDLE_TIMEOUT. invalidate() drops an entry so the
+    next acquire re-reflects the schema; sessions still holding the old entry
+    keep working until they release it.
+    """
+
+    _lock = threading.Lock()
+    _entries: Dict[str, _ResourceEntry] = {}
+    # Invalidated entries still leased by a session, disposed on last release
+    _stale: List[_ResourceEntry] = []
+
+    @classmethod
+    def acquire(
+        cls,
+        key: str,
+        session_id: str,
+        factory: Callable[[], Tuple[Any, Any]]
+    ) -> Tuple[Any, Any]:
+        """
+        Return (engine, extractor) for key, building them with factory on a miss
+
+        The factory runs under the entry's own lock, so concurrent sessions
+        connecting to the same database wait for one reflection while other
+        databases are not blocked.
+        """
+        cls.evict_idle()
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                entry = _ResourceEntry()
+                cls._entries[key] = entry
+
+        with entry.lock:
+            if entry.engine is None:
+                try:
+                    entry.engine, entry.extractor = factory()
+                except Exception:
+                    with cls._lock:
+                        if cls._entries.get(key) is entry:
+                            del cls._entries[key]
+                    raise
+            entry.leases[session_id] = entry.last_used = time.monotonic()
+            return entry.engine, entry.extractor
+
+    @classmethod
+    def touch(cls, key: str, session_id: str) -> bool:
+        """Renew a session's lease; False if the entry is gone or was invalidated"""
+        with cls._lock:
+            entry = cls._entries.get(key)
+        if entry is None or entry.engine is None:
+            return False
+        with entry.lock:
+            entry.leases[session_id] = entry.last_used = time.monotonic()
+        return True
+
+    @classmethod
+    def release(cls, key: str, session_id: str) -> None:
+        """Drop a session's lease; stale entries are disposed with their last lease"""
+        with cls._lock:
+            entry = cls._entries.get(key)
+            stale = [e for e in cls._stale if session_id in e.leases]
+        for candidate in ([entry] if entry is not None else []) + stale:
+            with candidate.lock:
+                candidate.leases.pop(session_id, None)
+                candidate.last_used = time.monotonic()
+                dispose = candidate.stale and not candidate.leases
+            if dispose:
+                candidate.dispose()
+                with cls._lock:
+                    if candidate in cls._stale:
+                        cls._stale.remove(candidate)
+
+    @classmethod
+    def invalidate(cls, key: str) -> None:
+        """Forget the entry for key so the next acquire reflects the schema again"""
+        with cls._lock:
+            entry = cls._entries.pop(key, None)
+        if entry is None:
+            return
+        with entry.lock:
+            entry.stale = True
+            in_use = entry.live_leases(time.monotonic()) > 0
+        if in_use:
+            with cls._lock:
+                cls._stale.append(entry)
+        else:
+            entry.dispose()
+
+    @classmethod
+    def evict_idle(cls, idle_timeout: Optional[float] = None) -> int:
+        """Dispose entries without live leases that have been idle too long"""
+        idle_timeout = AppConfig.RESOURCE_IDLE_TIMEOUT if idle_timeout is None else idle_timeout
+        now = time.monotonic()
+        evicted = []
+        with cls._lock:
+            for key, entry in list(cls._entries.items()):
+                if entry.engine is None:
+                    continue
+                if entry.live_leases(now) == 0 and now - entry.last_used >= idle_timeout:
+                    evicted.append(cls._entries.pop(key))
+            for entry in list(cls._stale):
+                if entry.live_leases(now) == 0:
+                    cls._stale.remove(entry)
+                    evicted.append(entry)
+        for entry in evicted:
+            entry.dispose()
+        return len(evicted)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Dispose every cached engine"""
+        with cls._lock:
+            entries = list(cls._entries.values()) + cls._stale
+            cls._entries.clear()
+            cls._stale.clear()
+        for entry in entries:
+            entry.dispose()
+
+    @classmethod
+    def stats(cls, keys: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Return one row per cached connection with its pool metrics (credentials
+        are never included), limited to keys if given so a session only sees
+        its own connection
+        """
+        now = time.monotonic()
+        with cls._lock:
+            entries = cls._entries.items() if keys is None else [
+                (key, cls._entries[key]) for key in keys if key in cls._entries
+            ]
+            return [
+                {
+                    'connection': key.split('#')[0],
+                    'sessions': entry.live_leases(now),
+                    'tables': len(entry.extractor.schema_info) if entry.extractor else 0,
+                    'idle_seconds': round(now - entry.last_used, 1),
+                    **(pool_status(entry.engine) if entry.engine is not None else {})
+                }
+                for key, entry in entries
+            ]
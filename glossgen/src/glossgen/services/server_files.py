@@ -0,0 +1,39 @@
+import os
+from typing import List, Optional, Sequence, Tuple
+
+from glossgen.config.app_config import AppConfig
+
+
+def server_files_dir() -> Optional[str]:
+    """The resolved directory server files may be read from, or None if disabled"""
+    if not AppConfig.SERVER_FILES_DIR:
+        return None
+    return os.path.realpath(AppConfig.SERVER_FILES_DIR)
+
+
+def resolve_server_paths(text: str, extensions: Sequence[str]) -> List[Tuple[str, str]]:
+    """
+    (entered path, resolved path) for each non-empty line of text
+
+    Paths are taken relative to the server files directory and resolved with
+    symlinks followed; anything outside it, not a regular file or without one
+    of extensions is refused with the same error, so the field cannot be used
+    to probe which paths exist on the server.
+    """
+    root = server_files_dir()
+    entered = [line.strip() for line in text.splitlines() if line.strip()]
+    if root is None:
+        if entered:
+            raise ValueError("Reading files on the server is disabled.")
+        return []
+    resolved = []
+    for path in entered:
+        full_path = os.path.realpath(os.path.join(root, path))
+        if (
+            os.path.commonpath([root, full_path]) != root
+            or not full_path.lower().endswith(tuple(f".{extension}" for extension in extensions))
+            or not os.path.isfile(full_path)
+        ):
+            raise ValueError(f"Not an allowed file in the server files directory: {path}")
+        resolved.append((path, full_path))
+    return resolved
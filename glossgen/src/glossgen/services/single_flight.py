@@ -0,0 +1,301 @@
+import hashlib
+import os
+import pickle
+import stat
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from glossgen.config.app_config import AppConfig
+from glossgen.services.llm_registry import hash_api_key
+from glossgen.services.resource_cache import extractor_source_key
+
+try:
+    import fcntl
+except ImportError:  # Windows: only in-process coalescing is available
+    fcntl = None
+
+
+class _Flight:
+    """One in-flight computation and its outcome"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesce identical concurrent work within one process
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for it and receive the same result (or exception).
+    Nothing is cached once the flight lands, so a later call runs again.
+    """
+
+    def __init__(self, inner: Optional["FileLockSingleFlight"] = None):
+        self.inner = inner
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self.stats = {'executed': 0, 'coalesced': 0}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[key] = flight
+                self.stats['executed'] += 1
+            else:
+                flight.waiters += 1
+                self.stats['coalesced'] += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = self.inner.do(key, fn) if self.inner is not None else fn()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._flights)
+
+
+class FileLockSingleFlight:
+    """
+    Coalesce identical work across worker processes on one host
+
+    Each key maps to a lock file in a private directory. The process that gets
+    the exclusive lock leads the flight: it writes a flight token into the
+    lock file, computes, writes the pickled result under that token and
+    removes the lock file. Processes that find the lock held read the token
+    and wait on a shared lock; once the leader is done they read its result.
+    Only callers that overlapped the flight see the result, so nothing is
+    cached once it lands: waiters register with a marker file, and the last
+    one to read the result (or the leader, if nobody waited) deletes it.
+    Failures are not written, so a waiter whose leader failed computes
+    itself. Files left behind by crashed processes are removed after
+    result_ttl seconds.
+
+    Results are pickled, so the directory must belong to this user and not
+    be writable by anyone else.
+    """
+
+    def __init__(self, directory: str, result_ttl: float = AppConfig.SINGLE_FLIGHT_RESULT_TTL):
+        if fcntl is None:
+            raise RuntimeError("File-lock single flight requires fcntl (POSIX)")
+        self.directory = directory
+        self.result_ttl = result_ttl
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        info = os.stat(directory)
+        if info.st_uid != os.getuid() or info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            raise RuntimeError(
+                f"Single-flight directory {directory} must be owned by this user and not writable by others"
+            )
+
+    def _base(self, key: Hashable) -> str:
+        digest = hashlib.sha256(repr(key).encode('utf-8')).hexdigest()[:32]
+        return os.path.join(self.directory, digest)
+
+    def _result_path(self, base: str, token: str) -> str:
+        return f"{base}.{token}.result"
+
+    @staticmethod
+    def _is_current(lock_file: Any, lock_path: str) -> bool:
+        """Whether lock_file is still the file at lock_path (a finished leader removes it)"""
+        try:
+            return os.fstat(lock_file.fileno()).st_ino == os.stat(lock_path).st_ino
+        except OSError:
+            return False
+
+    def _waiters(self, result_path: str) -> List[str]:
+        prefix = os.path.basename(result_path) + "."
+        try:
+            return [name for name in os.listdir(self.directory) if name.startswith(prefix) and name.endswith('.wait')]
+        except OSError:
+            return []
+
+    def _discard_if_unwaited(self, result_path: str) -> None:
+        if not self._waiters(result_path):
+            try:
+                os.remove(result_path)
+            except OSError:
+                pass
+
+    def _load(self, result_path: str) -> Tuple[bool, Any]:
+        try:
+            with open(result_path, 'rb') as result_file:
+                return True, pickle.load(result_file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return False, None
+
+    def _sweep(self) -> None:
+        """Remove result files older than result_ttl"""
+        cutoff = time.time() - self.result_ttl
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            if not name.endswith(('.result', '.tmp', '.wait')):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+            except OSError:
+                pass
+
+    def _lead(self, lock_file: Any, lock_path: str, base: str, fn: Callable[[], Any]) -> Any:
+        """Compute under the exclusive lock and leave the result for the waiters"""
+        token = uuid.uuid4().hex
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(token)
+        lock_file.flush()
+        try:
+            result = fn()
+            result_path = self._result_path(base, token)
+            tmp_path = f"{result_path}.{os.getpid()}.tmp"
+            try:
+                with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as result_file:
+                    pickle.dump(result, result_file)
+                os.replace(tmp_path, result_path)
+                self._discard_if_unwaited(result_path)
+            except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+                print(f"Could not share single-flight result: {str(e)}")
+            return result
+        finally:
+            # Later callers start a new flight on a new lock file
+            try:
+                os.remove(lock_path)
+            except OSError:
+                pass
+            self._sweep()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        base = self._base(key)
+        lock_path = base + ".lock"
+        while True:
+            with open(lock_path, 'a+') as lock_file:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    leader = True
+                except BlockingIOError:
+                    leader = False
+                try:
+                    if leader:
+                        if not self._is_current(lock_file, lock_path):
+                            continue
+                        return self._lead(lock_file, lock_path, base, fn)
+
+                    lock_file.seek(0)
+                    token = lock_file.read().strip()
+                    if token:
+                        # Wait for the flight in progress, then take its result
+                        result_path = self._result_path(base, token)
+                        marker = f"{result_path}.{uuid.uuid4().hex}.wait"
+                        open(marker, 'w').close()
+                        try:
+                            fcntl.flock(lock_file, fcntl.LOCK_SH)
+                            found, result = self._load(result_path)
+                        finally:
+                            os.remove(marker)
+                        self._discard_if_unwaited(result_path)
+                        if found:
+                            return result
+                        fcntl.flock(lock_file, fcntl.LOCK_UN)
+                    # No result to share (the leader failed or had not started): lead a new flight
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                    if not self._is_current(lock_file, lock_path):
+                        continue
+                    return self._lead(lock_file, lock_path, base, fn)
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+_single_flight: Optional[SingleFlight] = None
+_single_flight_lock = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """Return the process-wide coordinator, backed by file locks if configured"""
+    global _single_flight
+    with _single_flight_lock:
+        if _single_flight is None:
+            inner = None
+            if AppConfig.SINGLE_FLIGHT_DIR and fcntl is not None:
+                try:
+                    inner = FileLockSingleFlight(AppConfig.SINGLE_FLIGHT_DIR)
+                except (OSError, RuntimeError) as e:
+                    print(f"Coalescing within this process only: {str(e)}")
+            _single_flight = SingleFlight(inner)
+        return _single_flight
+
+
+def content_fingerprint(*parts: Any) -> str:
+    """Short hash of the inputs that determine a result"""
+    return hashlib.sha256("\x1f".join(str(part) for part in parts).encode('utf-8')).hexdigest()[:16]
+
+
+def _connection(extractor: Any) -> str:
+    return extractor_source_key(extractor)
+
+
+def _router_signature(chain: Any) -> str:
+    """Targets and temperature of a chain's router; sessions with different API keys never share a call"""
+    if chain.router is None:
+        chain._initialize_llm()
+    router = chain.router
+    return content_fingerprint(
+        sorted(target.key + (hash_api_key(target.api_key),) for target in router.targets),
+        router.temperature
+    )
+
+
+def profile_table(extractor: Any, table: str) -> Any:
+    """Profile a table, sharing the work with identical in-flight requests"""
+    key = (_connection(extractor), table, "profile", extractor.schema_fingerprint)
+    return get_single_flight().do(key, lambda: extractor.generate_schema_table_for_table(table)).copy()
+
+
+def generate_glossary(glossary_chain: Any, extractor: Any, table: str, schema_data: Any) -> Any:
+    """Run GlossaryChain for a table, sharing identical in-flight requests"""
+    fingerprint = content_fingerprint(
+        glossary_chain.format_prompt(schema_data), _router_signature(glossary_chain)
+    )
+    key = (_connection(extractor), table, "glossary", fingerprint)
+    return get_single_flight().do(key, lambda: glossary_chain.invoke(schema_data))
+
+
+def generate_description(
+    description_chain: Any,
+    extractor: Any,
+    table: str,
+    glossary_data: Any,
+    relationship_data: str
+) -> str:
+    """Run TableDescriptionChain for a table, sharing identical in-flight requests"""
+    fingerprint = content_fingerprint(
+        description_chain.format_prompt(table, glossary_data, relationship_data),
+        _router_signature(description_chain)
+    )
+    key = (_connection(extractor), table, "description", fingerprint)
+    return get_single_flight().do(
+        key, lambda: description_chain.invoke(table, glossary_data, relationship_data)
+    )
@@ -0,0 +1,212 @@
+import hashlib
+import pickle
+import sys
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from glossgen.config.app_config import AppConfig
+
+# Columns repeated across tables and sessions (names, types): stored interned
+INTERNED_COLUMNS = ('column_name', 'data_type')
+# Free text columns: stored as plain strings or None
+TEXT_COLUMNS = ('description', 'comments')
+# Percentage statistics: stored as float32 with NaN for missing values
+STAT_COLUMNS = ('uniqueness_percentage', 'null_percentage', 'primary_key_confidence_score')
+BOOL_COLUMNS = ('is_primary_key',)
+SAMPLE_COLUMN = 'sample_data'
+
+
+def _is_missing(value: Any) -> bool:
+    """None, NaN, pd.NA or NaT; containers are never missing"""
+    if value is None:
+        return True
+    if isinstance(value, (list, tuple, dict, set, np.ndarray)):
+        return False
+    try:
+        return bool(pd.isna(value))
+    except (TypeError, ValueError):
+        return False
+
+
+def _intern(value: Any) -> Optional[str]:
+    return None if _is_missing(value) else sys.intern(str(value))
+
+
+def _text(value: Any) -> Optional[str]:
+    return None if _is_missing(value) else str(value)
+
+
+def _bounded_sample(values: Any) -> tuple:
+    """At most GLOSSARY_SAMPLE_VALUES sample values, each cut to GLOSSARY_SAMPLE_CHARS"""
+    if _is_missing(values):
+        return ()
+    if isinstance(values, str):
+        values = [values]
+    limit = AppConfig.GLOSSARY_SAMPLE_CHARS
+    sample = []
+    # Missing values are not samples; str() would turn them into 'None' or 'nan'
+    present = [value for value in list(values) if not _is_missing(value)]
+    for value in present[:AppConfig.GLOSSARY_SAMPLE_VALUES]:
+        value = str(value)
+        sample.append(value if len(value) <= limit else value[:limit - 1] + "…")
+    return tuple(sample)
+
+
+class CompactGlossary:
+    """
+    Immutable columnar form of one table's glossary
+
+    Column names and types are interned, statistics are float32 arrays, the
+    primary-key flag is an int8 array (-1 for unknown) and samples are bounded
+    tuples of strings. Columns outside the known glossary layout are kept as
+    plain lists so nothing is lost.
+    """
+
+    __slots__ = ('columns', 'data', '_digest')
+
+    def __init__(self, df: pd.DataFrame):
+        self.columns: List[str] = [sys.intern(str(column)) for column in df.columns]
+        self.data: Dict[str, Any] = {}
+        self._digest: Optional[str] = None
+        for column in df.columns:
+            values = df[column].tolist()
+            if column in INTERNED_COLUMNS:
+                self.data[column] = tuple(_intern(value) for value in values)
+            elif column in TEXT_COLUMNS:
+                self.data[column] = tuple(_text(value) for value in values)
+            elif column in STAT_COLUMNS:
+                self.data[column] = pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=np.float32)
+            elif column in BOOL_COLUMNS:
+                self.data[column] = np.array(
+                    [-1 if _is_missing(value) else int(bool(value)) for value in values], dtype=np.int8
+                )
+            elif column == SAMPLE_COLUMN:
+                self.data[column] = tuple(_bounded_sample(value) for value in values)
+            else:
+                self.data[column] = list(values)
+
+    @classmethod
+    def from_columns(cls, columns: List[str], data: Dict[str, Any]) -> "CompactGlossary":
+        """Wrap data already in compact form (e.g. read from a project file) without a DataFrame"""
+        glossary = cls.__new__(cls)
+        glossary.columns = [sys.intern(column) for column in columns]
+        glossary.data = data
+        glossary._digest = None
+        return glossary
+
+    def __len__(self) -> int:
+        return len(self.data[self.columns[0]]) if self.columns else 0
+
+    def to_frame(self) -> pd.DataFrame:
+        """Build a regular DataFrame view (a new object on every call)"""
+        frame = {}
+        for column in self.columns:
+            values = self.data[column]
+            if column in BOOL_COLUMNS:
+                frame[column] = [None if value < 0 else bool(value) for value in values]
+            elif column == SAMPLE_COLUMN:
+                frame[column] = [list(sample) for sample in values]
+            elif column in STAT_COLUMNS:
+                frame[column] = values.copy()
+            else:
+                frame[column] = list(values)
+        return pd.DataFrame(frame, columns=self.columns)
+
+    def digest(self) -> str:
+        """Content hash, computed once since the glossary never changes"""
+        if self._digest is None:
+            content = hashlib.sha256()
+            for column in self.columns:
+                values = self.data[column]
+                content.update(column.encode('utf-8'))
+                content.update(values.tobytes() if isinstance(values, np.ndarray) else pickle.dumps(values))
+            self._digest = content.hexdigest()[:16]
+        return self._digest
+
+    def nbytes(self) -> int:
+        """Approximate memory held by this glossary, counting shared (interned) strings once"""
+        seen = set()
+        total = 0
+        for values in self.data.values():
+            if isinstance(values, np.ndarray):
+                total += values.nbytes
+                continue
+            total += sys.getsizeof(values)
+            for value in values:
+                items = value if isinstance(value, tuple) else (value,)
+                if isinstance(value, tuple):
+                    total += sys.getsizeof(value)
+                for item in items:
+                    if item is not None and id(item) not in seen:
+                        seen.add(id(item))
+                        total += sys.getsizeof(item)
+        return total
+
+
+class GlossaryStore(MutableMapping):
+    """
+    Session glossary state: a mapping of table name to glossary DataFrame
+
+    DataFrames assigned to the store are converted to CompactGlossary and
+    DataFrame views are built only when a table is read, so callers keep the
+    dict-of-DataFrames interface while the session holds compact data. Views
+    are copies: changes must be written back with store[table] = df.
+    """
+
+    def __init__(self, glossaries: Optional[Dict[str, pd.DataFrame]] = None):
+        self._tables: Dict[str, CompactGlossary] = {}
+        if glossaries:
+            self.update(glossaries)
+
+    def __getitem__(self, table: str) -> pd.DataFrame:
+        return self._tables[table].to_frame()
+
+    def __setitem__(self, table: str, glossary: Any) -> None:
+        if isinstance(glossary, CompactGlossary):
+            self._tables[table] = glossary
+        else:
+            self._tables[table] = CompactGlossary(pd.DataFrame(glossary))
+
+    def __delitem__(self, table: str) -> None:
+        del self._tables[table]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tables)
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def __contains__(self, table: object) -> bool:
+        return table in self._tables
+
+    def compact(self, table: str) -> CompactGlossary:
+        """The stored compact glossary of a table (shared, do not modify)"""
+        return self._tables[table]
+
+    def columns(self, table: str) -> List[str]:
+        """Column layout of a table's glossary, without building the DataFrame"""
+        return list(self._tables[table].columns)
+
+    def copy(self) -> "GlossaryStore":
+        """Shallow copy sharing the (immutable) compact tables"""
+        store = GlossaryStore()
+        store._tables = dict(self._tables)
+        return store
+
+    def unchanged_since(self, snapshot: "GlossaryStore", table: str) -> bool:
+        """Whether table's glossary is the one in snapshot (a copy), i.e. was not written since"""
+        return self._tables.get(table) is snapshot._tables.get(table)
+
+    def fingerprint(self, tables: Optional[List[str]] = None) -> str:
+        """Content hash of the glossaries of tables (default: all), in order"""
+        content = hashlib.sha256()
+        for table in tables if tables is not None else list(self._tables):
+            glossary = self._tables.get(table)
+            content.update(f"{table}\x1f{glossary.digest() if glossary else ''}\x1e".encode('utf-8'))
+        return content.hexdigest()[:16]
+
+    def nbytes(self) -> int:
+        return sum(glossary.nbytes() for glossary in self._tables.values())
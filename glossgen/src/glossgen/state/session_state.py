@@ -1,8 +1,10 @@
+import uuid
 import streamlit as st
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from sqlalchemy.engine.base import Engine
 import pandas as pd
 from glossgen.config.app_config import AppConfig
+from glossgen.state.glossary_store import GlossaryStore
 class SessionState:
     """Manages the application's session state"""
     
@@ -22,7 +24,7 @@ class SessionState:
             st.session_state['tables'] = []
         
         if 'glossary_dicts' not in st.session_state:
-            st.session_state['glossary_dicts'] = {}
+            st.session_state['glossary_dicts'] = GlossaryStore()
         
         if 'relationship_matrix' not in st.session_state:
             st.session_state['relationship_matrix'] = pd.DataFrame()  
@@ -44,6 +46,24 @@ class SessionState:
         
         if 'table_descriptions' not in st.session_state:
             st.session_state['table_descriptions'] = {}
+        
+        if 'generation_targets' not in st.session_state:
+            st.session_state['generation_targets'] = []
+        
+        if 'session_id' not in st.session_state:
+            st.session_state['session_id'] = uuid.uuid4().hex
+        
+        if 'recent_tables' not in st.session_state:
+            st.session_state['recent_tables'] = []
+        
+        if 'jobs' not in st.session_state:
+            st.session_state['jobs'] = {}
+            st.session_state['consumed_job_results'] = {}
+        
+        if 'resource_key' not in st.session_state:
+            st.session_state['resource_key'] = ""
+            st.session_state['resource_url'] = None
+            st.session_state['resource_options'] = {}
     
     @staticmethod
     def update_db_connection(is_connected: bool, engine: Optional[Engine] = None, db_name: str = "") -> None:
@@ -51,10 +71,14 @@ class SessionState:
         st.session_state['db_connected'] = is_connected
         st.session_state['engine'] = engine
         st.session_state['relationship_matrix'] = pd.DataFrame()
+        st.session_state['relationship_overlay'] = None
         st.session_state['db_name'] = db_name
+        # Background jobs belong to the previous connection
+        st.session_state['jobs'] = {}
+        st.session_state['profiling_queue'] = None
         if not is_connected:
             st.session_state['tables'] = []
-            st.session_state['glossary_dicts'] = {}
+            st.session_state['glossary_dicts'] = GlossaryStore()
             st.session_state['extractor'] = None
     
     @staticmethod
@@ -66,8 +90,41 @@ class SessionState:
     
     @staticmethod
     def update_glossary_data(glossary_dicts: Dict) -> None:
-        """Update glossary data in session state"""
-        st.session_state['glossary_dicts'] = glossary_dicts
+        """Update glossary data in session state (stored in compact form)"""
+        st.session_state['glossary_dicts'] = GlossaryStore(glossary_dicts)
+    
+    @staticmethod
+    def restore_documentation(
+        glossaries: GlossaryStore,
+        descriptions: Dict[str, str],
+        relationship_matrix: pd.DataFrame,
+        relationship_overlay: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Replace the glossaries, descriptions and relationships, e.g. from a saved project"""
+        st.session_state['glossary_dicts'] = glossaries
+        st.session_state['table_descriptions'] = dict(descriptions)
+        st.session_state['relationship_matrix'] = relationship_matrix
+        st.session_state['relationship_overlay'] = relationship_overlay
+    
+    @staticmethod
+    def set_documentation_snapshot(glossaries: Optional[GlossaryStore]) -> None:
+        """Remember the glossaries a documentation job started from"""
+        st.session_state['documentation_snapshot'] = glossaries
+    
+    @staticmethod
+    def get_documentation_snapshot() -> Optional[GlossaryStore]:
+        """Get the glossaries the running documentation job started from"""
+        return st.session_state.get('documentation_snapshot')
+    
+    @staticmethod
+    def set_profiling_queue(queue: Any) -> None:
+        """Remember the queue shared with the background profiling job"""
+        st.session_state['profiling_queue'] = queue
+    
+    @staticmethod
+    def get_profiling_queue() -> Any:
+        """Get the queue shared with the background profiling job, if one runs"""
+        return st.session_state.get('profiling_queue')
     
     @staticmethod
     def update_relationship_data(relationship_matrix: Any) -> None:
@@ -90,4 +147,75 @@ class SessionState:
             'api_key': st.session_state.get('generative_ai_api_key', ""),
             'model': st.session_state.get('generative_ai_model', ""),
             'endpoint': st.session_state.get('generative_ai_endpoint', "")
-        }
\ No newline at end of file
+        }
+    
+    @staticmethod
+    def update_generation_targets(targets: List[Dict[str, Any]]) -> None:
+        """Update the additional provider targets used for load-balanced generation"""
+        st.session_state['generation_targets'] = targets
+    
+    @staticmethod
+    def get_generation_targets() -> List[Dict[str, Any]]:
+        """Get the additional provider targets used for load-balanced generation"""
+        return st.session_state.get('generation_targets', [])
+    
+    @staticmethod
+    def get_session_id() -> str:
+        """Get the id that identifies this session's leases on shared resources"""
+        if 'session_id' not in st.session_state:
+            st.session_state['session_id'] = uuid.uuid4().hex
+        return st.session_state['session_id']
+    
+    @staticmethod
+    def set_resource(key: str, url: Optional[str], options: Optional[Dict[str, Any]] = None) -> None:
+        """Remember which shared engine this session holds a lease on, and the options it was opened with"""
+        st.session_state['resource_key'] = key
+        st.session_state['resource_url'] = url
+        st.session_state['resource_options'] = dict(options or {})
+    
+    @staticmethod
+    def get_resource() -> Tuple[str, Optional[str], Dict[str, Any]]:
+        """Get the cache key, connection URL and connection options of this session's shared engine"""
+        return (
+            st.session_state.get('resource_key', ""),
+            st.session_state.get('resource_url'),
+            st.session_state.get('resource_options', {})
+        )
+    
+    @staticmethod
+    def set_job(kind: str, job_id: str) -> None:
+        """Remember this session's current background job of a kind"""
+        st.session_state.setdefault('jobs', {})[kind] = job_id
+    
+    @staticmethod
+    def get_job_id(kind: str) -> Optional[str]:
+        """Get this session's current background job id of a kind"""
+        return st.session_state.get('jobs', {}).get(kind)
+    
+    @staticmethod
+    def get_consumed_job_results(job_id: str) -> set:
+        """Keys of a job's partial results already applied to this session"""
+        consumed = st.session_state.setdefault('consumed_job_results', {})
+        return consumed.setdefault(job_id, set())
+    
+    @staticmethod
+    def add_recent_table(table: str) -> None:
+        """Move a table to the front of the recently viewed list"""
+        recent = [name for name in st.session_state.get('recent_tables', []) if name != table]
+        st.session_state['recent_tables'] = ([table] + recent)[:AppConfig.RECENT_TABLES_LIMIT]
+    
+    @staticmethod
+    def get_recent_tables() -> List[str]:
+        """Get recently viewed tables, most recent first"""
+        return list(st.session_state.get('recent_tables', []))
+    
+    @staticmethod
+    def get_relationship_overlay() -> Dict[str, Any]:
+        """Get the user's edits on top of the computed relationships"""
+        overlay = st.session_state.get('relationship_overlay')
+        return overlay if overlay is not None else {'removed': set(), 'rows': {}}
+    
+    @staticmethod
+    def update_relationship_overlay(overlay: Optional[Dict[str, Any]]) -> None:
+        """Update (or with None, discard) the user's relationship edits"""
+        st.session_state['relationship_overlay'] = overlay
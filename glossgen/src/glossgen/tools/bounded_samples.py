@@ -0,0 +1,189 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import types as sqltypes
+
+from glossgen.config.app_config import AppConfig
+
+TEXT, JSON, BINARY, GEOMETRY, SCALAR = 'text', 'json', 'binary', 'geometry', 'scalar'
+
+# Type names reflected without a specific SQLAlchemy type (or as strings by the file extractor)
+_NAME_KINDS = (
+    (('GEOMETRY', 'GEOGRAPHY', 'POINT', 'POLYGON', 'LINESTRING'), GEOMETRY),
+    (('JSON',), JSON),
+    (('BLOB', 'BYTEA', 'BINARY', 'IMAGE', 'RAW'), BINARY),
+    (('TEXT', 'CHAR', 'CLOB', 'XML', 'STRING'), TEXT),
+)
+
+ELLIPSIS = "…"
+
+Projection = Tuple[str, str]  # (column, kind)
+
+
+def column_kind(column_type: Any) -> str:
+    """How a column's sample values are fetched: truncated, summarized or as is"""
+    if isinstance(column_type, sqltypes.JSON):
+        return JSON
+    if isinstance(column_type, sqltypes._Binary):
+        return BINARY
+    if isinstance(column_type, sqltypes.NullType):
+        # Types SQLAlchemy does not know are read as (bounded) text
+        return TEXT
+    try:
+        name = str(column_type).upper()
+    except Exception:
+        name = type(column_type).__name__.upper()
+    for names, kind in _NAME_KINDS:
+        if any(part in name for part in names):
+            return kind
+    if isinstance(column_type, sqltypes.String):
+        return TEXT
+    return SCALAR
+
+
+def _needs_truncation(column_type: Any, max_chars: int) -> bool:
+    length = getattr(column_type, 'length', None)
+    return not isinstance(length, int) or length > max_chars
+
+
+def _select_expression(dialect: str, column_sql: str, kind: str, chars: int) -> str:
+    """SQL computing the value to transfer for one column, limited to chars characters"""
+    if kind in (TEXT, JSON):
+        if dialect == 'mssql':
+            return f"LEFT(CAST({column_sql} AS NVARCHAR(MAX)), {chars})"
+        if dialect == 'mysql':
+            return f"LEFT(CAST({column_sql} AS CHAR), {chars})"
+        if dialect == 'postgresql':
+            return f"SUBSTR(CAST({column_sql} AS TEXT), 1, {chars})"
+        return f"SUBSTR({column_sql}, 1, {chars})"
+    if kind == BINARY:
+        if dialect == 'mssql':
+            return f"DATALENGTH({column_sql})"
+        if dialect == 'postgresql':
+            return f"OCTET_LENGTH({column_sql})"
+        return f"LENGTH({column_sql})"
+    if kind == GEOMETRY:
+        if dialect == 'mssql':
+            return f"{column_sql}.STGeometryType()"
+        if dialect in ('postgresql', 'mysql'):
+            return f"ST_GeometryType({column_sql})"
+        return f"LENGTH({column_sql})"
+    return column_sql
+
+
+def bounded_select(
+    engine: Any,
+    table_sql: str,
+    columns: List[Dict[str, Any]],
+    n: int,
+    max_chars: int = AppConfig.SAMPLE_VALUE_MAX_CHARS
+) -> Tuple[str, List[Projection]]:
+    """
+    A query for the first n rows of a table that bounds what each value transfers
+
+    Columns are listed explicitly instead of SELECT *. Text and JSON longer
+    than max_chars are cut by the database (one extra character is fetched so
+    truncation can be marked), binaries are reduced to their byte length and
+    geometries to their type, so wide rows never cross the wire whole.
+    Returns the query and the (column, kind) pairs to format the rows with.
+    """
+    dialect = engine.dialect.name
+    preparer = engine.dialect.identifier_preparer
+    expressions, projections = [], []
+    for column in columns:
+        kind = column_kind(column['type'])
+        if kind == TEXT and not _needs_truncation(column['type'], max_chars):
+            kind = SCALAR
+        column_sql = preparer.quote(column['name'])
+        expression = _select_expression(dialect, column_sql, kind, max_chars + 1)
+        expressions.append(expression if expression == column_sql else f"{expression} AS {column_sql}")
+        projections.append((column['name'], kind))
+    select_list = ", ".join(expressions) or "*"
+    if dialect == 'mssql':
+        return f"SELECT TOP {n} {select_list} FROM {table_sql}", projections
+    return f"SELECT {select_list} FROM {table_sql} LIMIT {n}", projections
+
+
+def truncate_value(value: Any, max_chars: int) -> Any:
+    """value, or its text cut to max_chars characters (ending in an ellipsis)"""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return f"<binary, {len(value):,} bytes>"
+    if not isinstance(value, str):
+        if isinstance(value, (dict, list)):
+            value = str(value)
+        else:
+            return value
+    return value if len(value) <= max_chars else value[:max(0, max_chars - 1)] + ELLIPSIS
+
+
+def summarize_value(value: Any, kind: str, max_chars: int = AppConfig.SAMPLE_VALUE_MAX_CHARS) -> Any:
+    """The display form of a value fetched by bounded_select"""
+    if value is None:
+        return None
+    if kind == BINARY and not isinstance(value, (bytes, bytearray, memoryview)):
+        return f"<binary, {int(value):,} bytes>"
+    if kind == GEOMETRY:
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return f"<geometry, {len(value):,} bytes>"
+        if isinstance(value, (int, float)):
+            return f"<geometry, {int(value):,} bytes>"
+        return f"<geometry: {value}>"
+    if kind == JSON and isinstance(value, str) and len(value) > max_chars:
+        return f"<json> {truncate_value(value, max_chars)}"
+    return truncate_value(value, max_chars)
+
+
+def bound_frame(
+    df: Any,
+    projections: Optional[List[Projection]] = None,
+    max_chars: int = AppConfig.SAMPLE_VALUE_MAX_CHARS
+) -> Any:
+    """
+    df with every value in its display form; without projections (rows read
+    unbounded, e.g. from files) text is cut and binaries summarized client-side.
+    Pass the max_chars the rows were selected with by bounded_select.
+    """
+    kinds = dict(projections or [])
+    df = df.copy()
+    for column in df.columns:
+        kind = kinds.get(column, SCALAR)
+        if kind != SCALAR or df[column].dtype == object:
+            df[column] = df[column].map(lambda value: summarize_value(value, kind, max_chars), na_action='ignore')
+    return df
+
+
+def _sample_bytes(samples: Dict[str, List], cap: Optional[int]) -> int:
+    return sum(
+        len(str(truncate_value(value, cap) if cap is not None else value).encode('utf-8'))
+        for values in samples.values() for value in values
+    )
+
+
+def fit_byte_budget(
+    samples: Dict[str, List],
+    budget: int = AppConfig.SAMPLE_TABLE_MAX_BYTES,
+    min_chars: int = AppConfig.SAMPLE_VALUE_MIN_CHARS
+) -> Dict[str, List]:
+    """
+    Sample values of a table shrunk to fit budget bytes (UTF-8, as text)
+
+    Values are cut to the largest common length that fits, so short values are
+    kept whole and only the widest columns lose characters. If even
+    min_chars per value is too much, for very wide tables, columns keep
+    fewer values, down to one each.
+    """
+    if _sample_bytes(samples, None) <= budget:
+        return samples
+    longest = max((len(str(value)) for values in samples.values() for value in values), default=0)
+    low, high = min_chars, max(min_chars, longest)
+    while low < high:
+        cap = (low + high + 1) // 2
+        if _sample_bytes(samples, cap) <= budget:
+            low = cap
+        else:
+            high = cap - 1
+    fitted = {column: [truncate_value(value, low) for value in values] for column, values in samples.items()}
+    keep = max((len(values) for values in fitted.values()), default=0)
+    while keep > 1 and _sample_bytes(fitted, None) > budget:
+        keep -= 1
+        fitted = {column: values[:keep] for column, values in fitted.items()}
+    return fitted
@@ -0,0 +1,256 @@
+import os
+import threading
+from typing import Any, Dict, Iterator, List, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from glossgen.config.app_config import AppConfig
+from glossgen.services.csv_ingest import infer_dtypes
+from glossgen.services.single_flight import content_fingerprint
+from glossgen.tools.bounded_samples import bound_frame, fit_byte_budget, truncate_value
+from glossgen.tools.sql import SchemaExtractor
+from glossgen.utils.data_processing import column_stats_from_counts, extend_sample_data, rank_primary_key_candidates
+from glossgen.utils.sketches import DistinctCounter
+
+PARQUET_SUFFIXES = ('.parquet', '.pq')
+
+FileSource = Tuple[str, Any]  # (table name, path or binary file object)
+
+# Column types as the glossary shows them, for the dtypes CSV files are read with
+CSV_TYPES = {'boolean': 'BOOLEAN', 'Int64': 'INTEGER', 'float64': 'FLOAT', 'string': 'TEXT'}
+
+
+def _arrow_sql_type(arrow_type: pa.DataType) -> str:
+    if pa.types.is_boolean(arrow_type):
+        return 'BOOLEAN'
+    if pa.types.is_integer(arrow_type):
+        return 'INTEGER'
+    if pa.types.is_floating(arrow_type):
+        return 'FLOAT'
+    if pa.types.is_decimal(arrow_type):
+        return f"DECIMAL({arrow_type.precision}, {arrow_type.scale})"
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return 'TEXT'
+    if pa.types.is_timestamp(arrow_type):
+        return 'TIMESTAMP'
+    if pa.types.is_date(arrow_type):
+        return 'DATE'
+    return str(arrow_type).upper()
+
+
+def _source_name(source: Any) -> str:
+    return source if isinstance(source, str) else getattr(source, 'name', '')
+
+
+def _source_identity(source: Any) -> str:
+    """Path, size and modification time (or upload name and size), so changed files get new cache keys"""
+    if isinstance(source, str):
+        stat = os.stat(source)
+        return f"{os.path.abspath(source)}:{stat.st_size}:{stat.st_mtime_ns}"
+    return f"{_source_name(source)}:{getattr(source, 'size', '')}:{getattr(source, 'file_id', id(source))}"
+
+
+class TableProfile:
+    """Row, null and distinct counts, samples and leading rows of one file, from a single pass"""
+
+    def __init__(self, columns: List[str]):
+        self.rows = 0
+        self.nulls = {column: 0 for column in columns}
+        self.distinct = {
+            column: DistinctCounter(AppConfig.PROFILE_EXACT_DISTINCT_LIMIT, AppConfig.PROFILE_HLL_PRECISION)
+            for column in columns
+        }
+        self.sample_data: Dict[str, List] = {}
+        self.samples_complete = False
+        self.preview = pd.DataFrame(columns=columns)
+
+    def add(self, chunk: pd.DataFrame) -> None:
+        self.rows += len(chunk)
+        for column, nulls in chunk.isnull().sum().items():
+            self.nulls[column] += int(nulls)
+        for column in chunk.columns:
+            self.distinct[column].add(chunk[column])
+        if not self.samples_complete:
+            self.samples_complete = extend_sample_data(self.sample_data, chunk)
+        if len(self.preview) < AppConfig.PROFILE_PREVIEW_ROWS:
+            needed = AppConfig.PROFILE_PREVIEW_ROWS - len(self.preview)
+            self.preview = chunk.head(needed) if self.preview.empty else pd.concat(
+                [self.preview, chunk.head(needed)], ignore_index=True
+            )
+
+    def column_stats(self) -> Dict[str, Dict[str, float]]:
+        # Estimated distinct counts can overshoot the number of values slightly
+        return {
+            column: column_stats_from_counts(
+                self.rows, self.nulls[column], min(counter.count(), self.rows - self.nulls[column])
+            )
+            for column, counter in self.distinct.items()
+        }
+
+
+class FileSchemaExtractor(SchemaExtractor):
+    """
+    SchemaExtractor over CSV and Parquet files instead of a database
+
+    Each file is a table. Column names and types come from the Parquet schema
+    or a typed sample of the CSV; profiling a table reads its file once, in
+    chunks of PROFILE_CHUNK_ROWS rows (Arrow record batches for Parquet), and
+    keeps only counts, distinct-count sketches, samples and the leading rows,
+    so memory does not grow with the file. Previews, glossary tables, primary
+    key inference and relationship scoring are answered from that profile.
+    """
+
+    def __init__(self, sources: List[FileSource], name: str = "files"):
+        self.engine = None
+        self.inspector = None
+        self.default_schema = None
+        self.schemas = [None]
+        self.name = name
+        self.sources = dict(sources)
+        self._dtypes: Dict[str, Dict[str, Any]] = {}
+        self._row_counts: Dict[str, int] = {}
+        self._profiles: Dict[str, TableProfile] = {}
+        self._lock = threading.Lock()
+        # Uploaded files are shared file objects, so reads of one table take turns
+        self._reading = {table: threading.Lock() for table in self.sources}
+
+        self.schema_info = self.extract_schema()
+        self.schema_fingerprint = self.get_schema_fingerprint()
+        self.source_key = "files:" + content_fingerprint(
+            *(f"{table}={_source_identity(self.sources[table])}" for table in sorted(self.sources))
+        )
+        self.connection_id = self.source_key
+
+    def _is_parquet(self, table: str) -> bool:
+        return _source_name(self.sources[table]).lower().endswith(PARQUET_SUFFIXES)
+
+    def _rewind(self, table: str) -> Any:
+        source = self.sources[table]
+        if not isinstance(source, str):
+            source.seek(0)
+        return source
+
+    def extract_schema(self):
+        schema_info = {}
+        for table in self.sources:
+            with self._reading[table]:
+                if self._is_parquet(table):
+                    parquet_file = pq.ParquetFile(self._rewind(table))
+                    self._row_counts[table] = parquet_file.metadata.num_rows
+                    types = {field.name: _arrow_sql_type(field.type) for field in parquet_file.schema_arrow}
+                else:
+                    self._dtypes[table] = infer_dtypes(self._rewind(table))
+                    types = {column: CSV_TYPES[dtype] for column, dtype in self._dtypes[table].items()}
+            columns = [{'name': column, 'type': data_type, 'nullable': True} for column, data_type in types.items()]
+            schema_info[table] = {
+                'columns': columns,
+                'dtypes': types,
+                'primary_key': {'constrained_columns': [], 'name': None},
+                'foreign_keys': [],
+                'indexes': []
+            }
+        return schema_info
+
+    def _iter_chunks(self, table: str, rows: int) -> Iterator[pd.DataFrame]:
+        """The file in DataFrames of up to rows rows; the caller holds the table's read lock"""
+        source = self._rewind(table)
+        if self._is_parquet(table):
+            for batch in pq.ParquetFile(source).iter_batches(batch_size=rows):
+                yield batch.to_pandas()
+            return
+        reader = pd.read_csv(source, dtype=self._dtypes[table], chunksize=rows)
+        try:
+            for chunk in reader:
+                yield chunk
+        finally:
+            reader.close()
+
+    def profile(self, table: str) -> TableProfile:
+        """The table's profile, reading the file once on first use"""
+        with self._reading[table]:
+            with self._lock:
+                if table in self._profiles:
+                    return self._profiles[table]
+            profile = TableProfile([column['name'] for column in self.schema_info[table]['columns']])
+            try:
+                for chunk in self._iter_chunks(table, AppConfig.PROFILE_CHUNK_ROWS):
+                    profile.add(chunk)
+            except (ValueError, TypeError) as e:
+                if self._is_parquet(table):
+                    raise
+                # A value later in a CSV does not fit the type inferred from its sample
+                print(f"Profiling {table} as text: {str(e)}")
+                self._dtypes[table] = {column: 'string' for column in self._dtypes[table]}
+                profile = TableProfile(list(profile.nulls))
+                for chunk in self._iter_chunks(table, AppConfig.PROFILE_CHUNK_ROWS):
+                    profile.add(chunk)
+            with self._lock:
+                self._profiles[table] = profile
+                self._row_counts[table] = profile.rows
+            return profile
+
+    def _read_top_n(self, table, n):
+        with self._lock:
+            profile = self._profiles.get(table)
+        if profile is not None and n <= AppConfig.PROFILE_PREVIEW_ROWS:
+            return bound_frame(profile.preview.head(n))
+        with self._reading[table]:
+            chunks = self._iter_chunks(table, n)
+            try:
+                return bound_frame(next(chunks, pd.DataFrame()).head(n))
+            finally:
+                chunks.close()
+
+    def get_sample_data(self, table, n=5):
+        sample_data = self.profile(table).sample_data
+        return fit_byte_budget({
+            column: [truncate_value(value, AppConfig.SAMPLE_VALUE_MAX_CHARS) for value in values[:n]]
+            for column, values in sample_data.items()
+        })
+
+    def get_null_percentage(self, table):
+        return {column: stats['null_percentage'] for column, stats in self.profile(table).column_stats().items()}
+
+    def get_uniqueness_percentage(self, table):
+        return {column: stats['uniqueness_percentage'] for column, stats in self.profile(table).column_stats().items()}
+
+    def get_table_stats(self):
+        return {table: self.profile(table).rows for table in self.schema_info}
+
+    def estimate_row_counts(self):
+        '''
+        Row counts from Parquet metadata and already profiled files, without reading data.
+        '''
+        with self._lock:
+            return dict(self._row_counts)
+
+    def infer_primary_key(self, table_name):
+        '''
+        Infers the primary key from the profile: the column with the highest
+        primary_key_confidence_score (uniqueness discounted by nulls).
+        '''
+        profile = self.profile(table_name)
+        if profile.rows == 0:
+            return {"error": f"Table {table_name} has no data"}
+        return rank_primary_key_candidates(profile.column_stats())
+
+    def assert_relationship(self, table1, table2, column1, column2):
+        '''
+        Scores a potential foreign key like SchemaExtractor.assert_relationship,
+        with null counts and the distinct values both columns share taken from
+        the profiles instead of a join.
+        '''
+        try:
+            profile1, profile2 = self.profile(table1), self.profile(table2)
+            total = profile1.rows + profile2.rows
+            if total == 0:
+                return 0
+            null_score = 1 - ((profile1.nulls[column1] + profile2.nulls[column2]) / total)
+            distinct1, distinct2 = profile1.distinct[column1], profile2.distinct[column2]
+            coverage_score = distinct1.overlap(distinct2) / distinct1.count() if distinct1.count() > 0 else 0
+            return ((null_score * 0.3) + (coverage_score * 0.7)) * 100
+        except Exception as e:
+            print(f"Error asserting relationship: {str(e)}")
+            return 0
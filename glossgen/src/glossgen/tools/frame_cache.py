@@ -0,0 +1,66 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import pandas as pd
+
+
+class FrameCache:
+    """
+    Thread-safe LRU cache of small DataFrames with a TTL and a memory cap
+
+    Used for table previews and samples, which are requested on every rerun
+    and by every glossary build. Entries expire after ttl seconds, and the
+    least recently used ones are dropped while the cached frames together use
+    more than max_bytes. Callers get copies, since cached frames are shared by
+    every session.
+    """
+
+    def __init__(self, ttl: float, max_bytes: int):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._frames: "OrderedDict[Hashable, Tuple[float, int, pd.DataFrame]]" = OrderedDict()
+        self._bytes = 0
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._frames.get(key)
+            if entry is not None and now - entry[0] < self.ttl:
+                self._frames.move_to_end(key)
+                self.stats['hits'] += 1
+                return entry[2].copy()
+            self.stats['misses'] += 1
+
+        frame = loader()
+        size = int(frame.memory_usage(deep=True).sum())
+        with self._lock:
+            self._discard(key)
+            if size <= self.max_bytes:
+                self._frames[key] = (now, size, frame)
+                self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._discard(next(iter(self._frames)))
+        return frame.copy()
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._frames.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    def clear(self, prefix: Optional[Tuple] = None) -> None:
+        """Drop every frame, or only those whose (tuple) key starts with prefix"""
+        with self._lock:
+            if prefix is None:
+                self._frames.clear()
+                self._bytes = 0
+                return
+            for key in [key for key in self._frames if isinstance(key, tuple) and key[:len(prefix)] == prefix]:
+                self._discard(key)
+
+    def info(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.stats, frames=len(self._frames), bytes=self._bytes)
@@ -0,0 +1,219 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+
+from glossgen.config.app_config import AppConfig
+from glossgen.utils.data_processing import column_stats_from_counts
+from glossgen.utils.sketches import DistinctCounter, HyperLogLog, Reservoir
+
+KeyRange = Tuple[int, int]  # [low, high)
+
+
+class PartitionProfile:
+    """Row and null counts, distinct counters and sample reservoirs of a key range, mergeable"""
+
+    def __init__(self, columns: List[str]):
+        self.rows = 0
+        self.nulls = {column: 0 for column in columns}
+        self.distinct = {
+            column: DistinctCounter(AppConfig.PROFILE_EXACT_DISTINCT_LIMIT, AppConfig.PROFILE_HLL_PRECISION)
+            for column in columns
+        }
+        self.samples = {column: Reservoir(AppConfig.PROFILE_SAMPLE_VALUES) for column in columns}
+
+    def add(self, chunk: pd.DataFrame) -> None:
+        self.rows += len(chunk)
+        for column in chunk.columns:
+            values = chunk[column].dropna()
+            self.nulls[column] += len(chunk) - len(values)
+            self.distinct[column].add(values)
+            self.samples[column].add(values)
+
+    def merge(self, other: "PartitionProfile") -> "PartitionProfile":
+        merged = PartitionProfile([])
+        merged.rows = self.rows + other.rows
+        merged.nulls = {column: self.nulls[column] + other.nulls[column] for column in self.nulls}
+        merged.distinct = {column: self.distinct[column].merge(other.distinct[column]) for column in self.distinct}
+        merged.samples = {column: self.samples[column].merge(other.samples[column]) for column in self.samples}
+        return merged
+
+    def column_stats(self) -> Dict[str, Dict[str, float]]:
+        return {
+            column: column_stats_from_counts(
+                self.rows, self.nulls[column], min(counter.count(), self.rows - self.nulls[column])
+            )
+            for column, counter in self.distinct.items()
+        }
+
+    def sample_data(self) -> Dict[str, List]:
+        return {
+            column: [value.item() if isinstance(value, np.generic) else value for value in reservoir.items]
+            for column, reservoir in self.samples.items()
+        }
+
+
+def partition_key(extractor: Any, table: str) -> Optional[str]:
+    """A single-column integer primary key to split the table on, or SQLite's rowid"""
+    details = extractor.schema_info.get(table, {})
+    key_columns = (details.get('primary_key') or {}).get('constrained_columns') or []
+    if len(key_columns) == 1:
+        key_type = str(details.get('dtypes', {}).get(key_columns[0], '')).upper()
+        if 'INT' in key_type or 'SERIAL' in key_type:
+            return key_columns[0]
+    if extractor.engine.dialect.name == 'sqlite':
+        return 'rowid'
+    return None
+
+
+def key_ranges(conn: Any, table_sql: str, key_sql: str, partitions: int) -> List[KeyRange]:
+    """Split [MIN(key), MAX(key)] into up to partitions equal-width ranges (index-only on a key)"""
+    low, high = conn.execute(text(f"SELECT MIN({key_sql}), MAX({key_sql}) FROM {table_sql}")).fetchone()
+    if low is None:
+        return []
+    low, high = int(low), int(high) + 1
+    step = max(1, -(-(high - low) // partitions))
+    return [(start, min(start + step, high)) for start in range(low, high, step)]
+
+
+def _range_filter(key_sql: str) -> str:
+    return f"{key_sql} >= :low AND {key_sql} < :high"
+
+
+def _profile_range_streamed(
+    conn: Any, table_sql: str, key_sql: str, columns: List[str], key_range: KeyRange
+) -> PartitionProfile:
+    """Read the range's rows in chunks and profile them client-side (any dialect)"""
+    preparer = conn.dialect.identifier_preparer
+    select = ", ".join(preparer.quote(column) for column in columns)
+    profile = PartitionProfile(columns)
+    result = conn.execution_options(stream_results=True, max_row_buffer=AppConfig.PROFILE_CHUNK_ROWS).execute(
+        text(f"SELECT {select} FROM {table_sql} WHERE {_range_filter(key_sql)}"),
+        {'low': key_range[0], 'high': key_range[1]}
+    )
+    for rows in result.partitions(AppConfig.PROFILE_CHUNK_ROWS):
+        profile.add(pd.DataFrame.from_records(rows, columns=columns))
+    return profile
+
+
+def _profile_range_postgresql(
+    conn: Any, table_sql: str, key_sql: str, columns: List[str], key_range: KeyRange
+) -> PartitionProfile:
+    """
+    Profile the range with aggregates computed by PostgreSQL
+
+    Counts come from one COUNT query. Distinct counts come from HyperLogLog
+    registers built server-side: every value is hashed with
+    hashtextextended (PostgreSQL 11+), and the query returns the maximum
+    rank per column and register, at most 2**precision rows per column,
+    instead of the values. Samples are the first values of the range.
+    """
+    preparer = conn.dialect.identifier_preparer
+    quoted = [preparer.quote(column) for column in columns]
+    bounds = {'low': key_range[0], 'high': key_range[1]}
+    where = _range_filter(key_sql)
+    profile = PartitionProfile(columns)
+
+    counts = conn.execute(
+        text(f"SELECT COUNT(*), {', '.join(f'COUNT({column})' for column in quoted)} FROM {table_sql} WHERE {where}"),
+        bounds
+    ).fetchone()
+    profile.rows = int(counts[0])
+    for column, count in zip(columns, counts[1:]):
+        profile.nulls[column] = profile.rows - int(count)
+
+    precision = AppConfig.PROFILE_HLL_PRECISION
+    bits = 64 - precision
+    hashes = ", ".join(
+        f"({index}, hashtextextended(CAST({column} AS text), 0))" for index, column in enumerate(quoted)
+    )
+    # bigint -> bit(n) keeps the rightmost n bits; the rank is the position of their leftmost 1
+    registers = conn.execute(text(f"""
+        SELECT v.i, (v.h >> {bits}) & {(1 << precision) - 1},
+               MAX({bits + 1} - length(ltrim(CAST(CAST(v.h AS bit({bits})) AS text), '0')))
+        FROM {table_sql} CROSS JOIN LATERAL (VALUES {hashes}) AS v(i, h)
+        WHERE {where} AND v.h IS NOT NULL
+        GROUP BY 1, 2
+    """), bounds).fetchall()
+    sketches = [HyperLogLog(precision, hash_name="hashtextextended") for _ in columns]
+    for index, register, rank in registers:
+        sketches[index].registers[register] = rank
+    for column, sketch in zip(columns, sketches):
+        profile.distinct[column] = DistinctCounter.from_sketch(sketch, AppConfig.PROFILE_EXACT_DISTINCT_LIMIT)
+
+    sample_rows = conn.execute(
+        text(f"SELECT {', '.join(quoted)} FROM {table_sql} WHERE {where} LIMIT {AppConfig.PROFILE_SAMPLE_VALUES * 20}"),
+        bounds
+    ).fetchall()
+    sample = pd.DataFrame.from_records(sample_rows, columns=columns)
+    for column in columns:
+        reservoir = profile.samples[column]
+        reservoir.add(sample[column].dropna())
+        # Weight the range by its size when reservoirs are merged
+        reservoir.seen = profile.rows - profile.nulls[column]
+    return profile
+
+
+def _server_side_aggregates(engine: Any) -> bool:
+    return engine.dialect.name == 'postgresql' and (engine.dialect.server_version_info or (0,)) >= (11,)
+
+
+def profile_partitioned(
+    extractor: Any,
+    table: str,
+    partitions: int = AppConfig.PROFILE_PARTITIONS,
+    concurrency: int = AppConfig.PROFILE_PARTITION_CONCURRENCY
+) -> Optional[PartitionProfile]:
+    """
+    Profile a large table as key ranges in parallel and merge the results
+
+    The table's integer key (or rowid) range is split into partitions
+    equal-width ranges, each profiled on its own pooled connection, with at
+    most concurrency ranges in flight so one table cannot take over the
+    source database. Partial results merge exactly for row and null counts,
+    by HyperLogLog union for distinct counts and by weighted reservoir merge
+    for samples. On PostgreSQL 11+ the aggregates are computed server-side;
+    if any range fails there, the whole table is profiled again client-side.
+    Returns None if the table has no usable key.
+    """
+    key = partition_key(extractor, table)
+    if key is None:
+        return None
+    engine = extractor.engine
+    table_sql = extractor.table_sql(table)
+    key_sql = key if key == 'rowid' else engine.dialect.identifier_preparer.quote(key)
+    columns = [column['name'] for column in extractor.schema_info[table]['columns']]
+    try:
+        with engine.connect() as conn:
+            ranges = key_ranges(conn, table_sql, key_sql, partitions)
+    except Exception as e:
+        # e.g. a SQLite WITHOUT ROWID table
+        print(f"Cannot partition {table} on {key}: {str(e)}")
+        return None
+    if not ranges:
+        return PartitionProfile(columns)
+
+    def profile_ranges(profile_range) -> PartitionProfile:
+        def run(key_range: KeyRange) -> PartitionProfile:
+            with engine.connect() as conn:
+                return profile_range(conn, table_sql, key_sql, columns, key_range)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(ranges)))) as executor:
+            futures = [executor.submit(run, key_range) for key_range in ranges]
+            try:
+                return reduce(PartitionProfile.merge, (future.result() for future in futures))
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    # Server-side sketches hash values differently from client-side ones, so
+    # all ranges of a table are profiled the same way
+    if _server_side_aggregates(engine):
+        try:
+            return profile_ranges(_profile_range_postgresql)
+        except Exception as e:
+            print(f"Server-side profiling of {table} failed, reading rows instead: {str(e)}")
+    return profile_ranges(_profile_range_streamed)
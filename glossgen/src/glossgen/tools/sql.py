@@ -1,40 +1,177 @@
+import fnmatch
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from sqlalchemy import inspect, text
 import pandas as pd
 
+from glossgen.config.app_config import AppConfig
+from glossgen.tools.bounded_samples import bound_frame, bounded_select, fit_byte_budget, truncate_value
+from glossgen.tools.frame_cache import FrameCache
+from glossgen.tools.partitioned_profiler import profile_partitioned
+from glossgen.utils.data_processing import rank_primary_key_candidates
 from glossgen.utils.utils import process_response, process_sample_data_column, glossary_dict_to_df
 
+# Previews and samples shared by all extractors (and so all sessions) in the process
+preview_cache = FrameCache(AppConfig.PREVIEW_CACHE_TTL, AppConfig.PREVIEW_CACHE_MAX_BYTES)
+
+# Catalog and role schemas that never hold user tables
+SYSTEM_SCHEMAS = [
+    'information_schema', 'pg_catalog', 'pg_toast', 'pg_temp_*', 'pg_toast_temp_*',
+    'sys', 'guest', 'db_*'
+]
+
 class SchemaExtractor:
-    def __init__(self, engine):
+    def __init__(self, engine, include_schemas=None, exclude_schemas=None):
         self.engine = engine
-        self.connection = self.engine.connect()
+        # Extractors are shared across sessions (see SharedResourceCache), so
+        # queries check out a pooled connection per call instead of holding one
         self.inspector = inspect(self.engine)
+        self.default_schema = self.inspector.default_schema_name
+        self.schemas = self.discover_schemas(
+            AppConfig.SCHEMA_INCLUDE if include_schemas is None else include_schemas,
+            AppConfig.SCHEMA_EXCLUDE if exclude_schemas is None else exclude_schemas
+        )
 
         self.schema_info = self.extract_schema()
+        self.schema_fingerprint = self.get_schema_fingerprint()
+        self._lock = threading.Lock()
+        self._row_estimates = None
+        # Samples of tables profiled in partitions, used for their glossaries
+        self._partition_samples = {}
+        # Identifies the connection (credentials included) in shared cache keys
+        self.connection_id = hashlib.sha256(
+            self.engine.url.render_as_string(hide_password=False).encode('utf-8')
+        ).hexdigest()[:16]
+
+    def get_schema_fingerprint(self):
+        '''
+        Returns a short hash of the reflected tables, column names and types.
+        '''
+        layout = {
+            table: [[column['name'], str(column['type'])] for column in details['columns']]
+            for table, details in self.schema_info.items()
+        }
+        return hashlib.sha256(json.dumps(layout, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+    def discover_schemas(self, include, exclude):
+        '''
+        Returns the schemas to reflect: None for the default schema, then the
+        names of the other schemas matching an include pattern (all if none
+        are given) and no exclude pattern. Patterns are shell-style and
+        case-insensitive, e.g. "staging_*". Only dialects listed in
+        MULTI_SCHEMA_DIALECTS look beyond the default schema; for MySQL every
+        schema is a separate database.
+        '''
+        def matches(schema, patterns):
+            return any(fnmatch.fnmatch(schema.lower(), pattern.lower()) for pattern in patterns)
+
+        def selected(schema):
+            return (not include or matches(schema, include)) and not matches(schema, list(exclude) + SYSTEM_SCHEMAS)
+
+        default = self.default_schema
+        schemas = [None] if default is None or selected(default) else []
+        if self.engine.dialect.name not in AppConfig.MULTI_SCHEMA_DIALECTS:
+            return schemas
+        return schemas + sorted(
+            schema for schema in self.inspector.get_schema_names()
+            if schema != default and selected(schema)
+        )
+
+    def qualified_name(self, schema, table_name):
+        '''
+        Returns the schema_info key of a table: the bare name in the default
+        schema, schema.table elsewhere.
+        '''
+        if schema is None or schema == self.default_schema:
+            return table_name
+        return f"{schema}.{table_name}"
+
+    def table_sql(self, table):
+        '''
+        Returns the table's name for use in SQL, schema-qualified and quoted where needed.
+        '''
+        details = self.schema_info.get(table, {})
+        preparer = self.engine.dialect.identifier_preparer
+        name = preparer.quote(details.get('name', table))
+        schema = details.get('schema')
+        return f"{preparer.quote_schema(schema)}.{name}" if schema else name
 
     def extract_schema(self):
+        '''
+        Reflects the tables of every selected schema, one schema per worker
+        thread, with the bulk get_multi_* inspector calls (one catalog query
+        per kind of object and schema on PostgreSQL and SQL Server).
+        '''
         schema_info = {}
-        for table_name in self.inspector.get_table_names():
-            columns = self.inspector.get_columns(table_name)
-            schema_info[table_name] = {
-                'columns': columns,
-                'dtypes': {column['name']: column['type'] for column in columns},
-                'primary_key': self.inspector.get_pk_constraint(table_name),
-                'foreign_keys': self.inspector.get_foreign_keys(table_name),
-                'indexes': self.inspector.get_indexes(table_name)
-            }
+        workers = max(1, min(AppConfig.REFLECTION_MAX_WORKERS, len(self.schemas)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for tables in executor.map(self._reflect_schema, self.schemas):
+                schema_info.update(tables)
         return schema_info
 
+    def _reflect_schema(self, schema):
+        # Inspectors cache what they reflect and are not shared across threads
+        inspector = inspect(self.engine)
+        columns = inspector.get_multi_columns(schema=schema)
+        primary_keys = inspector.get_multi_pk_constraint(schema=schema)
+        foreign_keys = inspector.get_multi_foreign_keys(schema=schema)
+        indexes = inspector.get_multi_indexes(schema=schema)
+
+        tables = {}
+        for key in sorted(columns, key=lambda key: key[1]):
+            table_name = key[1]
+            tables[self.qualified_name(schema, table_name)] = {
+                'schema': schema,
+                'name': table_name,
+                'columns': columns[key],
+                'dtypes': {column['name']: column['type'] for column in columns[key]},
+                'primary_key': primary_keys.get(key, {}),
+                'foreign_keys': foreign_keys.get(key, []),
+                'indexes': indexes.get(key, [])
+            }
+        return tables
+
     def get_top_n_dataframe(self, table, n=5):
         try:
-            if self.engine.dialect.name == 'mssql':
-                return pd.read_sql(
-                    f"SELECT TOP {n} * FROM {table}", self.connection)
-            else:
-                return pd.read_sql(
-                    f"SELECT * FROM {table} LIMIT {n}", self.connection)
+            return self.get_preview(table, n)
         except Exception as e:
             return pd.DataFrame(data=[["Error"]])
 
+    def get_preview(self, table, n=5):
+        '''
+        Returns the first n rows of a table, cached by table, row count and schema
+        fingerprint for PREVIEW_CACHE_TTL seconds. Raises on query errors, which
+        are not cached.
+        '''
+        key = (self.connection_id, self.schema_fingerprint, table, n)
+        return preview_cache.get_or_load(key, lambda: self._read_top_n(table, n))
+
+    def _read_top_n(self, table, n):
+        '''
+        Reads the first n rows with the columns projected by bounded_select:
+        long text is cut by the database and binaries and geometries are
+        summarized, so previews stay small however wide the rows are.
+        '''
+        query, projections = bounded_select(
+            self.engine, self.table_sql(table), self.schema_info.get(table, {}).get('columns', []), n
+        )
+        with self.engine.connect() as conn:
+            try:
+                return bound_frame(pd.read_sql(query, conn), projections)
+            except Exception as e:
+                # e.g. a geometry column without the spatial functions installed
+                print(f"Bounded preview of {table} failed, reading whole rows: {str(e)}")
+                conn.rollback()
+            if self.engine.dialect.name == 'mssql':
+                return bound_frame(pd.read_sql(
+                    f"SELECT TOP {n} * FROM {self.table_sql(table)}", conn))
+            else:
+                return bound_frame(pd.read_sql(
+                    f"SELECT * FROM {self.table_sql(table)} LIMIT {n}", conn))
+
     def get_top_n_dataframe_for_all_tables(self, n=5):
         all_tables_top_n_data = {}
         for table, _ in self.schema_info.items():
@@ -52,7 +189,7 @@ class SchemaExtractor:
         try:
             with self.engine.connect() as conn:
                 # Get total row count
-                count_query = text(f"SELECT COUNT(*) FROM {table}")
+                count_query = text(f"SELECT COUNT(*) FROM {self.table_sql(table)}")
                 total_rows = conn.execute(count_query).scalar()
                 
                 if total_rows == 0:
@@ -61,7 +198,7 @@ class SchemaExtractor:
                 # Calculate null percentage for each column
                 for column in details.get('columns', []):
                     try:
-                        null_query = text(f"SELECT COUNT(*) FROM {table} WHERE {column['name']} IS NULL")
+                        null_query = text(f"SELECT COUNT(*) FROM {self.table_sql(table)} WHERE {column['name']} IS NULL")
                         null_count = conn.execute(null_query).scalar()
                         null_percentage = (null_count / total_rows) * 100 if total_rows > 0 else 0
                         column_stats[f"{column['name']}"] = null_percentage
@@ -85,7 +222,7 @@ class SchemaExtractor:
         try:
             with self.engine.connect() as conn:
                 # Get total row count
-                count_query = text(f"SELECT COUNT(*) FROM {table}")
+                count_query = text(f"SELECT COUNT(*) FROM {self.table_sql(table)}")
                 total_rows = conn.execute(count_query).scalar()
                 
                 if total_rows == 0:
@@ -94,7 +231,7 @@ class SchemaExtractor:
                 # Calculate uniqueness percentage for each column
                 for column in details.get('columns', []):
                     try:
-                        unique_query = text(f"SELECT COUNT(DISTINCT {column['name']}) FROM {table}")
+                        unique_query = text(f"SELECT COUNT(DISTINCT {column['name']}) FROM {self.table_sql(table)}")
                         unique_count = conn.execute(unique_query).scalar()
                         unique_percentage = (unique_count / total_rows) * 100 if total_rows > 0 else 0
                         column_stats[f"{column['name']}"] = unique_percentage
@@ -112,7 +249,7 @@ class SchemaExtractor:
         '''
         Returns the count, mean, min, and max for each numeric column in all tables in the database.
         '''
-        schema_info = self.extract_schema()
+        schema_info = self.schema_info
         table_stats = {}
         for table in schema_info.keys():
             table_stats[table] = self.get_column_null_stats(table)
@@ -122,7 +259,7 @@ class SchemaExtractor:
         '''
         Returns the percentage of unique values for each column in all tables in the database.
         '''
-        schema_info = self.extract_schema()
+        schema_info = self.schema_info
         table_stats = {}
         for table in schema_info.keys():
             table_stats[table] = self.get_column_uniqueness_stats(table)
@@ -133,23 +270,31 @@ class SchemaExtractor:
         Returns a query to get a sample of n rows from a specified table in the database.
         '''
         if self.engine.dialect.name == 'sqlite':
-            sample_data_query = f"SELECT * FROM {table} ORDER BY RANDOM() LIMIT {n}"
+            sample_data_query = f"SELECT * FROM {self.table_sql(table)} ORDER BY RANDOM() LIMIT {n}"
         elif self.engine.dialect.name == 'mysql':
-            sample_data_query = f"SELECT * FROM {table} ORDER BY RAND() LIMIT {n}"
+            sample_data_query = f"SELECT * FROM {self.table_sql(table)} ORDER BY RAND() LIMIT {n}"
         elif self.engine.dialect.name == 'postgresql':
-            sample_data_query = f"SELECT * FROM {table} ORDER BY RANDOM() LIMIT {n}"
+            sample_data_query = f"SELECT * FROM {self.table_sql(table)} ORDER BY RANDOM() LIMIT {n}"
         elif self.engine.dialect.name == 'mssql':
-            sample_data_query = f"SELECT TOP {n} * FROM {table} ORDER BY NEWID()"
+            sample_data_query = f"SELECT TOP {n} * FROM {self.table_sql(table)} ORDER BY NEWID()"
         return sample_data_query
 
     def get_sample_data(self, table, n=5):
         '''
         Returns a sample of n rows from a specified table in the database.
-        '''
+        The sample is the cached table preview, so building a glossary does not
+        query rows the Database tab has already shown. Values are bounded as in
+        the preview and shrunk to SAMPLE_TABLE_MAX_BYTES per table.
+        '''
+        with self._lock:
+            samples = self._partition_samples.get(table)
+        if samples is not None:
+            return fit_byte_budget({
+                column: [truncate_value(value, AppConfig.SAMPLE_VALUE_MAX_CHARS) for value in values[:n]]
+                for column, values in samples.items()
+            })
         try:
-            query = self.get_sample_data_query(table, n)
-            df = pd.read_sql(query, self.connection)
-            return df.to_dict(orient='list')
+            return fit_byte_budget(self.get_preview(table, n).to_dict(orient='list'))
         except Exception as e:
             print(e)
             return "Error"
@@ -158,7 +303,7 @@ class SchemaExtractor:
         '''
         Returns a sample of n rows from all tables in the database.
         '''
-        schema_info = self.extract_schema()
+        schema_info = self.schema_info
         all_sample_data = {}
         for table, details in schema_info.items():
             all_sample_data[table] = self.get_sample_data(table, n)
@@ -168,14 +313,88 @@ class SchemaExtractor:
         '''
         Returns the count of rows in each table in the database.
         '''
-        schema_info = self.extract_schema()
         table_stats = {}
-        for table, details in schema_info.items():
-            table_stats[table] = self.connection.execute(text(
-                f"SELECT COUNT(*) FROM {table}"
-            )).fetchone()[0]
+        with self.engine.connect() as conn:
+            for table in self.schema_info.keys():
+                table_stats[table] = conn.execute(text(
+                    f"SELECT COUNT(*) FROM {self.table_sql(table)}"
+                )).fetchone()[0]
         return table_stats
 
+    def estimate_row_counts(self):
+        '''
+        Returns approximate row counts per table from the database's own statistics,
+        without scanning tables. Tables without statistics are left out.
+        '''
+        dialect = self.engine.dialect.name
+        queries = {
+            'postgresql': "SELECT n.nspname, c.relname, c.reltuples FROM pg_class c "
+                          "JOIN pg_namespace n ON n.oid = c.relnamespace WHERE c.relkind IN ('r', 'p')",
+            'mysql': "SELECT table_schema, table_name, table_rows FROM information_schema.tables "
+                     "WHERE table_schema = DATABASE()",
+            'mssql': "SELECT s.name, t.name, SUM(p.rows) FROM sys.tables t "
+                     "JOIN sys.schemas s ON t.schema_id = s.schema_id JOIN sys.partitions p "
+                     "ON t.object_id = p.object_id AND p.index_id IN (0, 1) GROUP BY s.name, t.name",
+            'sqlite': "SELECT NULL, tbl, stat FROM sqlite_stat1",
+        }
+        if dialect not in queries:
+            return {}
+        estimates = {}
+        try:
+            with self.engine.connect() as conn:
+                if dialect == 'sqlite' and conn.execute(text(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+                )).scalar() is None:
+                    # sqlite_stat1 only exists after ANALYZE
+                    return {}
+                for schema, name, value in conn.execute(text(queries[dialect])).fetchall():
+                    if dialect == 'sqlite':
+                        # stat is "<rows> <rows per distinct index prefix> ..."
+                        value = str(value).split(' ')[0]
+                    table = self.qualified_name(schema, name)
+                    if table in self.schema_info and value is not None and float(value) >= 0:
+                        estimates[table] = max(estimates.get(table, 0), int(float(value)))
+        except Exception as e:
+            print(f"Row count estimates unavailable: {str(e)}")
+        return estimates
+
+    def row_count_estimate(self, table):
+        '''
+        Returns the table's estimated row count (None if unknown); the estimates are read once per extractor.
+        '''
+        with self._lock:
+            estimates = self._row_estimates
+        if estimates is None:
+            estimates = self.estimate_row_counts()
+            with self._lock:
+                self._row_estimates = estimates
+        return estimates.get(table)
+
+    def clear_cached_profiles(self):
+        '''
+        Forgets row count estimates and samples of partition-profiled tables, so
+        they are read again after the schema or data changed.
+        '''
+        with self._lock:
+            self._row_estimates = None
+            self._partition_samples.clear()
+
+    def profile_partitioned(self, table):
+        '''
+        Profiles a table of at least PROFILE_PARTITION_MIN_ROWS estimated rows
+        in parallel key ranges (see tools/partitioned_profiler.py). Returns None
+        for smaller tables and tables without an integer key, which are
+        profiled with one query per statistic as before.
+        '''
+        estimate = self.row_count_estimate(table)
+        if estimate is None or estimate < AppConfig.PROFILE_PARTITION_MIN_ROWS:
+            return None
+        profile = profile_partitioned(self, table)
+        if profile is not None:
+            with self._lock:
+                self._partition_samples[table] = profile.sample_data()
+        return profile
+
     def generate_schema_table_for_table(self, table):
         '''
         Generates a schema table in JSON format for a specific table based on the outputs of the get_** functions.
@@ -183,6 +402,8 @@ class SchemaExtractor:
         '''
         schema_info = self.schema_info.get(table, {})
         schema_table = []
+        # Inferred first: large tables are profiled in partitions, which also collects their samples
+        df_primary_key_inferred = self.infer_primary_key(table)
         sample_data = self.get_sample_data(table)
         for column in schema_info.get('columns', []):
             column_info = {
@@ -194,7 +415,6 @@ class SchemaExtractor:
             }
             schema_table.append(column_info)
 
-        df_primary_key_inferred = self.infer_primary_key(table)
         df_schema_table = glossary_dict_to_df(schema_table)
         df_schema_table = df_schema_table.merge(df_primary_key_inferred, on='column_name', how='left')
         column_order = ['column_name', 'data_type', 'is_primary_key', 'sample_data', 'description', 'comments', 'uniqueness_percentage', 'null_percentage', 'primary_key_confidence_score']
@@ -207,7 +427,7 @@ class SchemaExtractor:
         Generates a schema table in JSON format for all tables based on the outputs of the get_** functions.
         Each row corresponds to each column of the original table.
         '''
-        schema_info = self.extract_schema()
+        schema_info = self.schema_info
         all_schema_tables = {}
         for table in schema_info.keys():
             all_schema_tables[table] = self.generate_schema_table_for_table(
@@ -234,12 +454,18 @@ class SchemaExtractor:
             columns = [col['name'] for col in self.schema_info.get(table_name, {}).get('columns', [])]
             if not columns:
                 return {"error": f"No columns found for table {table_name}"}
+
+            profile = self.profile_partitioned(table_name)
+            if profile is not None:
+                if profile.rows == 0:
+                    return {"error": f"Table {table_name} has no data"}
+                return rank_primary_key_candidates(profile.column_stats())
             
             results = {}
             
             with self.engine.connect() as conn:
                 # Get total row count
-                count_query = text(f"SELECT COUNT(*) FROM {table_name}")
+                count_query = text(f"SELECT COUNT(*) FROM {self.table_sql(table_name)}")
                 total_rows = conn.execute(count_query).scalar()
                 
                 if total_rows == 0:
@@ -251,12 +477,12 @@ class SchemaExtractor:
                         column_results = {}
                         
                         # Check for null values
-                        null_query = text(f"SELECT COUNT(*) FROM {table_name} WHERE {column} IS NULL")
+                        null_query = text(f"SELECT COUNT(*) FROM {self.table_sql(table_name)} WHERE {column} IS NULL")
                         null_count = conn.execute(null_query).scalar()
                         column_results["null_percentage"] = (null_count / total_rows) * 100
                         
                         # Check for uniqueness
-                        unique_query = text(f"SELECT COUNT(DISTINCT {column}) FROM {table_name}")
+                        unique_query = text(f"SELECT COUNT(DISTINCT {column}) FROM {self.table_sql(table_name)}")
                         unique_count = conn.execute(unique_query).scalar()
                         column_results["uniqueness_percentage"] = (unique_count / total_rows) * 100
                         
@@ -307,7 +533,7 @@ class SchemaExtractor:
         '''
         Infers the primary key for all tables in the database.
         '''
-        schema_info = self.extract_schema()
+        schema_info = self.schema_info
         primary_key_stats = {}  
         for table in schema_info.keys():
             primary_key_stats[table] = self.infer_primary_key(table)
@@ -373,10 +599,10 @@ class SchemaExtractor:
                 # Check for null values
                 null_query = text(f"""
                     SELECT 
-                        (SELECT COUNT(*) FROM {table1} WHERE {column1} IS NULL) as nulls1,
-                        (SELECT COUNT(*) FROM {table2} WHERE {column2} IS NULL) as nulls2,
-                        (SELECT COUNT(*) FROM {table1}) as total1,
-                        (SELECT COUNT(*) FROM {table2}) as total2
+                        (SELECT COUNT(*) FROM {self.table_sql(table1)} WHERE {column1} IS NULL) as nulls1,
+                        (SELECT COUNT(*) FROM {self.table_sql(table2)} WHERE {column2} IS NULL) as nulls2,
+                        (SELECT COUNT(*) FROM {self.table_sql(table1)}) as total1,
+                        (SELECT COUNT(*) FROM {self.table_sql(table2)}) as total2
                 """)
                 null_results = conn.execute(null_query).fetchone()
                 null_score = 1 - ((null_results[0] + null_results[1]) / (null_results[2] + null_results[3]))
@@ -385,9 +611,9 @@ class SchemaExtractor:
                 join_query = text(f"""
                     SELECT 
                         COUNT(DISTINCT t1.{column1}) as matched,
-                        (SELECT COUNT(DISTINCT {column1}) FROM {table1}) as total
-                    FROM {table1} t1
-                    INNER JOIN {table2} t2 ON t1.{column1} = t2.{column2}
+                        (SELECT COUNT(DISTINCT {column1}) FROM {self.table_sql(table1)}) as total
+                    FROM {self.table_sql(table1)} t1
+                    INNER JOIN {self.table_sql(table2)} t2 ON t1.{column1} = t2.{column2}
                 """)
                 join_results = conn.execute(join_query).fetchone()
                 coverage_score = join_results[0] / join_results[1] if join_results[1] > 0 else 0
@@ -401,14 +627,47 @@ class SchemaExtractor:
             print(f"Error asserting relationship: {str(e)}")
             return 0
 
+    def get_declared_relationships(self, table1, table2):
+        '''
+        Returns the foreign keys declared between two tables, in either
+        direction and across schemas, with a confidence of 100.
+        '''
+        relationships = []
+        for source, target in ((table1, table2), (table2, table1)):
+            details = self.schema_info.get(source, {})
+            for fk in details.get('foreign_keys', []):
+                # A foreign key without referred_schema points into the table's own schema
+                referred = self.qualified_name(
+                    fk.get('referred_schema') or details.get('schema'), fk.get('referred_table')
+                )
+                if referred != target:
+                    continue
+                for column1, column2 in zip(fk.get('constrained_columns', []), fk.get('referred_columns', [])):
+                    relationships.append({
+                        'table1': source,
+                        'column1': column1,
+                        'table2': target,
+                        'column2': column2,
+                        'confidence': 100.0
+                    })
+        return relationships
+
     def get_relationship_matrix_for_two_tables(self, table1, table2, potential_fks=None):
         '''
         Returns a relationship matrix for two tables with confidence scores for potential foreign keys.
+        Declared foreign keys are included and take precedence over inferred ones.
         '''
         if potential_fks is None:
             potential_fks = self.get_potential_foreign_keys(table1, table2)
 
-        relationships = []
+        relationships = self.get_declared_relationships(table1, table2)
+        # Either direction of a declared key is the same relationship
+        declared = {(r['table1'], r['column1'], r['table2'], r['column2']) for r in relationships}
+        declared |= {(table2, column2, table1, column1) for table1, column1, table2, column2 in declared}
+        potential_fks = [
+            fk for fk in potential_fks
+            if (fk['table1'], fk['column1'], fk['table2'], fk['column2']) not in declared
+        ]
         for fk in potential_fks:
             confidence = self.assert_relationship(
                 fk['table1'], fk['table2'],
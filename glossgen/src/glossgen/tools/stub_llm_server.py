@@ -0,0 +1,176 @@
+"""
+Local OpenAI-compatible stub server for exercising the LLM call layer.
+
+Serves POST /v1/chat/completions and injects throttling (429 with Retry-After),
+server errors (503) and latency at configurable rates, so retries, adaptive
+concurrency and circuit breaking can be observed without calling a real API.
+
+Run standalone and point the "OpenAI Compatible" provider at it:
+
+    python -m glossgen.tools.stub_llm_server --port 8999 --throttle-rate 0.3
+
+or use StubLLMServer as a context manager from a script or test.
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+
+
+class StubLLMServer:
+    """Threaded OpenAI-compatible chat completions stub with fault injection"""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        throttle_rate: float = 0.0,
+        error_rate: float = 0.0,
+        retry_after: float = 1.0,
+        latency: float = 0.0,
+        max_concurrency: Optional[int] = None,
+        response_content: str = "[]",
+        seed: Optional[int] = None
+    ):
+        self.throttle_rate = throttle_rate
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.latency = latency
+        self.max_concurrency = max_concurrency
+        self.response_content = response_content
+        self.random = random.Random(seed)
+        self.stats: Dict[str, int] = {'requests': 0, 'throttled': 0, 'errors': 0, 'ok': 0}
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to use as the OpenAI-compatible endpoint"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def _decide(self) -> str:
+        """Pick the outcome of the next request"""
+        with self._lock:
+            self.stats['requests'] += 1
+            over_capacity = (
+                self.max_concurrency is not None and self._in_flight >= self.max_concurrency
+            )
+            roll = self.random.random()
+            if over_capacity or roll < self.throttle_rate:
+                self.stats['throttled'] += 1
+                return 'throttle'
+            if roll < self.throttle_rate + self.error_rate:
+                self.stats['errors'] += 1
+                return 'error'
+            self.stats['ok'] += 1
+            self._in_flight += 1
+            return 'ok'
+
+    def _completion(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'id': f"stub-{self.stats['requests']}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': body.get('model', 'stub'),
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': self.response_content},
+                'finish_reason': 'stop'
+            }],
+            'usage': {'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0}
+        }
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, status: int, payload: Dict, headers: Optional[Dict] = None):
+                data = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                body = json.loads(self.rfile.read(length) or b'{}')
+
+                outcome = stub._decide()
+                if outcome == 'throttle':
+                    self._send_json(
+                        429,
+                        {'error': {'message': 'Rate limit exceeded', 'type': 'rate_limit_error'}},
+                        {'Retry-After': f"{stub.retry_after:g}"}
+                    )
+                    return
+                if outcome == 'error':
+                    self._send_json(503, {'error': {'message': 'Service unavailable'}})
+                    return
+
+                try:
+                    if stub.latency:
+                        time.sleep(stub.latency)
+                    self._send_json(200, stub._completion(body))
+                finally:
+                    with stub._lock:
+                        stub._in_flight -= 1
+
+        return Handler
+
+    def start(self) -> "StubLLMServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="OpenAI-compatible stub server with fault injection")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8999)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--max-concurrency", type=int, default=None)
+    args = parser.parse_args()
+
+    server = StubLLMServer(
+        host=args.host,
+        port=args.port,
+        throttle_rate=args.throttle_rate,
+        error_rate=args.error_rate,
+        retry_after=args.retry_after,
+        latency=args.latency,
+        max_concurrency=args.max_concurrency
+    )
+    print(f"Stub LLM server listening on {server.url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
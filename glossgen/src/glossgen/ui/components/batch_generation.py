@@ -0,0 +1,116 @@
+import streamlit as st
+
+from glossgen.config.app_config import AppConfig
+from glossgen.chains.glossary_chain import GlossaryChain, TableDescriptionChain
+from glossgen.services.batch_jobs import (
+    BatchJob,
+    GLOSSARY_PHASE,
+    DESCRIPTION_PHASE,
+    start_local_worker,
+    stop_local_worker,
+    is_worker_running,
+)
+from glossgen.services.llm_router import GenerationRouter
+from glossgen.services.single_flight import profile_table
+from glossgen.state.session_state import SessionState
+
+
+class BatchGenerationPanel:
+    """Manages the offline batch generation UI in the sidebar"""
+
+    def __init__(self):
+        self.config = AppConfig()
+
+    def render(self) -> None:
+        """Render the batch generation section"""
+        with st.expander("Batch Generation (offline)"):
+            st.caption(
+                "Write all prompts for this database to a batch request file, process it with "
+                "the provider's batch API or the local worker, then merge the results."
+            )
+            if st.button("Create Batch Job"):
+                self._create_job()
+
+            jobs = BatchJob.list_jobs(st.session_state['db_name'])
+            if not jobs:
+                return
+
+            job_ids = [job.job_id for job in jobs]
+            selected = st.selectbox("Batch Job", job_ids, key='selected_batch_job')
+            self._render_job(jobs[job_ids.index(selected)])
+
+    def _create_job(self) -> None:
+        """Profile every table and write the glossary request file"""
+        with st.spinner("Writing batch requests..."):
+            schema_tables = {}
+            for table in st.session_state['tables']:
+                try:
+                    schema_tables[table] = profile_table(st.session_state['extractor'], table)
+                except Exception as e:
+                    st.warning(f"Skipped {table}: {str(e)}")
+
+            job = BatchJob.create(
+                st.session_state['db_name'],
+                schema_tables,
+                GlossaryChain(),
+                SessionState.get_ai_settings()['model'] or self.config.DEFAULT_MODEL
+            )
+        st.success(f"Batch job {job.job_id} created with {len(schema_tables)} requests.")
+
+    def _render_job(self, job: BatchJob) -> None:
+        """Render status and actions for one job"""
+        progress = job.progress()
+        running = is_worker_running(job.job_id)
+        st.write(
+            f"Phase: **{job.phase}** · {progress['completed']}/{progress['total']} completed"
+            + (" · worker running" if running else "")
+        )
+        if progress['total']:
+            st.progress(progress['completed'] / progress['total'])
+
+        if job.phase in (GLOSSARY_PHASE, DESCRIPTION_PHASE):
+            with open(job.request_file(), 'rb') as request_file:
+                st.download_button(
+                    label="Download Request File (JSONL)",
+                    data=request_file,
+                    file_name=f"{job.job_id}_{job.phase}_requests.jsonl",
+                    mime="application/jsonl"
+                )
+
+            uploaded = st.file_uploader(
+                "Import provider results (JSONL)", type=["jsonl"], key=f"batch_results_{job.job_id}"
+            )
+            if uploaded and st.button("Import Results"):
+                imported = job.import_results(uploaded.getvalue().splitlines())
+                st.success(f"Imported {imported} results.")
+
+            col1, col2 = st.columns(2)
+            with col1:
+                if not running and progress['completed'] < progress['total'] and st.button("Run Local Worker"):
+                    start_local_worker(job, GenerationRouter.from_session(temperature=0.2))
+                    st.info("Local worker started. Progress is saved as results arrive.")
+            with col2:
+                if running and st.button("Stop Worker"):
+                    stop_local_worker(job.job_id)
+            if running and st.button("Refresh Progress"):
+                st.rerun()
+
+        if job.phase == GLOSSARY_PHASE and progress['completed'] and st.button("Merge Glossaries"):
+            counts = job.merge_glossaries(st.session_state['glossary_dicts'])
+            st.success(
+                f"Merged {counts['tables']} glossaries "
+                f"({counts['missing_columns']} columns without a description)."
+            )
+            if progress['completed'] < progress['total']:
+                st.info("Some glossary requests are still pending; merge again once they complete.")
+                return
+            written = job.prepare_descriptions(
+                st.session_state['glossary_dicts'],
+                st.session_state['relationship_matrix'].to_json(),
+                TableDescriptionChain()
+            )
+            st.info(f"Wrote {written} table description requests.")
+
+        if job.phase == DESCRIPTION_PHASE and progress['completed'] and st.button("Merge Descriptions"):
+            merged = job.merge_descriptions(st.session_state['table_descriptions'])
+            st.success(f"Merged {merged} table descriptions.")
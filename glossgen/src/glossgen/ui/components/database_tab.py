@@ -6,6 +6,12 @@ from glossgen.config.app_config import AppConfig
 from glossgen.state.session_state import SessionState
 from glossgen.services.database import DatabaseService
 from sqlalchemy import text
+
+from glossgen.services.query_runner import run_query_job, PAGE_RESULT
+from glossgen.ui.components.job_progress import JobProgress
+
+QUERY_JOB = "sql_query"
+
 class DatabaseTab:
     """Manages the database tab UI components"""
     
@@ -20,7 +26,9 @@ class DatabaseTab:
         
         self._render_table_list()
         self._render_table_preview()
-        self._render_sql_query_box()
+        # Files profiled without a database cannot be queried
+        if st.session_state['engine'] is not None:
+            self._render_sql_query_box()
         # self._render_analysis_buttons()
     
     def _render_table_list(self) -> None:
@@ -36,6 +44,7 @@ class DatabaseTab:
         )
         
         if self.selected_table:
+            SessionState.add_recent_table(self.selected_table)
             st.write("Table Sample Data")
             sample_df = st.session_state['extractor'].get_top_n_dataframe(
                 self.selected_table,
@@ -85,9 +94,56 @@ class DatabaseTab:
         """Render the SQL query box"""
         st.write("SQL Query Box")
         sql_query = st.text_area("SQL Query", value=f"SELECT * FROM {self.selected_table}")
-        if st.button("Execute SQL Query"):
-            with st.session_state['engine'].connect() as conn:
-                result = conn.execute(text(sql_query)).fetchall()
-                result_df = pd.DataFrame(result)
-                st.spinner("Executing SQL Query...")
-            st.dataframe(result_df)
+        st.caption(
+            f"Results are fetched in pages of {self.config.QUERY_PAGE_SIZE:,} rows and capped at "
+            f"{self.config.QUERY_MAX_ROWS:,} rows; queries time out after {self.config.QUERY_TIMEOUT:g}s."
+        )
+        progress = JobProgress(QUERY_JOB)
+        if st.button("Execute SQL Query", disabled=progress.running):
+            JobProgress.submit(
+                QUERY_JOB,
+                run_query_job,
+                "Running query",
+                engine=st.session_state['engine'],
+                sql=sql_query
+            )
+            st.session_state['query_page'] = 0
+            progress = JobProgress(QUERY_JOB)
+        
+        progress.render()
+        if progress.job is not None:
+            self._render_query_results(progress)
+    
+    def _render_query_results(self, progress: JobProgress) -> None:
+        """Render one page of the query results with navigation"""
+        job = progress.job
+        pages = sorted(key for key in job.snapshot_results() if key.startswith(PAGE_RESULT))
+        summary = job.result if job.finished else None
+        if summary and summary['rowcount'] is not None:
+            st.success(f"Statement executed ({summary['rowcount']} rows affected, not committed).")
+            return
+        if not pages:
+            if job.finished and summary:
+                st.info("The query returned no rows.")
+            return
+        
+        page = min(st.session_state.get('query_page', 0), len(pages) - 1)
+        col1, col2, col3 = st.columns([1, 4, 1])
+        with col1:
+            if st.button("Previous", disabled=page == 0):
+                page -= 1
+        with col3:
+            if st.button("Next", disabled=page >= len(pages) - 1):
+                page += 1
+        st.session_state['query_page'] = page
+        
+        page_df = job.results[pages[page]]
+        first_row = page * self.config.QUERY_PAGE_SIZE + 1
+        with col2:
+            status = f"Rows {first_row:,}–{first_row + len(page_df) - 1:,} of {job.completed:,}"
+            if not job.finished:
+                status += " (still fetching)"
+            elif summary and summary['truncated']:
+                status += f" (stopped at the {summary['truncated']})"
+            st.write(status)
+        st.dataframe(page_df)
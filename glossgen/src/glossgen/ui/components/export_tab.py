@@ -6,6 +6,9 @@ from glossgen.config.app_config import AppConfig
 from glossgen.state.session_state import SessionState
 from glossgen.services.database import DatabaseService
 from glossgen.chains.glossary_chain import TableDescriptionChain
+from glossgen.services.exporters import ExportCache, write_chunks
+from glossgen.services.markdown_renderer import DocumentationRenderer
+from glossgen.services.project_store import PROJECT_SUFFIX, project_archive_writer, project_directory, save_project
 
 class ExportTab:
     """Manages the export tab UI components"""
@@ -27,11 +30,13 @@ class ExportTab:
             st.info("No relationship data available. Please generate relationships from the Database tab first.")
             return
         
-        self._render_export_all_section()
+        renderer = self._renderer()
+        self._render_export_all_section(renderer)
+        self._render_project_section(renderer)
 
 
     
-    def _render_export_all_section(self) -> None:
+    def _render_export_all_section(self, renderer: DocumentationRenderer) -> None:
         """Render the export all section"""
         if not st.session_state.get('tables'):
             return
@@ -40,64 +45,76 @@ class ExportTab:
         
         # Get database name for filename
         db_name = st.session_state['db_name']
+        key = renderer.key()
         
-        # Generate markdown content
-        markdown_content = self._generate_complete_documentation()
-        st.download_button(
-            label="Download Complete Documentation (Markdown)", 
-            data=markdown_content,
-            file_name=f"database_documentation_{db_name}.md",
-            mime="text/markdown"
-        )
+        split = st.radio(
+            "Output",
+            options=["Single Markdown file", "One file per table (zip)"],
+            horizontal=True,
+            help="Split output suits large databases: an index document plus one Markdown file per table."
+        ) != "Single Markdown file"
+        suffix, mime, label = (".zip", "application/zip", "Zip") if split else (".md", "text/markdown", "Markdown")
+        
+        # Generated on request, written to disk section by section and reused while unchanged
+        path = ExportCache.lookup(key, suffix)
+        if path is None and st.button(f"Prepare Complete Documentation ({label})"):
+            with st.spinner("Generating documentation..."):
+                writer = renderer.write_split_archive() if split else write_chunks(renderer.sections())
+                path = ExportCache.get_or_build(key, suffix, writer)
+        if path is not None:
+            with open(path, 'rb') as documentation_file:
+                st.download_button(
+                    label=f"Download Complete Documentation ({label})", 
+                    data=documentation_file,
+                    file_name=f"database_documentation_{db_name}{suffix}",
+                    mime=mime
+                )
         st.write("---")
-        st.write(markdown_content)
-        # Export as Markdown
-
+        # Sections are cached, so only tables that changed are rendered again
+        for section in renderer.sections():
+            st.write(section)
     
-    def _generate_complete_documentation(self) -> str:
-        """Generate complete markdown documentation including tables list, relationships and details"""
-        db_name = st.session_state['db_name']
-        content = [
-            f"# Database Documentation: {db_name}\n",
-            "## Tables Overview\n"
-        ]
+    def _render_project_section(self, renderer: DocumentationRenderer) -> None:
+        """Render saving the documentation state as a project that can be opened again"""
+        st.write("---")
+        st.subheader("Save Project")
+        st.write("Save glossaries, descriptions and relationships as Parquet files to continue later.")
+        state = {
+            'db_name': st.session_state['db_name'],
+            'glossaries': st.session_state['glossary_dicts'],
+            'descriptions': st.session_state.get('table_descriptions', {}),
+            'relationship_matrix': st.session_state.get('relationship_matrix')
+        }
         
-        # Add table list with short descriptions
-        for table in sorted(st.session_state['tables']):
-            description = st.session_state.get('table_descriptions', {}).get(table, 'No description defined.')
-            # Get first sentence for short description
-            short_desc = description.split('.')[0] + '.'
-            content.append(f"- **{table}**: {short_desc}\n")
-            
-        # Add relationships section
-        content.append("\n## Table Relationships\n")
-        if not st.session_state.get('relationship_matrix').empty:
-            for _, row in st.session_state['relationship_matrix'].iterrows():
-                content.append(
-                    f"- {row['table1']}.{row['column1']} → {row['table2']}.{row['column2']} "
-                    f"(Confidence: {row['confidence']}%)\n"
+        name = st.text_input("Project name", value=state['db_name'] or "project")
+        if st.button("Save Project"):
+            try:
+                manifest = save_project(project_directory(name), **state)
+                st.success(f"Saved {len(manifest['tables'])} table glossaries to project '{name}'.")
+            except Exception as e:
+                st.error(f"Could not save project: {str(e)}")
+        
+        key = renderer.key()
+        path = ExportCache.lookup(key, PROJECT_SUFFIX)
+        if path is None and st.button("Prepare Project Download"):
+            with st.spinner("Writing project..."):
+                path = ExportCache.get_or_build(key, PROJECT_SUFFIX, project_archive_writer(**state))
+        if path is not None:
+            with open(path, 'rb') as project_file:
+                st.download_button(
+                    label="Download Project",
+                    data=project_file,
+                    file_name=f"{name}{PROJECT_SUFFIX}",
+                    mime="application/zip"
                 )
-        else:
-            content.append("No relationships defined.\n")
-            
-        # Add detailed table documentation
-        content.append("\n## Detailed Table Documentation\n")
-        for table in sorted(st.session_state['tables']):
-            content.append(f"\n### {table}\n")
-            
-            # Table description
-            description = st.session_state.get('table_descriptions', {}).get(table, 'No description defined.')
-            content.append(f"#### Description\n{description}\n")
-            # Table glossary
-            content.append("#### Glossary\n")
-            glossary_df = st.session_state.get('glossary_dicts', {}).get(table)
-            if isinstance(glossary_df, pd.DataFrame) and not glossary_df.empty:
-                # Convert DataFrame to markdown table
-                # Replace any | characters with \| to escape them
-                glossary_df = glossary_df.astype(str).replace('\|', '\\|', regex=True)
-                glossary_df = glossary_df.fillna('')
-                markdown_table = glossary_df.to_markdown(index=False)
-                content.append(markdown_table + "\n")
-            else:
-                content.append("No glossary entries available.\n")
-        return "\n".join(content)
+    
+    @staticmethod
+    def _renderer() -> DocumentationRenderer:
+        """Documentation renderer over the current session state"""
+        return DocumentationRenderer(
+            st.session_state['db_name'],
+            list(st.session_state['tables']),
+            st.session_state.get('table_descriptions', {}),
+            st.session_state.get('relationship_matrix'),
+            st.session_state['glossary_dicts']
+        )
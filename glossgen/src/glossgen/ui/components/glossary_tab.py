@@ -1,15 +1,20 @@
 import streamlit as st
 import pandas as pd
 from datetime import datetime
-import json
-import io
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from glossgen.config.app_config import AppConfig
 from glossgen.state.session_state import SessionState
 from glossgen.services.database import DatabaseService
 from glossgen.chains.glossary_chain import GlossaryChain
+from glossgen.services.single_flight import profile_table, generate_glossary
+from glossgen.services.documentation import ProfilingQueue, run_profiling_job
+from glossgen.services.exporters import ExportCache, GLOSSARY_EXPORTERS, glossary_export_key
+from glossgen.ui.components.job_progress import JobProgress
 from glossgen.utils.utils import process_response
+
+PROFILING_JOB = "glossary_profiling"
+
 # Create column configuration
 column_config = {
             'column_name': st.column_config.TextColumn(
@@ -87,21 +92,83 @@ class GlossaryTab:
             st.error("Please connect to a database first.")
             return
         
-        if not st.session_state['glossary_dicts']:
-            with st.spinner("Generating data glossaries..."):
-                glossary_dicts = st.session_state['extractor'].generate_schema_table_for_all_tables()
-                SessionState.update_glossary_data(glossary_dicts)
+        progress = JobProgress(PROFILING_JOB)
+        self._apply_profiling_results(progress)
+        
+        table = self._render_table_selector(progress)
+        if table is not None:
+            self._ensure_profiled(table)
+        self._start_prefetch(progress)
+        progress.render()
         
-        self._render_table_selector()
         self._render_glossary_editor()
-        self._render_export_section()
+        if st.session_state['glossary_dicts']:
+            self._render_export_section()
+    
+    @staticmethod
+    def _ensure_profiled(table: str) -> None:
+        """Profile the selected table right away unless it already has a glossary"""
+        SessionState.add_recent_table(table)
+        queue = SessionState.get_profiling_queue()
+        if table in st.session_state['glossary_dicts']:
+            return
+        if queue is not None:
+            # Moves it up if profiling here fails
+            queue.prioritize(table)
+        with st.spinner(f"Profiling table: {table}"):
+            try:
+                st.session_state['glossary_dicts'][table] = profile_table(st.session_state['extractor'], table)
+            except Exception as e:
+                st.error(f"Could not profile {table}: {str(e)}")
+                return
+        if queue is not None:
+            queue.mark_done(table)
+    
+    @staticmethod
+    def _start_prefetch(progress: JobProgress) -> None:
+        """Profile the remaining tables in the background, recently viewed and small tables first"""
+        remaining = [
+            table for table in st.session_state['tables']
+            if table not in st.session_state['glossary_dicts']
+        ]
+        # One prefetch per connection; a cancelled or finished job is not restarted
+        if not remaining or progress.job is not None:
+            return
+        # The queue is read by the job on every step, so tables opened later still move up
+        queue = ProfilingQueue(remaining, SessionState.get_recent_tables())
+        SessionState.set_profiling_queue(queue)
+        JobProgress.submit(
+            PROFILING_JOB,
+            run_profiling_job,
+            "Profiling remaining tables",
+            extractor=st.session_state['extractor'],
+            queue=queue,
+            tables=remaining
+        )
+        progress.job = JobProgress(PROFILING_JOB).job
+    
+    @staticmethod
+    def _apply_profiling_results(progress: JobProgress) -> None:
+        """Add tables profiled by the background job, keeping existing glossaries"""
+        for table, schema_df in progress.new_results().items():
+            st.session_state['glossary_dicts'].setdefault(table, schema_df)
     
-    def _render_table_selector(self) -> None:
-        """Render the table selection dropdown"""
-        st.selectbox(
+    def _render_table_selector(self, progress: JobProgress) -> Optional[str]:
+        """Render the table selection dropdown with each table's profiling state"""
+        current = progress.job.current_item if progress.running else None
+        
+        def label(table: str) -> str:
+            if table in st.session_state['glossary_dicts']:
+                return f"✓ {table}"
+            if table == current:
+                return f"⏳ {table} (profiling)"
+            return f"○ {table} (queued)"
+        
+        return st.selectbox(
             "Select a Table",
             st.session_state['tables'],
-            key='selected_glossary_table'
+            key='selected_glossary_table',
+            format_func=label
         )
     
     def _render_glossary_editor(self) -> None:
@@ -110,6 +177,9 @@ class GlossaryTab:
             return
         
         table = st.session_state['selected_glossary_table']
+        if table not in st.session_state['glossary_dicts']:
+            st.info(f"No glossary available for table {table}.")
+            return
         glossary_df = st.session_state['glossary_dicts'][table]
         
         
@@ -132,10 +202,14 @@ class GlossaryTab:
         st.write("Started generating data glossary descriptions!")
         
         with st.spinner(f"AI generating description for table: {table}"):
-            glossary_dict = st.session_state['extractor'].generate_schema_table_for_table(table)
+            extractor = st.session_state['extractor']
+            glossary_dict = profile_table(extractor, table)
             glossary_chain = GlossaryChain()
-            response = glossary_chain.invoke(glossary_dict)
+            response = generate_glossary(glossary_chain, extractor, table, glossary_dict)
             st.write(response)
+            if isinstance(response, dict) and 'error' in response:
+                st.error("Could not parse the AI response. Please try again.")
+                return
             res_json = self._process_response(response)
             df_res = pd.DataFrame(res_json)[['column_name', 'description']]
             
@@ -144,7 +218,12 @@ class GlossaryTab:
                     df_res, on='column_name', how='left'
                 )
             else:
-                st.session_state['glossary_dicts'][table]['description'] = df_res['description']
+                # Match by column name: partial responses may skip or reorder columns
+                glossary_df = st.session_state['glossary_dicts'][table]
+                glossary_df['description'] = glossary_df['column_name'].map(
+                    df_res.set_index('column_name')['description']
+                ).combine_first(glossary_df['description'])
+                st.session_state['glossary_dicts'][table] = glossary_df
             
             # Update the displayed dataframe
             container.data_editor(
@@ -170,60 +249,25 @@ class GlossaryTab:
             self.config.EXPORT_FORMATS
         )
         
-        # Prepare combined dataframe
-        all_glossaries = []
-        for table, df in st.session_state['glossary_dicts'].items():
-            df = df.copy()
-            df['table_name'] = table
-            all_glossaries.append(df)
-        combined_df = pd.concat(all_glossaries, ignore_index=True)
-        
-        # Export based on selected format
-        if file_format == "csv":
-            self._export_csv(combined_df, default_filename)
-        elif file_format == "json":
-            self._export_json(combined_df, default_filename)
-        elif file_format == "xlsx":
-            self._export_excel(default_filename)
-    
-    def _export_csv(self, df: pd.DataFrame, filename: str) -> None:
-        """Export glossary as CSV"""
-        csv_data = df.to_csv(index=False).encode('utf-8')
-        st.download_button(
-            label="Download CSV",
-            data=csv_data,
-            file_name=f"{filename}.csv",
-            mime="text/csv"
-        )
-    
-    def _export_json(self, df: pd.DataFrame, filename: str) -> None:
-        """Export glossary as JSON"""
-        json_dict = {}
-        for table_name, group_df in df.groupby('table_name'):
-            group_df = group_df.drop('table_name', axis=1)
-            json_dict[table_name] = group_df.to_dict(orient='records')
-        
-        json_data = json.dumps(json_dict, indent=2)
-        st.download_button(
-            label="Download JSON",
-            data=json_data,
-            file_name=f"{filename}.json",
-            mime="application/json"
-        )
-    
-    def _export_excel(self, filename: str) -> None:
-        """Export glossary as Excel"""
-        excel_buffer = io.BytesIO()
-        with pd.ExcelWriter(excel_buffer, engine="xlsxwriter") as writer:
-            for table, df in st.session_state['glossary_dicts'].items():
-                df.to_excel(writer, index=False, sheet_name=table)
-        
-        st.download_button(
-            label="Download Excel",
-            data=excel_buffer.getvalue(),
-            file_name=f"{filename}.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-        )
+        glossaries = st.session_state['glossary_dicts']
+        tables = list(glossaries)
+        suffix, mime, writer = GLOSSARY_EXPORTERS[file_format]
+        key = glossary_export_key(file_format, glossaries, tables)
+        
+        # Exports are generated only on request and reused while the glossaries are unchanged
+        path = ExportCache.lookup(key, suffix)
+        if path is None and st.button(f"Prepare {file_format.upper()} export"):
+            with st.spinner("Generating export..."):
+                path = ExportCache.get_or_build(key, suffix, writer(glossaries, tables))
+        
+        if path is not None:
+            with open(path, 'rb') as export_file:
+                st.download_button(
+                    label=f"Download {file_format.upper()}",
+                    data=export_file,
+                    file_name=f"{default_filename}{suffix}",
+                    mime=mime
+                )
     
     @staticmethod
     def _process_response(response: Any) -> Dict:
@@ -0,0 +1,89 @@
+import time
+from typing import Any, Callable, Dict, Optional
+
+import streamlit as st
+
+from glossgen.config.app_config import AppConfig
+from glossgen.services.job_runner import Job, FAILED, CANCELLED, get_job_runner
+from glossgen.state.session_state import SessionState
+
+RESULT_KEY = "__result__"
+
+
+class JobProgress:
+    """Shows progress of this session's background job of one kind"""
+
+    def __init__(self, kind: str):
+        self.config = AppConfig()
+        self.kind = kind
+        self.job: Optional[Job] = get_job_runner().get(SessionState.get_job_id(kind))
+
+    @staticmethod
+    def submit(kind: str, fn: Callable[..., Any], label: str, **kwargs) -> Job:
+        """Start fn(job, **kwargs) in the background as this session's job of that kind"""
+        # A session keeps one job per kind; the previous one's results were applied already
+        previous_id = SessionState.get_job_id(kind)
+        if previous_id:
+            get_job_runner().remove(previous_id)
+        job = get_job_runner().submit(kind, fn, owner=SessionState.get_session_id(), label=label, **kwargs)
+        SessionState.set_job(kind, job.job_id)
+        return job
+
+    @property
+    def running(self) -> bool:
+        return self.job is not None and not self.job.finished
+
+    def new_results(self) -> Dict[str, Any]:
+        """Partial results this session has not applied yet (each is returned once)"""
+        if self.job is None:
+            return {}
+        consumed = SessionState.get_consumed_job_results(self.job.job_id)
+        results = {
+            key: value for key, value in self.job.snapshot_results().items()
+            if key not in consumed
+        }
+        consumed.update(results)
+        return results
+
+    def take_result(self) -> Any:
+        """The finished job's return value the first time it is asked for, else None"""
+        if self.job is None or not self.job.finished:
+            return None
+        consumed = SessionState.get_consumed_job_results(self.job.job_id)
+        if RESULT_KEY in consumed:
+            return None
+        consumed.add(RESULT_KEY)
+        return self.job.result
+
+    def render(self) -> None:
+        """Render a progress bar with a cancel button while the job runs"""
+        if self.job is None:
+            return
+        if self.running:
+            col1, col2 = st.columns([4, 1])
+            with col1:
+                st.progress(
+                    self.job.progress,
+                    text=f"{self.job.label}: {self.job.completed}/{self.job.total}"
+                )
+            with col2:
+                if st.button("Cancel", key=f"cancel_{self.job.job_id}"):
+                    self.job.cancel()
+        elif self.job.status == FAILED:
+            st.error(f"{self.job.label} failed: {self.job.error}")
+        elif self.job.status == CANCELLED:
+            st.warning(f"{self.job.label} was cancelled; partial results were kept.")
+
+    @staticmethod
+    def poll() -> None:
+        """
+        Rerun the script shortly while any of this session's jobs is running
+
+        Called at the end of the script. The sleep blocks this session's script
+        run for JOB_POLL_INTERVAL seconds, so a widget interaction made meanwhile
+        is handled on the rerun that follows, at most that long after.
+        """
+        jobs = get_job_runner().list_jobs(SessionState.get_session_id())
+        if any(not job.finished for job in jobs):
+            time.sleep(AppConfig.JOB_POLL_INTERVAL)
+            st.rerun()
@@ -5,6 +5,15 @@ from typing import List
 from glossgen.config.app_config import AppConfig
 from glossgen.state.session_state import SessionState
 from glossgen.services.database import DatabaseService
+from glossgen.services.relationships import (
+    RelationshipCache,
+    run_relationship_job,
+    apply_overlay,
+    diff_overlay,
+)
+from glossgen.ui.components.job_progress import JobProgress
+
+RELATIONSHIP_JOB = "relationships"
 
 def get_relationship_matrix_column_config(table_options: List[str]):
     return {
@@ -62,18 +71,37 @@ class RelationshipsTab:
     
     def _render_relationship_analysis(self, selected_tables: List[str]) -> None:
         """Render the relationship analysis interface"""
-        # if st.session_state["relationship_matrix"].empty:
+        if len(selected_tables) < 2:
+            st.info("Please select at least two tables to analyze relationships.")
+            return
+        
+        extractor = st.session_state['extractor']
+        progress = JobProgress(RELATIONSHIP_JOB)
+        progress.render()
+        if progress.running:
+            return
         
-        if len(selected_tables) > 1:
-            with st.spinner("Analyzing table relationships..."):
-                relationship_matrix = st.session_state['extractor'].get_relationship_matrix(
-                    selected_tables
+        # Relationships are computed on request and cached per table pair, so
+        # reruns (editing, other tabs) only re-render
+        base_matrix = RelationshipCache.matrix(extractor, selected_tables)
+        if base_matrix is None:
+            missing = len(RelationshipCache.missing_pairs(extractor, selected_tables))
+            st.info(f"{missing} table pair(s) in this selection have not been analyzed yet.")
+            if st.button("Analyze Relationships"):
+                JobProgress.submit(
+                    RELATIONSHIP_JOB,
+                    run_relationship_job,
+                    "Analyzing table relationships",
+                    extractor=extractor,
+                    tables=list(selected_tables)
                 )
-                SessionState.update_relationship_data(relationship_matrix)
-        else:
-            st.info("Please select at least two tables to analyze relationships.")
+                st.rerun()
             return
         
+        # User edits are kept as an overlay on the computed relationships
+        overlay = SessionState.get_relationship_overlay()
+        SessionState.update_relationship_data(apply_overlay(base_matrix, overlay, selected_tables))
+        
         st.header("Table Relationships")
         st.write("The following relationships were detected between the selected tables:")
         
@@ -84,10 +112,17 @@ class RelationshipsTab:
             column_config=get_relationship_matrix_column_config(st.session_state['tables'])
         )
         
-        # Update button
-        if st.button("Update Relationships"):
-            SessionState.update_relationship_data(edited_rel_matrix)
-            st.success("Relationships updated successfully!")
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("Update Relationships"):
+                overlay = diff_overlay(base_matrix, edited_rel_matrix, overlay, selected_tables)
+                SessionState.update_relationship_overlay(overlay)
+                SessionState.update_relationship_data(apply_overlay(base_matrix, overlay, selected_tables))
+                st.success("Relationships updated successfully!")
+        with col2:
+            if (overlay['removed'] or overlay['rows']) and st.button("Discard Edits"):
+                SessionState.update_relationship_overlay(None)
+                st.rerun()
         
 
         # Visualize relationships
@@ -1,17 +1,33 @@
 import json
 import streamlit as st
-import os
-from typing import Tuple, Dict, Any, Optional
+import shutil
+from typing import Tuple, Dict, Any, List, Optional
 
 from glossgen.config.app_config import AppConfig
 from glossgen.state.session_state import SessionState
 from glossgen.services.database import DatabaseService
-from glossgen.chains.glossary_chain import GlossaryChain
-from glossgen.chains.glossary_chain import TableDescriptionChain
 from glossgen.utils.utils import process_response
 from glossgen.utils.ai_utils import test_ai_connection
+from glossgen.services.llm_resilience import get_resilient_caller
+from glossgen.services.llm_router import GenerationRouter
+from glossgen.services.resource_cache import SharedResourceCache
+from glossgen.services.documentation import run_documentation_job, GLOSSARY_RESULT, DESCRIPTION_RESULT
+from glossgen.services.csv_ingest import run_csv_import_job, unique_table_names
+from glossgen.services.server_files import server_files_dir, resolve_server_paths
+from glossgen.services.project_store import (
+    extract_project_archive,
+    list_projects,
+    load_project,
+    project_directory,
+)
+from glossgen.services.relationships import overlay_from_matrix
+from glossgen.ui.components.batch_generation import BatchGenerationPanel
+from glossgen.ui.components.job_progress import JobProgress
 import pandas as pd
 
+DOCUMENTATION_JOB = "documentation"
+CSV_IMPORT_JOB = "csv_import"
+
 class Sidebar:
     """Manages the sidebar UI components"""
     
@@ -26,7 +42,14 @@ class Sidebar:
             self._render_ai_settings()
             # self._render_data_source()
             self._render_database_connection()
-            return self._render_generate_documentation()
+            self._render_file_profiling()
+            if st.session_state['db_connected'] and st.session_state['engine'] is not None:
+                if not SessionState.get_resource()[2].get('read_only'):
+                    self._render_csv_upload()
+            self._render_project()
+            self._render_generate_documentation()
+            if st.session_state['db_connected']:
+                BatchGenerationPanel().render()
 
     def _render_about(self) -> None:
         """Render the about section"""
@@ -115,6 +138,75 @@ class Sidebar:
                         st.success(message)
                     else:
                         st.error(message)
+
+            self._render_generation_pool()
+            self._render_llm_call_stats()
+
+    def _render_generation_pool(self) -> None:
+        """Render the editor for additional load-balanced generation targets"""
+        st.caption(
+            "Generation pool: extra provider/model/endpoint targets that share the "
+            "load with the settings above. Keys are set below or read from the named "
+            "environment variable; empty keys fall back to the provider's default variable."
+        )
+        saved_targets = SessionState.get_generation_targets()
+        # Keys are never put in the editor; it only shows whether one is set
+        targets = pd.DataFrame(
+            [dict(target, key_set=bool(target.get('api_key'))) for target in saved_targets],
+            columns=['provider', 'model', 'endpoint', 'api_key_env', 'key_set', 'weight']
+        )
+        edited_targets = st.data_editor(
+            targets,
+            num_rows="dynamic",
+            hide_index=True,
+            key='generation_targets_editor',
+            column_config={
+                'provider': st.column_config.SelectboxColumn(
+                    'Provider', options=self.config.IMPLETMENTED_AI_PROVIDERS, required=True
+                ),
+                'model': st.column_config.TextColumn('Model', required=True),
+                'endpoint': st.column_config.TextColumn('Endpoint'),
+                'api_key_env': st.column_config.TextColumn(
+                    'API Key Variable', help="Environment variable holding the key, e.g. OPENAI_API_KEY_2"
+                ),
+                'key_set': st.column_config.CheckboxColumn('Key Set', disabled=True),
+                'weight': st.column_config.NumberColumn('Weight', min_value=0.0, default=1.0)
+            }
+        )
+        edited = (
+            edited_targets.dropna(subset=['provider', 'model'])
+            .fillna({'weight': 1.0}).fillna('')
+            .drop(columns=['key_set'])
+            .to_dict(orient='records')
+        )
+        keys = {
+            (target['provider'], target['model'], target.get('endpoint') or ''): target.get('api_key', '')
+            for target in saved_targets
+        }
+
+        selected, new_key = None, ""
+        if edited:
+            labels = [f"{target['provider']} / {target['model']}" for target in edited]
+            selected = st.selectbox("Set API key for", options=range(len(labels)), format_func=labels.__getitem__)
+            new_key = st.text_input("API key", type="password", key='generation_target_api_key')
+
+        if st.button("Save Generation Pool"):
+            for index, target in enumerate(edited):
+                key = (target['provider'], target['model'], target.get('endpoint') or '')
+                target['api_key'] = new_key if index == selected and new_key else keys.get(key, '')
+            SessionState.update_generation_targets(edited)
+            st.success("Generation pool saved.")
+
+    def _render_llm_call_stats(self) -> None:
+        """Render latency percentiles and throttling state of LLM calls"""
+        caller = get_resilient_caller()
+        latency_report = caller.latency.report()
+        if not latency_report:
+            return
+        
+        st.caption("LLM call statistics (latency in seconds)")
+        st.dataframe(pd.DataFrame(latency_report), hide_index=True)
+        st.dataframe(pd.DataFrame(caller.status()), hide_index=True)
             
         
     
@@ -126,22 +218,76 @@ class Sidebar:
             ["Upload CSV", "Connect to Database"]
         )
         
-        file_path = ""
         if data_source == "Upload CSV":
-            file_path = self._render_csv_upload()
+            self._render_csv_upload()
         else:
             self._render_database_connection()
         
-        return data_source, file_path
+        return data_source, ""
     
-    def _render_csv_upload(self) -> str:
-        """Render CSV upload section"""
-        st.subheader("Upload a CSV File")
-        uploaded_file = st.file_uploader("Choose a CSV file", type=["csv"])
-        
-        if uploaded_file:
-            return uploaded_file.name
-        return ""
+    def _render_csv_upload(self) -> None:
+        """Render the CSV import section: files are streamed into the connected database"""
+        with st.expander("Import CSV Files"):
+            progress = JobProgress(CSV_IMPORT_JOB)
+            uploaded_files = st.file_uploader("Choose CSV files", type=["csv"], accept_multiple_files=True)
+            server_paths = ""
+            if server_files_dir():
+                server_paths = st.text_area(
+                    "Or CSV paths in the server files directory (one per line)",
+                    help="Large files are best read from disk; uploads are held in memory by Streamlit."
+                )
+            if_exists = st.selectbox("If a table exists", options=["replace", "append", "fail"])
+            
+            sources = [(uploaded.name, uploaded) for uploaded in uploaded_files or []]
+            if st.button("Import", disabled=not (sources or server_paths.strip()) or progress.running):
+                try:
+                    sources += resolve_server_paths(server_paths, ["csv"])
+                except ValueError as e:
+                    st.error(str(e))
+                    return
+                tables = list(zip(unique_table_names([name for name, _ in sources]), [source for _, source in sources]))
+                JobProgress.submit(
+                    CSV_IMPORT_JOB,
+                    run_csv_import_job,
+                    "Importing CSV files",
+                    engine=self.db_service.engine,
+                    sources=tables,
+                    if_exists=if_exists
+                )
+                progress = JobProgress(CSV_IMPORT_JOB)
+            
+            progress.render()
+            loaded = progress.take_result()
+            if loaded:
+                # The reflected schema is shared with other sessions, so re-reflect it
+                self.db_service.refresh_schema()
+                st.success(", ".join(f"{table}: {rows:,} rows" for table, rows in loaded.items()))
+    
+    def _render_file_profiling(self) -> None:
+        """Render the section that documents CSV/Parquet files without loading them into a database"""
+        with st.expander("Profile Files"):
+            uploaded_files = st.file_uploader(
+                "Choose CSV or Parquet files", type=["csv", "parquet"], accept_multiple_files=True, key="profile_files"
+            )
+            server_paths = ""
+            if server_files_dir():
+                server_paths = st.text_area(
+                    "Or file paths in the server files directory (one per line)",
+                    key="profile_paths",
+                    help="Files are read in chunks, so large files can be profiled; uploads are held in memory by Streamlit."
+                )
+            name = st.text_input("Name", value="files", help="Shown as the database name in the documentation")
+            
+            sources = [(uploaded.name, uploaded) for uploaded in uploaded_files or []]
+            if st.button("Profile Files", disabled=not (sources or server_paths.strip())):
+                try:
+                    sources += resolve_server_paths(server_paths, ["csv", "parquet"])
+                except ValueError as e:
+                    st.error(str(e))
+                    return
+                tables = list(zip(unique_table_names([file_name for file_name, _ in sources]), [source for _, source in sources]))
+                if self.db_service.open_files(tables, name or "files"):
+                    st.success(f"Opened {len(tables)} file(s). Columns are profiled in one pass per file when first used.")
     
     def _render_database_connection(self) -> None:
         """Render database connection section"""
@@ -181,54 +327,155 @@ class Sidebar:
                     'password': password
                 }
             
+            read_only = st.checkbox(
+                "Read-only",
+                value=self.config.DB_READ_ONLY,
+                help="Open the database read-only; CSV import is unavailable."
+            )
+            if db_type == "SQLite" and read_only:
+                params['immutable'] = st.checkbox(
+                    "File does not change (immutable)",
+                    help="Skips SQLite's locking and change detection. Only for files no other process writes to."
+                )
+            
+            if db_type in ("PostgreSQL", "SQL Server"):
+                params['include_schemas'] = self._schema_patterns(st.text_input(
+                    "Include schemas",
+                    value=", ".join(self.config.SCHEMA_INCLUDE),
+                    help="Comma-separated patterns such as sales, crm_*; empty reflects every schema."
+                ))
+                params['exclude_schemas'] = self._schema_patterns(st.text_input(
+                    "Exclude schemas",
+                    value=", ".join(self.config.SCHEMA_EXCLUDE),
+                    help="Comma-separated patterns such as staging_*. Tables outside the default schema are named schema.table."
+                ))
+            
             if st.button("Connect"):
-                self.db_service.connect(db_type, **params) 
+                self.db_service.connect(db_type, read_only=read_only, **params) 
+
+            if st.session_state['db_connected'] and st.session_state['engine'] is not None:
+                if st.button("Refresh Schema", help="Re-read tables and columns for every session on this database"):
+                    self.db_service.refresh_schema()
+                    st.success("Schema refreshed.")
+                shared = SharedResourceCache.stats([SessionState.get_resource()[0]])
+                if shared:
+                    st.caption("This connection and its pool (shared with sessions using the same database)")
+                    st.dataframe(pd.DataFrame(shared), hide_index=True)
+
+    @staticmethod
+    def _schema_patterns(value: str) -> List[str]:
+        return [pattern.strip() for pattern in value.split(",") if pattern.strip()]
 
+    def _render_project(self) -> None:
+        """Render the section that restores a saved project"""
+        with st.expander("Open Project"):
+            saved = list_projects()
+            name = st.selectbox("Saved projects", options=saved) if saved else None
+            if name and st.button("Open Project"):
+                self._restore_project(project_directory(name))
+            
+            uploaded = st.file_uploader("Or upload a project", type=["zip"])
+            if uploaded is not None and st.button("Restore Uploaded Project"):
+                # Unpacked into a private temporary directory, never over a saved project
+                try:
+                    directory = extract_project_archive(uploaded)
+                except Exception as e:
+                    st.error(f"Could not read project: {str(e)}")
+                    return
+                try:
+                    self._restore_project(directory)
+                finally:
+                    shutil.rmtree(directory, ignore_errors=True)
+    
+    @staticmethod
+    def _restore_project(directory: str) -> None:
+        try:
+            project = load_project(directory)
+        except Exception as e:
+            st.error(f"Could not load project: {str(e)}")
+            return
+        SessionState.restore_documentation(
+            project['glossaries'],
+            project['descriptions'],
+            project['relationship_matrix'],
+            overlay_from_matrix(project['relationship_matrix'])
+        )
+        st.success(f"Restored {len(project['glossaries'])} table glossaries.")
+        if st.session_state['db_connected'] and project['db_name'] != st.session_state['db_name']:
+            st.warning(f"The project was saved from database '{project['db_name']}'.")
+    
     def _render_generate_documentation(self) -> None:
         """Render the generate documentation section""" 
         # Add Generate Documentation button
         st.markdown("---")
-        if st.button("Generate Documentation with AI", disabled=not st.session_state['db_connected']):
+        progress = JobProgress(DOCUMENTATION_JOB)
+        if st.button(
+            "Generate Documentation with AI",
+            disabled=not st.session_state['db_connected'] or progress.running
+        ):
             if not st.session_state['db_connected']:
                 st.error("Please connect to a database first.")
                 return
 
-            with st.spinner("Generating glossary entries..."):
-                # Generate glossaries for all tables
-                glossary_chain = GlossaryChain()
-                for table in st.session_state['tables']:
-                    # Generate schema table
-                    glossary_dict = st.session_state['extractor'].generate_schema_table_for_table(table)
-                    
-                    # Get column descriptions using GlossaryChain
-                    response = glossary_chain.invoke(glossary_dict)
-                    res_json = response
-                    df_res = pd.DataFrame(res_json)[['column_name', 'description']]
-                    
-                    # Update glossary_dicts with descriptions
-                    if table not in st.session_state['glossary_dicts']:
-                        st.session_state['glossary_dicts'][table] = pd.DataFrame()  # Create an empty DataFrame
-                    
-                    if "description" not in st.session_state['glossary_dicts'][table].columns:
-                        st.session_state['glossary_dicts'][table] = st.session_state['glossary_dicts'][table].merge(
-                            df_res, on='column_name', how='left'
-                        )
-                    else:
-                        st.session_state['glossary_dicts'][table]['description'] = df_res['description']
-                        
-                st.success("Glossary entries generated!")
-
-            with st.spinner("Generating table descriptions..."):
-                # Generate descriptions for all tables
-                description_chain = TableDescriptionChain()
-                relationship_matrix = st.session_state['relationship_matrix'].to_json()
-                
-                for table in st.session_state['tables']:
-                    glossary_data = st.session_state['glossary_dicts'][table]
-                    description = description_chain.invoke(
-                        table,
-                        glossary_data,
-                        relationship_matrix
-                    )
-                    st.session_state['table_descriptions'][table] = description
-                st.success("Table descriptions generated!")
\ No newline at end of file
+            # Resolve settings on the main thread; the job runs outside the script
+            snapshot = st.session_state['glossary_dicts'].copy()
+            SessionState.set_documentation_snapshot(snapshot)
+            st.session_state['documentation_kept_tables'] = []
+            JobProgress.submit(
+                DOCUMENTATION_JOB,
+                run_documentation_job,
+                "Generating documentation",
+                router=GenerationRouter.from_session(temperature=0.2),
+                extractor=st.session_state['extractor'],
+                tables=list(st.session_state['tables']),
+                glossary_dicts=snapshot,
+                relationship_matrix=st.session_state['relationship_matrix'].copy()
+            )
+            progress = JobProgress(DOCUMENTATION_JOB)
+
+        progress.render()
+        self._apply_documentation_results(progress)
+
+    @staticmethod
+    def _apply_documentation_results(progress: JobProgress) -> None:
+        """Copy glossaries and descriptions finished by the documentation job into the session"""
+        job = progress.job
+        if job is None:
+            return
+        # Read the state first: once finished, every result is already published
+        finished = job.finished
+        glossaries = st.session_state['glossary_dicts']
+        snapshot = SessionState.get_documentation_snapshot()
+        for key, value in progress.new_results().items():
+            if key.startswith(GLOSSARY_RESULT):
+                table = key[len(GLOSSARY_RESULT):]
+                # Glossaries edited or generated while the job ran are kept
+                if snapshot is None or glossaries.unchanged_since(snapshot, table):
+                    glossaries[table] = value
+                else:
+                    st.session_state.setdefault('documentation_kept_tables', []).append(table)
+            elif key.startswith(DESCRIPTION_RESULT):
+                st.session_state['table_descriptions'][key[len(DESCRIPTION_RESULT):]] = value
+
+        if not finished:
+            return
+        for warning in job.warnings:
+            st.warning(warning)
+        kept_tables = st.session_state.get('documentation_kept_tables', [])
+        if kept_tables:
+            st.warning(
+                f"Kept your glossary changes for {', '.join(sorted(kept_tables))}; "
+                "the descriptions generated for them were not applied."
+            )
+        if job.result:
+            st.info(
+                f"Reused descriptions for {job.result['reused_columns']} of {job.result['total_columns']} "
+                f"columns ({job.result['reuse_rate']:.0f}%); {job.result['requested_columns']} columns sent to the AI."
+            )
+            st.success("Glossary entries and table descriptions generated!")
+            failed_tables = job.result['failed_tables']
+            if failed_tables:
+                st.error(
+                    f"{len(failed_tables)} table(s) failed and can be regenerated individually: "
+                    f"{', '.join(failed_tables)}"
+                )
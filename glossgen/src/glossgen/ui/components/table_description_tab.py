@@ -6,6 +6,7 @@ from glossgen.config.app_config import AppConfig
 from glossgen.state.session_state import SessionState
 from glossgen.services.database import DatabaseService
 from glossgen.chains.glossary_chain import TableDescriptionChain
+from glossgen.services.single_flight import generate_description
 
 class TableDescriptionTab:
     """Manages the table description tab UI components"""
@@ -46,6 +47,10 @@ class TableDescriptionTab:
             
         table = st.session_state['selected_description_table']
         
+        if table not in st.session_state['glossary_dicts']:
+            st.info(f"Table {table} has not been profiled yet. Open it in the Glossary tab first.")
+            return
+        
         # Get table metadata
         glossary_data = st.session_state['glossary_dicts'][table]
         relationship_matrix = st.session_state['relationship_matrix'].to_json()
@@ -57,7 +62,9 @@ class TableDescriptionTab:
         if table not in st.session_state['table_descriptions']:
             if st.button("Generate Description"):
                 with st.spinner(f"Generating description for table: {table}"):
-                    description = self.description_chain.invoke(
+                    description = generate_description(
+                                    self.description_chain,
+                                    st.session_state['extractor'],
                                     table,
                                     glossary_data,
                                     relationship_matrix
@@ -72,7 +79,9 @@ class TableDescriptionTab:
             # Add refresh button
             if st.button("Regenerate Description"):
                 with st.spinner(f"Regenerating description for table: {table}"):
-                    description = self.description_chain.invoke(
+                    description = generate_description(
+                                    self.description_chain,
+                                    st.session_state['extractor'],
                                     table,
                                     glossary_data,
                                     relationship_matrix
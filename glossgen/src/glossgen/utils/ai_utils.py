@@ -4,6 +4,7 @@ import requests
 import json
 
 from glossgen.config.app_config import AppConfig
+from glossgen.services.llm_registry import LLMClientRegistry
 
 def test_ai_connection(
     provider: str, 
@@ -23,6 +24,9 @@ def test_ai_connection(
     Returns:
         Tuple of (success, message)
     """
+    if provider == "Local Stub":
+        return True, f"Local stub model {model} is available"
+    
     # If no API key provided, try to get from environment
     if not api_key:
         config = AppConfig()
@@ -133,6 +137,11 @@ def get_llm_client(
     """
     Get the appropriate LLM client based on provider
     
+    Clients are shared process-wide through LLMClientRegistry, so chains created
+    on every rerun or in other sessions reuse the same client and HTTP pool.
+    SDK-level retries are disabled; retries and throttling are handled by
+    glossgen.services.llm_resilience.
+    
     Args:
         provider: AI provider name
         api_key: API key
@@ -149,13 +158,54 @@ def get_llm_client(
         env_key_name = config.ENV_API_KEYS.get(provider, "")
         api_key = os.environ.get(env_key_name, "")
     
+    key = LLMClientRegistry.make_key(provider, model, endpoint, api_key, temperature)
+    return LLMClientRegistry.get_or_create(
+        key,
+        lambda: _wrap_with_cassette(
+            _create_llm_client(provider, api_key, model, endpoint, temperature),
+            provider,
+            model
+        )
+    )
+
+def _wrap_with_cassette(llm: Any, provider: str, model: str) -> Any:
+    """Wrap a client in a record/replay cassette when GLOSSGEN_LLM_CASSETTE is set"""
+    if not AppConfig.LLM_CASSETTE_PATH:
+        return llm
+    from glossgen.services.fake_llm import CassetteLLM
+    return CassetteLLM(
+        llm,
+        AppConfig.LLM_CASSETTE_PATH,
+        mode=AppConfig.LLM_CASSETTE_MODE,
+        model=f"{provider}/{model}"
+    )
+
+def _create_llm_client(
+    provider: str, 
+    api_key: str, 
+    model: str, 
+    endpoint: Optional[str] = None,
+    temperature: float = 0.2
+) -> Any:
+    """Create a new LLM client; use get_llm_client to get a shared one"""
+    if provider == "Local Stub":
+        from glossgen.services.fake_llm import FakeChatModel
+        return FakeChatModel(
+            model=model,
+            latency_mean=AppConfig.STUB_LLM_LATENCY_MEAN,
+            latency_sigma=AppConfig.STUB_LLM_LATENCY_SIGMA,
+            tokens_per_second=AppConfig.STUB_LLM_TOKENS_PER_SECOND,
+            error_rate=AppConfig.STUB_LLM_ERROR_RATE
+        )
     if provider == "OpenAI" or provider == "OpenAI Compatible":
         from langchain_openai import ChatOpenAI
         return ChatOpenAI(
             model_name=model,
             temperature=temperature,
             openai_api_key=api_key,
-            openai_api_base=endpoint
+            openai_api_base=endpoint,
+            max_retries=0,
+            http_client=LLMClientRegistry.get_http_client(endpoint)
         )
     elif provider == "Deepseek":
         from langchain_openai import ChatOpenAI
@@ -163,21 +213,25 @@ def get_llm_client(
             model_name=model,
             temperature=temperature,
             openai_api_key=api_key,
-            openai_api_base="https://api.deepseek.com/v1"
+            openai_api_base="https://api.deepseek.com/v1",
+            max_retries=0,
+            http_client=LLMClientRegistry.get_http_client("https://api.deepseek.com/v1")
         )
     elif provider == "Claude":
         from langchain_anthropic import ChatAnthropic
         return ChatAnthropic(
             model_name=model,
             temperature=temperature,
-            anthropic_api_key=api_key
+            anthropic_api_key=api_key,
+            max_retries=0
         )
     elif provider == "Google Gemini":
         from langchain_google_genai import ChatGoogleGenerativeAI
         return ChatGoogleGenerativeAI(
             model=model,
             temperature=temperature,
-            google_api_key=api_key
+            google_api_key=api_key,
+            max_retries=0
         )
     else:
         # Default to OpenAI
@@ -185,5 +239,7 @@ def get_llm_client(
         return ChatOpenAI(
             model_name="gpt-3.5-turbo",
             temperature=temperature,
-            openai_api_key=api_key
-        ) 
\ No newline at end of file
+            openai_api_key=api_key,
+            max_retries=0,
+            http_client=LLMClientRegistry.get_http_client(None)
+        ) 
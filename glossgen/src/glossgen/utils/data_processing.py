@@ -21,25 +21,51 @@ def process_sample_data(df: pd.DataFrame, n_samples: int = 5) -> Dict[str, List]
         sample_data[column] = df[column].dropna().head(n_samples).tolist()
     return sample_data
 
+def extend_sample_data(sample_data: Dict[str, List], df: pd.DataFrame, n_samples: int = 5) -> bool:
+    """Top up sample_data from another chunk of rows; returns True once every column has n_samples"""
+    missing = [column for column in df.columns if len(sample_data.get(column, [])) < n_samples]
+    for column, values in process_sample_data(df[missing], n_samples).items():
+        sample_data[column] = (sample_data.get(column, []) + values)[:n_samples]
+    return all(len(sample_data.get(column, [])) >= n_samples for column in df.columns)
+
+def column_stats_from_counts(rows: int, nulls: int, distinct: float) -> Dict[str, float]:
+    """Uniqueness, null percentage and primary key confidence from row, null and distinct counts"""
+    column_stats = {
+        'uniqueness_percentage': (distinct / rows * 100) if rows else 0.0,
+        'null_percentage': (nulls / rows * 100) if rows else 0.0
+    }
+    
+    # Calculate primary key confidence score
+    column_stats['primary_key_confidence_score'] = (
+        column_stats['uniqueness_percentage'] * 
+        (100 - column_stats['null_percentage']) / 100
+    )
+    return column_stats
+
 def calculate_column_stats(df: pd.DataFrame) -> Dict[str, Dict[str, float]]:
     """Calculate statistics for each column in a DataFrame"""
     stats = {}
     for column in df.columns:
-        column_stats = {
-            'uniqueness_percentage': (df[column].nunique() / len(df) * 100),
-            'null_percentage': (df[column].isnull().sum() / len(df) * 100)
-        }
-        
-        # Calculate primary key confidence score
-        column_stats['primary_key_confidence_score'] = (
-            column_stats['uniqueness_percentage'] * 
-            (100 - column_stats['null_percentage']) / 100
+        stats[column] = column_stats_from_counts(
+            len(df), int(df[column].isnull().sum()), df[column].nunique()
         )
-        
-        stats[column] = column_stats
     
     return stats
 
+def rank_primary_key_candidates(column_stats: Dict[str, Dict[str, float]]) -> pd.DataFrame:
+    """Columns ordered by primary key confidence, the most likely one flagged as is_primary_key"""
+    ranked = sorted(column_stats.items(), key=lambda item: item[1]['primary_key_confidence_score'], reverse=True)
+    return pd.DataFrame([
+        {
+            'column_name': column,
+            'null_percentage': metrics['null_percentage'],
+            'uniqueness_percentage': metrics['uniqueness_percentage'],
+            'primary_key_confidence_score': metrics['primary_key_confidence_score'],
+            'is_primary_key': index == 0
+        }
+        for index, (column, metrics) in enumerate(ranked)
+    ])
+
 def merge_glossary_data(
     schema_info: Dict,
     sample_data: Dict[str, List],
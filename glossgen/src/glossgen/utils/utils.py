@@ -1,5 +1,141 @@
 import json
+import re
 import pandas as pd
+
+_TRAILING_COMMA = re.compile(r',\s*([}\]])')
+
+
+def _strip_code_fences(content):
+    """Remove markdown code fences such as ```json ... ``` around a response"""
+    return re.sub(r'```[a-zA-Z]*', '', content)
+
+
+def _loads_lenient(text):
+    """json.loads that tolerates trailing commas and raw control characters in strings"""
+    try:
+        return json.loads(text, strict=False)
+    except json.JSONDecodeError:
+        return json.loads(_TRAILING_COMMA.sub(r'\1', text), strict=False)
+
+
+# A member or element left incomplete at the end of a truncated fragment: a key
+# without its value, a bare separator, or a literal that may be cut short
+_DANGLING = re.compile(r'(?:,|(?<=[{\[]))\s*(?:"[^"\\]*(?:\\.[^"\\]*)*"\s*:?\s*)?[\w.+-]*\s*$')
+_CLOSERS = {'{': '}', '[': ']'}
+
+
+def _scan_objects(content):
+    """
+    Scan content once, tracking strings and nesting
+
+    Returns (spans, open_brackets, string_start): the (start, end) span of
+    every object as it closes, at any depth; the brackets still open at the
+    end; and where the string cut off at the end started, or None.
+    """
+    spans = []
+    stack = []  # (bracket, position)
+    string_start = None
+    escaped = False
+    for position, char in enumerate(content):
+        if string_start is not None:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                string_start = None
+            continue
+
+        if char == '"':
+            if stack:
+                string_start = position
+        elif char in '{[':
+            stack.append((char, position))
+        elif char in '}]' and stack:
+            bracket, start = stack.pop()
+            if char == '}' and bracket == '{':
+                spans.append((start, position + 1))
+            elif _CLOSERS[bracket] != char:
+                # Mismatched bracket: give up on the enclosing structure
+                stack.clear()
+    return spans, [bracket for bracket, _ in stack], string_start
+
+
+def _close_truncated(content, string_start):
+    """
+    Best-effort completion of a response cut off mid-stream
+
+    A string cut off mid-value is dropped, then any dangling key, separator or
+    literal, so only complete members remain. Returns the kept prefix and the
+    text closing the brackets still open in it.
+    """
+    if string_start is not None:
+        content = content[:string_start]
+    content = _DANGLING.sub('', content.rstrip())
+    _, open_brackets, _ = _scan_objects(content)
+    return content, ''.join(_CLOSERS[bracket] for bracket in reversed(open_brackets))
+
+
+def iter_json_objects(content):
+    """
+    Yield every glossary entry (object with a column_name) in an LLM response
+
+    Scans the text once, tracking strings and nesting, and parses each object
+    as soon as it closes, at any depth, so entries inside wrappers like
+    {"glossary": [...]} survive a response that never closes the wrapper, and
+    one malformed object does not prevent the others from being parsed.
+    Objects with defects such as trailing commas are repaired; if the response
+    was cut off, the open objects are closed after their last complete member
+    and kept if they still parse.
+    """
+    content = _strip_code_fences(content)
+    spans, open_brackets, string_start = _scan_objects(content)
+    for start, end in spans:
+        yield from _parse_entry(content[start:end])
+
+    if open_brackets:
+        prefix, closers = _close_truncated(content, string_start)
+        repaired = prefix + closers
+        for start, end in _scan_objects(repaired)[0]:
+            # Objects ending within the kept prefix were already parsed above
+            if end > len(prefix):
+                yield from _parse_entry(repaired[start:end])
+
+
+def _parse_entry(text):
+    try:
+        obj = _loads_lenient(text)
+    except json.JSONDecodeError:
+        return
+    if isinstance(obj, dict) and 'column_name' in obj:
+        yield obj
+
+
+def parse_glossary_response(content, expected_columns=None):
+    """
+    Extract column_name/description objects from a possibly malformed response
+
+    Args:
+        content: Raw response text
+        expected_columns: Column names the response should cover
+
+    Returns:
+        Tuple of (items, missing_columns); items keep the first complete entry
+        per column, missing_columns lists expected columns with no description
+    """
+    items = []
+    seen = set()
+    for item in iter_json_objects(content):
+        column_name = item.get('column_name')
+        if not column_name or column_name in seen or not item.get('description'):
+            continue
+        seen.add(column_name)
+        items.append(item)
+
+    missing = [column for column in (expected_columns or []) if column not in seen]
+    return items, missing
+
+
 def process_response(response):
     if isinstance(response, list):
         # Check if the list is a list of dictionaries
@@ -9,9 +145,9 @@ def process_response(response):
             raise ValueError("Response is not a list of dictionaries")
         
     else:
-        res_json_text = response.content.replace(
-            'json\n', '').replace('\n', '').strip("```")
-        res_json = json.loads(res_json_text)
+        res_json, _ = parse_glossary_response(response.content)
+        if not res_json:
+            raise ValueError("No glossary entries found in response")
 
     # Convert all values of the list in the column "example_values" to str type
     for item in res_json:
@@ -25,8 +161,10 @@ def process_sample_data_column(data_dict, column_name='sample_data'):
     # data_dict[column_name] = [str(item) for item in data_dict[column_name]]
     for item in data_dict:
         if column_name in item:
+            # Missing values are left out rather than shown as 'None' or 'nan'
             item[column_name] = [str(value)
-                                    for value in item[column_name]]
+                                    for value in item[column_name]
+                                    if not (value is None or (pd.api.types.is_scalar(value) and pd.isna(value)))]
     return data_dict
 
 def glossary_dict_to_df(glossary_dict):
@@ -1,6 +1,5 @@
 import streamlit as st
 import json
-import pandas as pd
 
 from glossgen.config.app_config import AppConfig
 from glossgen.state.session_state import SessionState
@@ -12,6 +11,7 @@ from glossgen.ui.components.relationships_tab import RelationshipsTab
 from glossgen.ui.components.table_description_tab import TableDescriptionTab
 from glossgen.ui.components.export_tab import ExportTab
 from glossgen.ui.components.instructions_tab import InstructionsTab
+from glossgen.ui.components.job_progress import JobProgress
 
 def main():
     """Main application entry point"""
@@ -30,6 +30,7 @@ def main():
     
     # Initialize services
     db_service = DatabaseService()
+    db_service.keep_alive()
     
     # Render sidebar
     sidebar = Sidebar(db_service)
@@ -59,20 +60,9 @@ def main():
         
     with tab_instructions:
         InstructionsTab().render()
-
-def _handle_csv_upload(db_service: DatabaseService, file_path: str) -> None:
-    """Handle CSV file upload and database storage"""
-    try:
-        df = pd.read_csv(file_path)
-        st.success("CSV file loaded successfully!")
-        st.write(df.head(10))
-        
-        # Save to database
-        db_service.save_dataframe(df, "uploaded_data")
-        st.success(f"Data saved to database successfully!")
-        
-    except Exception as e:
-        st.error(f"Error processing CSV file: {str(e)}")
+    
+    # Keep refreshing while background jobs of this session are running
+    JobProgress.poll()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,153 @@
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+from sqlalchemy import JSON, Integer, LargeBinary, String, Text, create_engine, text
+from sqlalchemy.dialects import mssql, mysql, postgresql, sqlite
+from sqlalchemy.types import NullType
+
+from glossgen.tools.bounded_samples import (
+    BINARY,
+    GEOMETRY,
+    JSON as JSON_KIND,
+    SCALAR,
+    TEXT,
+    bound_frame,
+    bounded_select,
+    column_kind,
+    fit_byte_budget,
+    summarize_value,
+    truncate_value
+)
+
+COLUMNS = [
+    {'name': 'id', 'type': Integer()},
+    {'name': 'code', 'type': String(10)},
+    {'name': 'notes', 'type': Text()},
+    {'name': 'payload', 'type': JSON()},
+    {'name': 'photo', 'type': LargeBinary()},
+    {'name': 'shape', 'type': NullType()},
+]
+
+
+def _engine(dialect):
+    return SimpleNamespace(dialect=dialect)
+
+
+def test_column_kinds():
+    assert [column_kind(column['type']) for column in COLUMNS] == [SCALAR, TEXT, TEXT, JSON_KIND, BINARY, TEXT]
+    assert column_kind("GEOMETRY(POINT, 4326)") == GEOMETRY
+    assert column_kind("BYTEA") == BINARY
+    assert column_kind("NUMERIC(10, 2)") == SCALAR
+
+
+@pytest.mark.parametrize("dialect, expected", [
+    (postgresql.dialect(),
+     'SELECT id, code, SUBSTR(CAST(notes AS TEXT), 1, 11) AS notes, SUBSTR(CAST(payload AS TEXT), 1, 11) AS payload, '
+     'OCTET_LENGTH(photo) AS photo, SUBSTR(CAST(shape AS TEXT), 1, 11) AS shape FROM "t" LIMIT 5'),
+    (mysql.dialect(),
+     'SELECT id, code, LEFT(CAST(notes AS CHAR), 11) AS notes, LEFT(CAST(payload AS CHAR), 11) AS payload, '
+     'LENGTH(photo) AS photo, LEFT(CAST(shape AS CHAR), 11) AS shape FROM "t" LIMIT 5'),
+    (mssql.dialect(),
+     'SELECT TOP 5 id, code, LEFT(CAST(notes AS NVARCHAR(MAX)), 11) AS notes, '
+     'LEFT(CAST(payload AS NVARCHAR(MAX)), 11) AS payload, DATALENGTH(photo) AS photo, '
+     'LEFT(CAST(shape AS NVARCHAR(MAX)), 11) AS shape FROM "t"'),
+    (sqlite.dialect(),
+     'SELECT id, code, SUBSTR(notes, 1, 11) AS notes, SUBSTR(payload, 1, 11) AS payload, '
+     'LENGTH(photo) AS photo, SUBSTR(shape, 1, 11) AS shape FROM "t" LIMIT 5'),
+])
+def test_bounded_select_per_dialect(dialect, expected):
+    query, projections = bounded_select(_engine(dialect), '"t"', COLUMNS, 5, max_chars=10)
+
+    assert query == expected
+    # String(10) fits the limit, so it is fetched as is
+    assert projections == [
+        ('id', SCALAR), ('code', SCALAR), ('notes', TEXT), ('payload', JSON_KIND), ('photo', BINARY), ('shape', TEXT)
+    ]
+
+
+@pytest.mark.parametrize("dialect, expected", [
+    (postgresql.dialect(), 'ST_GeometryType(geom) AS geom'),
+    (mysql.dialect(), 'ST_GeometryType(geom) AS geom'),
+    (mssql.dialect(), 'geom.STGeometryType() AS geom'),
+    (sqlite.dialect(), 'LENGTH(geom) AS geom'),
+])
+def test_geometries_are_reduced_to_their_type(dialect, expected):
+    query, projections = bounded_select(_engine(dialect), 't', [{'name': 'geom', 'type': "GEOMETRY"}], 1)
+
+    assert expected in query
+    assert projections == [('geom', GEOMETRY)]
+
+
+def test_reserved_column_names_are_quoted():
+    query, _ = bounded_select(_engine(postgresql.dialect()), 't', [{'name': 'order', 'type': Integer()}], 1)
+
+    assert query == 'SELECT "order" FROM t LIMIT 1'
+
+
+def test_bounded_select_runs_on_sqlite(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'wide.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE docs (id INTEGER, body TEXT, scan BLOB)"))
+        conn.execute(text("INSERT INTO docs VALUES (1, :body, :scan), (2, 'short', NULL)"),
+                     {'body': "x" * 5000, 'scan': b"\x00" * 2048})
+    columns = [{'name': 'id', 'type': Integer()}, {'name': 'body', 'type': Text()},
+               {'name': 'scan', 'type': LargeBinary()}]
+    query, projections = bounded_select(engine, 'docs', columns, 10, max_chars=20)
+
+    with engine.connect() as conn:
+        frame = bound_frame(pd.read_sql(query, conn), projections, max_chars=20)
+
+    assert frame['body'].tolist() == ["x" * 19 + "…", "short"]
+    assert frame['scan'].tolist()[0] == "<binary, 2,048 bytes>"
+    assert pd.isna(frame['scan'].tolist()[1])
+    engine.dispose()
+
+
+def test_value_summaries():
+    assert truncate_value("abcdef", 4) == "abc…"
+    assert truncate_value("abcd", 4) == "abcd"
+    assert truncate_value(b"1234", 2) == "<binary, 4 bytes>"
+    assert truncate_value(12345, 2) == 12345
+    assert summarize_value(7, BINARY) == "<binary, 7 bytes>"
+    assert summarize_value("ST_Point", GEOMETRY) == "<geometry: ST_Point>"
+    assert summarize_value('{"a": "' + "b" * 50 + '"}', JSON_KIND, max_chars=10) == '<json> {"a": "bb…'
+    assert summarize_value(None, TEXT) is None
+
+
+def _bytes(samples):
+    return sum(len(str(value).encode('utf-8')) for values in samples.values() for value in values)
+
+
+def test_samples_within_budget_are_unchanged():
+    samples = {'a': ["x" * 10] * 3, 'b': [1, 2, 3]}
+
+    assert fit_byte_budget(samples, budget=1000) is samples
+
+
+def test_widest_values_are_cut_first():
+    samples = {'short': ["ab", "cd"], 'wide': ["w" * 500, "v" * 300]}
+
+    fitted = fit_byte_budget(samples, budget=200, min_chars=8)
+
+    assert fitted['short'] == ["ab", "cd"]
+    assert all(value.endswith("…") for value in fitted['wide'])
+    assert len(fitted['wide'][0]) == len(fitted['wide'][1])
+    assert _bytes(fitted) <= 200
+    # The largest common cut that fits is used
+    assert _bytes(fit_byte_budget(samples, budget=200 + 6, min_chars=8)) > _bytes(fitted)
+
+
+def test_multibyte_text_is_measured_in_bytes():
+    fitted = fit_byte_budget({'name': ["ü" * 100]}, budget=60, min_chars=4)
+
+    assert len(fitted['name'][0].encode('utf-8')) <= 60
+
+
+def test_very_wide_tables_keep_fewer_values():
+    samples = {f"column_{index}": ["y" * 50] * 5 for index in range(40)}
+
+    fitted = fit_byte_budget(samples, budget=40 * 2 * 12, min_chars=10)
+
+    assert all(len(values) == 2 for values in fitted.values())
+    assert _bytes(fitted) <= 40 * 2 * 12
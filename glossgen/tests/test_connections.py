@@ -0,0 +1,74 @@
+import pytest
+from sqlalchemy.pool import QueuePool
+
+from glossgen.config.app_config import AppConfig
+from glossgen.services import connections
+
+
+@pytest.mark.parametrize("timeout, expected", [(0.5, 1), (0, 0), (600, 600)])
+def test_mssql_timeout_is_never_rounded_down_to_no_timeout(monkeypatch, timeout, expected):
+    monkeypatch.setattr(AppConfig, 'DB_STATEMENT_TIMEOUT', timeout)
+    assert connections._connect_args('mssql', False)['timeout'] == expected
+
+
+def test_mysql_statement_timeout_per_server():
+    assert connections.mysql_statement_timeout(False, 1500) == "SET SESSION MAX_EXECUTION_TIME = 1500"
+    assert connections.mysql_statement_timeout(True, 1500) == "SET SESSION max_statement_time = 1.5"
+
+
+def test_mysql_connect_args_have_no_server_specific_init_command():
+    assert 'init_command' not in connections._connect_args('mysql', True)
+
+
+class _FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def execute(self, statement):
+        self.connection.statements.append(statement)
+        if statement in self.connection.rejected:
+            raise RuntimeError(f"Unknown system variable in: {statement}")
+
+    def fetchone(self):
+        return (self.connection.version,)
+
+    def close(self):
+        pass
+
+
+class _FakeConnection:
+    def __init__(self, version, rejected=()):
+        self.version = version
+        self.rejected = rejected
+        self.statements = []
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+
+def _connect(dbapi_connection, read_only):
+    # A bare pool: the listener is a pool "connect" event
+    pool = QueuePool(lambda: dbapi_connection)
+    connections._configure_mysql(pool, read_only)
+    pool.dispatch.connect(dbapi_connection, None)
+    return dbapi_connection.statements[1:]
+
+
+def test_mysql_sessions_get_max_execution_time(monkeypatch):
+    monkeypatch.setattr(AppConfig, 'DB_STATEMENT_TIMEOUT', 600)
+    assert _connect(_FakeConnection("8.0.36"), True) == [
+        "SET SESSION MAX_EXECUTION_TIME = 600000", "SET SESSION TRANSACTION READ ONLY"
+    ]
+
+
+def test_mariadb_sessions_get_max_statement_time(monkeypatch):
+    monkeypatch.setattr(AppConfig, 'DB_STATEMENT_TIMEOUT', 600)
+    assert _connect(_FakeConnection("10.11.6-MariaDB-0+deb12u1"), False) == [
+        "SET SESSION max_statement_time = 600"
+    ]
+
+
+def test_unsupported_timeout_does_not_fail_the_connection(monkeypatch):
+    monkeypatch.setattr(AppConfig, 'DB_STATEMENT_TIMEOUT', 600)
+    connection = _FakeConnection("5.6.51", rejected=("SET SESSION MAX_EXECUTION_TIME = 600000",))
+    assert _connect(connection, True)[-1] == "SET SESSION TRANSACTION READ ONLY"
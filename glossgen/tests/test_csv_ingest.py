@@ -0,0 +1,66 @@
+import io
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, inspect
+
+from glossgen.services.csv_ingest import run_csv_import_job
+from glossgen.services.job_runner import Job
+
+
+def _csv(frame):
+    buffer = io.BytesIO(frame.to_csv(index=False).encode('utf-8'))
+    buffer.name = "upload.csv"
+    return buffer
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'import.db'}")
+    pd.DataFrame({'id': range(120000), 'name': 'original'}).to_sql('people', engine, index=False)
+    yield engine
+    engine.dispose()
+
+
+def _tables(engine):
+    return sorted(inspect(engine).get_table_names())
+
+
+def test_failed_replace_keeps_existing_table(engine):
+    # The value after the inferred-integer sample does not fit the column
+    bad = pd.DataFrame({'id': [str(i) for i in range(15000)] + ['not a number'], 'name': 'new'})
+    with pytest.raises(ValueError):
+        run_csv_import_job(Job("csv_import", "test"), engine, [('people', _csv(bad))], chunk_rows=5000)
+
+    people = pd.read_sql("SELECT * FROM people", engine)
+    assert len(people) == 120000
+    assert set(people['name']) == {'original'}
+    assert _tables(engine) == ['people']
+
+
+def test_failed_multi_file_import_leaves_no_tables_behind(engine):
+    good = pd.DataFrame({'id': range(10), 'name': 'new'})
+    bad = pd.DataFrame({'id': [str(i) for i in range(15000)] + ['x']})
+    with pytest.raises(ValueError):
+        run_csv_import_job(
+            Job("csv_import", "test"), engine, [('orders', _csv(good)), ('items', _csv(bad))], chunk_rows=5000
+        )
+    assert _tables(engine) == ['people']
+
+
+def test_replace_and_append(engine):
+    new = pd.DataFrame({'id': range(3), 'name': 'new'})
+    loaded = run_csv_import_job(Job("csv_import", "test"), engine, [('people', _csv(new))])
+    assert loaded == {'people': 3}
+    assert pd.read_sql("SELECT COUNT(*) AS n FROM people", engine)['n'][0] == 3
+
+    run_csv_import_job(Job("csv_import", "test"), engine, [('people', _csv(new))], if_exists='append')
+    assert pd.read_sql("SELECT COUNT(*) AS n FROM people", engine)['n'][0] == 6
+    assert _tables(engine) == ['people']
+
+
+def test_fail_mode_refuses_existing_table(engine):
+    with pytest.raises(ValueError):
+        run_csv_import_job(Job("csv_import", "test"), engine, [('people', _csv(pd.DataFrame({'id': [1]})))],
+                           if_exists='fail')
+    assert pd.read_sql("SELECT COUNT(*) AS n FROM people", engine)['n'][0] == 120000
@@ -0,0 +1,127 @@
+import pandas as pd
+import pytest
+
+from glossgen.services import documentation
+from glossgen.services.description_reuse import DescriptionReuseIndex
+from glossgen.services.job_runner import Job
+
+
+def _schema(*columns):
+    return pd.DataFrame([
+        {'column_name': column, 'data_type': 'INTEGER', 'sample_data': [1, 2, 3]} for column in columns
+    ])
+
+
+SCHEMA_TABLES = {
+    'orders': _schema('order_id', 'customer_id'),
+    'invoices': _schema('invoice_id', 'customer_id'),
+}
+
+
+def test_reuses_known_descriptions_from_other_tables():
+    glossaries = {'customers': _schema('customer_id').assign(description="The customer")}
+    plan = DescriptionReuseIndex.from_glossaries(glossaries).plan(SCHEMA_TABLES)
+
+    assert plan.reused == {'orders': {'customer_id': "The customer"}, 'invoices': {'customer_id': "The customer"}}
+    assert {table: list(df['column_name']) for table, df in plan.requests.items()} == {
+        'orders': ['order_id'], 'invoices': ['invoice_id']
+    }
+    assert plan.reused_columns == 2
+    assert plan.reuse_rate == 50.0
+
+
+def test_reuses_descriptions_across_relationships():
+    glossaries = {'customers': _schema('id').assign(description="The customer")}
+    relationships = pd.DataFrame([{'table1': 'orders', 'column1': 'customer_id', 'table2': 'customers', 'column2': 'id'}])
+    plan = DescriptionReuseIndex.from_glossaries(glossaries, relationships).plan({'orders': _schema('customer_id')})
+    assert plan.reused == {'orders': {'customer_id': "The customer"}}
+
+
+def test_deferred_duplicate_uses_the_claiming_tables_description():
+    plan = DescriptionReuseIndex().plan(SCHEMA_TABLES)
+    assert plan.deferred == {'invoices': {'customer_id': plan.fingerprints[('orders', 'customer_id')]}}
+    assert list(plan.requests['invoices']['column_name']) == ['invoice_id']
+
+    plan.record_generated('orders', [{'column_name': 'customer_id', 'description': "Who ordered"}])
+    assert {'column_name': 'customer_id', 'description': "Who ordered"} in plan.descriptions_for('invoices')
+    assert plan.take_unresolved(SCHEMA_TABLES) == {}
+    assert plan.unresolved_tables() == []
+
+
+def test_deferred_duplicate_is_requested_from_its_own_table_if_unresolved():
+    plan = DescriptionReuseIndex().plan(SCHEMA_TABLES)
+    plan.record_generated('orders', [{'column_name': 'order_id', 'description': "The order"}])
+    assert plan.unresolved_tables() == ['invoices']
+
+    retry = plan.take_unresolved(SCHEMA_TABLES)
+    assert list(retry) == ['invoices']
+    assert list(retry['invoices']['column_name']) == ['customer_id']
+    assert plan.requested_columns == 4
+    assert plan.unresolved_tables() == []
+
+    plan.record_generated('invoices', [{'column_name': 'customer_id', 'description': "Who is billed"}])
+    assert plan.descriptions_for('invoices') == []
+
+
+class _Router:
+    def __init__(self):
+        self.on_failover = None
+
+    def map(self, fn, items):
+        for item in items:
+            try:
+                yield item, fn(item), None
+            except Exception as e:
+                yield item, None, e
+
+
+@pytest.fixture
+def run(monkeypatch):
+    requests = []
+
+    def generate_glossary(chain, extractor, table, schema_data):
+        requests.append((table, list(schema_data['column_name'])))
+        return [
+            {'column_name': column, 'description': f"{table}.{column}"}
+            for column in schema_data['column_name'] if column not in extractor.left_out.get(table, ())
+        ]
+
+    monkeypatch.setattr(documentation, 'profile_table', lambda extractor, table: SCHEMA_TABLES[table])
+    monkeypatch.setattr(documentation, 'generate_glossary', generate_glossary)
+    monkeypatch.setattr(documentation, 'generate_description', lambda *args: "A table")
+
+    def run_job(left_out):
+        extractor = type('Extractor', (), {'left_out': left_out})()
+        job = Job("documentation", "test")
+        result = documentation.run_documentation_job(
+            job, _Router(), extractor, list(SCHEMA_TABLES), {}, pd.DataFrame()
+        )
+        glossaries = {
+            key.split(':', 1)[1]: dict(zip(value['column_name'], value['description']))
+            for key, value in job.results.items() if key.startswith(documentation.GLOSSARY_RESULT)
+        }
+        return result, glossaries, job, requests
+
+    return run_job
+
+
+def test_documentation_fills_deferred_columns(run):
+    result, glossaries, job, requests = run({})
+    assert requests == [('orders', ['order_id', 'customer_id']), ('invoices', ['invoice_id'])]
+    assert glossaries['invoices']['customer_id'] == "orders.customer_id"
+    assert result['failed_tables'] == []
+    assert result['reused_columns'] == 1
+
+
+def test_documentation_requests_deferred_columns_the_claiming_table_left_out(run):
+    result, glossaries, job, requests = run({'orders': {'customer_id'}})
+    assert requests[-1] == ('invoices', ['customer_id'])
+    assert glossaries['invoices']['customer_id'] == "invoices.customer_id"
+    assert result['failed_tables'] == []
+
+
+def test_documentation_reports_deferred_columns_that_stay_undescribed(run):
+    result, glossaries, job, requests = run({'orders': {'customer_id'}, 'invoices': {'customer_id'}})
+    assert pd.isna(glossaries['invoices']['customer_id'])
+    assert result['failed_tables'] == ['invoices']
+    assert any('invoices' in warning for warning in job.warnings)
@@ -0,0 +1,52 @@
+import pandas as pd
+import pytest
+
+from glossgen.services import documentation
+from glossgen.services.documentation import ProfilingQueue, run_profiling_job
+from glossgen.services.job_runner import Job
+
+
+class _Extractor:
+    schema_info = {table: {'columns': []} for table in ['a', 'b', 'c', 'd']}
+
+    def estimate_row_counts(self):
+        return {'a': 10, 'b': 20, 'c': 30, 'd': 40}
+
+
+def test_queue_takes_recent_tables_first_then_the_jobs_order():
+    queue = ProfilingQueue(['a', 'b', 'c'], recent_tables=['c', 'x'])
+    queue.set_order(['b', 'a', 'c'])
+    assert [queue.take() for _ in range(4)] == ['c', 'b', 'a', None]
+
+
+def test_queue_skips_tables_done_elsewhere():
+    queue = ProfilingQueue(['a', 'b', 'c'])
+    queue.mark_done('a')
+    queue.prioritize('a')
+    assert [queue.take() for _ in range(3)] == ['b', 'c', None]
+
+
+@pytest.fixture
+def profiled(monkeypatch):
+    profiled = []
+
+    def profile_table(extractor, table):
+        profiled.append(table)
+        if table == 'a':
+            # The user opens d and profiles b on the main thread meanwhile
+            queue.prioritize('d')
+            queue.mark_done('b')
+        return pd.DataFrame({'column_name': ['id']})
+
+    queue = ProfilingQueue(['a', 'b', 'c', 'd'])
+    monkeypatch.setattr(documentation, 'profile_table', profile_table)
+    return queue, profiled
+
+
+def test_profiling_job_follows_the_queue_while_it_runs(profiled):
+    queue, profiled_tables = profiled
+    job = Job("glossary_profiling", "test")
+    run_profiling_job(job, _Extractor(), queue, ['a', 'b', 'c', 'd'])
+    assert profiled_tables == ['a', 'd', 'c']
+    assert sorted(job.results) == ['a', 'c', 'd']
+    assert job.completed == job.total == 4
@@ -0,0 +1,84 @@
+import io
+import resource
+import zipfile
+import xml.etree.ElementTree as ElementTree
+
+import pandas as pd
+import pytest
+
+from glossgen.services.exporters import EXCEL_SHEET_NAME_LIMIT, excel_sheet_names, write_glossary_excel
+from glossgen.state.glossary_store import GlossaryStore
+
+NS = {'x': "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+
+
+def _workbook(glossaries, tables):
+    content = io.BytesIO()
+    write_glossary_excel(glossaries, tables)(content)
+    return zipfile.ZipFile(content)
+
+
+def _sheet_names(workbook):
+    root = ElementTree.fromstring(workbook.read('xl/workbook.xml'))
+    return [sheet.get('name') for sheet in root.iterfind('x:sheets/x:sheet', NS)]
+
+
+def _rows(workbook, number):
+    root = ElementTree.fromstring(workbook.read(f'xl/worksheets/sheet{number}.xml'))
+    rows = []
+    for row in root.iterfind('x:sheetData/x:row', NS):
+        rows.append([
+            cell.findtext('x:is/x:t', namespaces=NS) if cell.get('t') == 'inlineStr' else cell.findtext('x:v', namespaces=NS)
+            for cell in row.iterfind('x:c', NS)
+        ])
+    return rows
+
+
+def test_sheet_names_are_valid_unique_and_stable():
+    tables = ['orders', 'ORDERS', 'sales/2024:q1', 'x' * 40, 'x' * 40 + 'y', 'index']
+    names = excel_sheet_names(tables)
+
+    assert names['orders'] == 'orders'
+    assert names['sales/2024:q1'] == 'sales_2024_q1'
+    assert all(len(name) <= EXCEL_SHEET_NAME_LIMIT for name in names.values())
+    assert len({name.lower() for name in names.values()} | {'index'}) == len(tables) + 1
+    assert excel_sheet_names(tables) == names
+
+
+def test_index_and_table_sheets():
+    glossaries = GlossaryStore({
+        'orders': pd.DataFrame({
+            'column_name': ['id', 'total'],
+            'description': ['Order id', None],
+            'null_percentage': [0.0, 12.5],
+            'sample_data': [[1, 2], []],
+        }),
+        "o'brien": pd.DataFrame({'column_name': ['name']}),
+    })
+    workbook = _workbook(glossaries, ['orders', "o'brien"])
+
+    assert _sheet_names(workbook) == ['Index', 'orders', "o'brien"]
+    assert _rows(workbook, 1) == [['Table', 'Sheet', 'Columns'], ['orders', 'orders', '2'], ["o'brien", "o'brien", '1']]
+    index = ElementTree.fromstring(workbook.read('xl/worksheets/sheet1.xml'))
+    assert [link.get('location') for link in index.iterfind('x:hyperlinks/x:hyperlink', NS)] == [
+        "'orders'!A1", "'o''brien'!A1"
+    ]
+    assert _rows(workbook, 2) == [
+        ['column_name', 'description', 'null_percentage', 'sample_data'],
+        ['id', 'Order id', '0', "['1', '2']"],
+        ['total', '12.5', '[]'],
+    ]
+
+
+def test_many_tables_do_not_keep_a_file_per_sheet_open():
+    tables = [f"table_{index}" for index in range(200)]
+    glossaries = GlossaryStore({table: pd.DataFrame({'column_name': ['id', 'name']}) for table in tables})
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (min(128, hard), hard))
+    try:
+        workbook = _workbook(glossaries, tables)
+    finally:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+
+    assert len(_sheet_names(workbook)) == 201
+    assert _rows(workbook, 201) == [['column_name'], ['id'], ['name']]
@@ -0,0 +1,140 @@
+import io
+import json
+import os
+import threading
+
+import pandas as pd
+import pytest
+
+from glossgen.config.app_config import AppConfig
+from glossgen.services.exporters import (
+    ExportCache,
+    glossary_export_key,
+    iter_glossary_csv,
+    iter_glossary_json,
+    iter_glossary_jsonl,
+    write_chunks
+)
+from glossgen.state.glossary_store import GlossaryStore
+
+
+@pytest.fixture(autouse=True)
+def export_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(AppConfig, 'EXPORT_CACHE_DIR', str(tmp_path / "exports"))
+    return tmp_path / "exports"
+
+
+@pytest.fixture
+def glossaries():
+    return GlossaryStore({
+        'customers': pd.DataFrame({
+            'column_name': ['id', 'name'],
+            'description': ['Customer id', 'Full name'],
+        }),
+        'orders': pd.DataFrame({
+            'column_name': ['id', 'customer_id'],
+            'description': ['Order id', None],
+            'data_type': ['INTEGER', 'INTEGER'],
+        }),
+    })
+
+
+def _text(chunks):
+    return "".join(chunks)
+
+
+def test_csv_has_one_header_for_every_table(glossaries):
+    chunks = list(iter_glossary_csv(glossaries, ['customers', 'orders']))
+    df = pd.read_csv(io.StringIO(_text(chunks)))
+
+    assert len(chunks) == 3
+    assert list(df.columns) == ['column_name', 'description', 'data_type', 'table_name']
+    assert df['table_name'].tolist() == ['customers', 'customers', 'orders', 'orders']
+    assert df['data_type'].isna().tolist() == [True, True, False, False]
+
+
+def test_json_and_jsonl_hold_the_same_records(glossaries):
+    tables = ['customers', 'orders']
+    text, text_lines = _text(iter_glossary_json(glossaries, tables)), _text(iter_glossary_jsonl(glossaries, tables))
+    document = json.loads(text)
+    lines = [json.loads(line) for line in text_lines.splitlines()]
+
+    assert list(document) == tables
+    assert document['customers'][1] == {'column_name': 'name', 'description': 'Full name'}
+    assert [line['table_name'] for line in lines] == ['customers', 'customers', 'orders', 'orders']
+    assert lines[3]['column_name'] == 'customer_id' and lines[3]['description'] is None
+    # Missing values must be null: NaN is not valid JSON
+    assert "NaN" not in text and "NaN" not in text_lines
+    assert json.loads(_text(iter_glossary_json(glossaries, []))) == {}
+
+
+def test_export_key_follows_content_format_and_tables(glossaries):
+    key = glossary_export_key("csv", glossaries, ['customers', 'orders'])
+
+    assert glossary_export_key("csv", glossaries.copy(), ['customers', 'orders']) == key
+    assert glossary_export_key("json", glossaries, ['customers', 'orders']) != key
+    assert glossary_export_key("csv", glossaries, ['customers']) != key
+    edited = glossaries['orders']
+    edited.loc[1, 'description'] = "Customer of the order"
+    glossaries['orders'] = edited
+    assert glossary_export_key("csv", glossaries, ['customers', 'orders']) != key
+
+
+def test_unchanged_exports_are_served_from_the_cached_file(glossaries):
+    builds = []
+
+    def writer(export_file):
+        builds.append(1)
+        write_chunks(iter_glossary_csv(glossaries, ['customers']))(export_file)
+
+    first = ExportCache.get_or_build("key", ".csv", writer)
+    second = ExportCache.get_or_build("key", ".csv", writer)
+
+    assert first == second == ExportCache.lookup("key", ".csv")
+    assert builds == [1]
+    assert pd.read_csv(first)['column_name'].tolist() == ['id', 'name']
+
+
+def test_failed_build_leaves_no_file(export_dir):
+    def writer(export_file):
+        export_file.write(b"partial")
+        raise RuntimeError("disk full")
+
+    with pytest.raises(RuntimeError):
+        ExportCache.get_or_build("key", ".csv", writer)
+
+    assert ExportCache.lookup("key", ".csv") is None
+    assert os.listdir(export_dir) == []
+
+
+def test_concurrent_requests_build_once():
+    builds = []
+    started = threading.Event()
+
+    def writer(export_file):
+        builds.append(1)
+        started.set()
+        threading.Event().wait(0.2)
+        export_file.write(b"content")
+
+    paths = []
+    threads = [threading.Thread(target=lambda: paths.append(ExportCache.get_or_build("key", ".txt", writer)))
+               for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert builds == [1]
+    assert len(set(paths)) == 1
+
+
+def test_oldest_exports_are_evicted(monkeypatch, export_dir):
+    monkeypatch.setattr(AppConfig, 'EXPORT_CACHE_MAX_FILES', 2)
+    for index, key in enumerate(["a", "b", "c"]):
+        path = ExportCache.get_or_build(key, ".txt", lambda export_file: export_file.write(b"x"))
+        os.utime(path, (index, index))
+
+    ExportCache.get_or_build("d", ".txt", lambda export_file: export_file.write(b"x"))
+
+    assert sorted(os.listdir(export_dir)) == ["c.txt", "d.txt"]
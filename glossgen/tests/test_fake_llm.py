@@ -0,0 +1,35 @@
+import pandas as pd
+import pytest
+
+from glossgen.chains.glossary_chain import GlossaryChain
+from glossgen.config.app_config import AppConfig
+from glossgen.services.llm_registry import LLMClientRegistry
+from glossgen.services.llm_router import GenerationRouter, GenerationTarget
+
+
+@pytest.fixture
+def router(monkeypatch):
+    monkeypatch.setattr(AppConfig, 'STUB_LLM_LATENCY_MEAN', 0.0)
+    monkeypatch.setattr(AppConfig, 'STUB_LLM_ERROR_RATE', 0.0)
+    monkeypatch.setattr(AppConfig, 'STUB_LLM_TOKENS_PER_SECOND', 1e9)
+    LLMClientRegistry.clear()
+    return GenerationRouter([GenerationTarget("Local Stub", "stub-model")])
+
+
+def _schema(columns):
+    return pd.DataFrame({
+        'column_name': columns,
+        'data_type': 'INTEGER',
+        'is_primary_key': False,
+        'sample_data': [[1, 2, 3]] * len(columns),
+        'description': None,
+        'comments': None
+    })
+
+
+@pytest.mark.parametrize("n_columns", [3, 80])
+def test_stub_describes_every_column_of_the_prompt(router, n_columns):
+    columns = [f"col_{i}" for i in range(n_columns)]
+    glossary = GlossaryChain(router=router).invoke(_schema(columns))
+    # Rows pandas leaves out of the printed table are requested in repair rounds
+    assert sorted(item['column_name'] for item in glossary) == sorted(columns)
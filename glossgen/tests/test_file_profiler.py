@@ -0,0 +1,121 @@
+import io
+import os
+
+import pandas as pd
+import pytest
+
+from glossgen.config.app_config import AppConfig
+from glossgen.tools.file_profiler import FileSchemaExtractor
+
+ROWS = 2500
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    # Several chunks per file, so the counts must add up across them
+    monkeypatch.setattr(AppConfig, 'PROFILE_CHUNK_ROWS', 400)
+
+
+def _customers():
+    return pd.DataFrame({
+        'customer_id': range(ROWS),
+        'segment': [f"s{i % 7}" for i in range(ROWS)],
+        'score': [None if i % 5 == 0 else i / 10 for i in range(ROWS)],
+    })
+
+
+def _orders():
+    return pd.DataFrame({
+        'order_id': range(ROWS * 2),
+        'customer_id': [i % (ROWS // 2) for i in range(ROWS * 2)],
+        'paid': [i % 3 == 0 for i in range(ROWS * 2)],
+    })
+
+
+@pytest.fixture
+def extractor(tmp_path):
+    customers, orders = tmp_path / "customers.csv", tmp_path / "orders.parquet"
+    _customers().to_csv(customers, index=False)
+    _orders().to_parquet(orders, index=False)
+    return FileSchemaExtractor([('customers', str(customers)), ('orders', str(orders))], "shop")
+
+
+def test_schema_comes_from_csv_sample_and_parquet_metadata(extractor):
+    assert extractor.schema_info['customers']['dtypes'] == {'customer_id': 'INTEGER', 'segment': 'TEXT', 'score': 'FLOAT'}
+    assert extractor.schema_info['orders']['dtypes'] == {'order_id': 'INTEGER', 'customer_id': 'INTEGER', 'paid': 'BOOLEAN'}
+    # Parquet row counts are known without reading data; CSV ones after profiling
+    assert extractor.estimate_row_counts() == {'orders': ROWS * 2}
+
+
+def test_profile_counts_add_up_across_chunks(extractor):
+    assert extractor.get_table_stats() == {'customers': ROWS, 'orders': ROWS * 2}
+    assert extractor.get_null_percentage('customers')['score'] == pytest.approx(20.0)
+    uniqueness = extractor.get_uniqueness_percentage('orders')
+    assert uniqueness['order_id'] == pytest.approx(100.0)
+    assert uniqueness['customer_id'] == pytest.approx(25.0)
+    assert extractor.profile('customers').distinct['segment'].count() == 7
+    assert extractor.estimate_row_counts() == {'customers': ROWS, 'orders': ROWS * 2}
+
+
+def test_profile_is_read_once_and_serves_previews(extractor):
+    profile = extractor.profile('customers')
+
+    assert extractor.profile('customers') is profile
+    preview = extractor.get_preview('customers', 5)
+    assert preview['customer_id'].tolist() == [0, 1, 2, 3, 4]
+    assert len(profile.preview) == AppConfig.PROFILE_PREVIEW_ROWS
+
+
+def test_preview_before_profiling_reads_only_the_first_rows(extractor):
+    assert extractor.get_preview('orders', 3)['order_id'].tolist() == [0, 1, 2]
+    assert 'orders' not in extractor._profiles
+
+
+def test_primary_key_and_relationships_from_profiles(extractor):
+    candidates = extractor.infer_primary_key('customers')
+    assert candidates.loc[candidates['is_primary_key'], 'column_name'].tolist() == ['customer_id']
+    related = extractor.assert_relationship('orders', 'customers', 'customer_id', 'customer_id')
+    unrelated = extractor.assert_relationship('orders', 'customers', 'paid', 'segment')
+
+    assert related > 80
+    assert unrelated < related
+
+
+def test_sample_data_is_bounded(extractor):
+    samples = extractor.get_sample_data('customers', n=3)
+
+    assert set(samples) == {'customer_id', 'segment', 'score'}
+    assert all(len(values) <= 3 for values in samples.values())
+
+
+def test_csv_values_that_break_the_sampled_type_fall_back_to_text(tmp_path):
+    path = tmp_path / "codes.csv"
+    codes = [str(i) for i in range(AppConfig.CSV_SAMPLE_ROWS)] + ["A-17"]
+    pd.DataFrame({'code': codes}).to_csv(path, index=False)
+    extractor = FileSchemaExtractor([('codes', str(path))])
+
+    profile = extractor.profile('codes')
+
+    assert profile.rows == len(codes)
+    assert extractor._dtypes['codes'] == {'code': 'string'}
+
+
+def test_uploaded_files_are_read_from_the_start_every_time():
+    upload = io.BytesIO(_customers().to_csv(index=False).encode('utf-8'))
+    upload.name = "customers.csv"
+    extractor = FileSchemaExtractor([('customers', upload)])
+
+    assert extractor.get_preview('customers', 2)['customer_id'].tolist() == [0, 1]
+    assert extractor.profile('customers').rows == ROWS
+
+
+def test_changed_files_get_a_new_source_key(tmp_path):
+    path = tmp_path / "customers.csv"
+    _customers().to_csv(path, index=False)
+    before = FileSchemaExtractor([('customers', str(path))]).source_key
+
+    _customers().head(10).to_csv(path, index=False)
+    os.utime(path, ns=(0, 10 ** 9))
+
+    assert FileSchemaExtractor([('customers', str(path))]).source_key != before
+    assert FileSchemaExtractor([('customers', str(path))]).source_key.startswith("files:")
@@ -0,0 +1,112 @@
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+
+from glossgen.tools import frame_cache
+from glossgen.tools.frame_cache import FrameCache
+from glossgen.tools.sql import SchemaExtractor, preview_cache
+
+
+def _loader(calls, rows=10):
+    def load():
+        calls.append(1)
+        return pd.DataFrame({'value': range(rows)})
+    return load
+
+
+def test_repeated_reads_hit_the_cache_and_return_copies():
+    cache = FrameCache(ttl=60, max_bytes=1 << 20)
+    calls = []
+
+    first = cache.get_or_load('key', _loader(calls))
+    first.loc[0, 'value'] = -1
+    second = cache.get_or_load('key', _loader(calls))
+
+    assert calls == [1]
+    assert second.loc[0, 'value'] == 0
+    assert cache.info()['hits'] == 1 and cache.info()['misses'] == 1
+
+
+def test_expired_entries_are_loaded_again(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(frame_cache.time, 'monotonic', lambda: now[0])
+    cache = FrameCache(ttl=10, max_bytes=1 << 20)
+    calls = []
+
+    cache.get_or_load('key', _loader(calls))
+    now[0] += 5
+    cache.get_or_load('key', _loader(calls))
+    now[0] += 6
+    cache.get_or_load('key', _loader(calls))
+
+    assert len(calls) == 2
+
+
+def test_memory_cap_evicts_least_recently_used():
+    size = int(pd.DataFrame({'value': range(100)}).memory_usage(deep=True).sum())
+    cache = FrameCache(ttl=60, max_bytes=2 * size)
+    calls = []
+
+    cache.get_or_load('a', _loader(calls, 100))
+    cache.get_or_load('b', _loader(calls, 100))
+    cache.get_or_load('a', _loader(calls, 100))
+    cache.get_or_load('c', _loader(calls, 100))
+
+    assert len(calls) == 3
+    assert cache.info()['frames'] == 2
+    assert cache.info()['bytes'] <= 2 * size
+    cache.get_or_load('b', _loader(calls, 100))
+    assert len(calls) == 4
+
+
+def test_frames_larger_than_the_cap_are_not_cached():
+    cache = FrameCache(ttl=60, max_bytes=10)
+    calls = []
+
+    cache.get_or_load('key', _loader(calls))
+    cache.get_or_load('key', _loader(calls))
+
+    assert len(calls) == 2
+    assert cache.info()['frames'] == 0
+
+
+def test_loader_errors_are_not_cached():
+    cache = FrameCache(ttl=60, max_bytes=1 << 20)
+
+    def failing():
+        raise RuntimeError("database is locked")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_load('key', failing)
+    assert cache.get_or_load('key', lambda: pd.DataFrame({'value': [1]}))['value'].tolist() == [1]
+
+
+def test_clear_by_prefix_only_drops_that_connection():
+    cache = FrameCache(ttl=60, max_bytes=1 << 20)
+    calls = []
+    cache.get_or_load(('one', 'orders'), _loader(calls))
+    cache.get_or_load(('two', 'orders'), _loader(calls))
+
+    cache.clear(('one',))
+
+    assert cache.info()['frames'] == 1
+    cache.get_or_load(('two', 'orders'), _loader(calls))
+    assert len(calls) == 2
+
+
+def test_previews_are_cached_per_connection_and_schema(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'preview.db'}")
+    pd.DataFrame({'id': range(20), 'name': [f"n{i}" for i in range(20)]}).to_sql('items', engine, index=False)
+    extractor = SchemaExtractor(engine)
+    preview_cache.clear()
+
+    first = extractor.get_preview('items', 5)
+    hits = preview_cache.info()['hits']
+    second = extractor.get_preview('items', 5)
+
+    assert len(first) == 5
+    assert second.equals(first)
+    assert preview_cache.info()['hits'] == hits + 1
+    preview_cache.clear((extractor.connection_id,))
+    assert preview_cache.info()['frames'] == 0
+    engine.dispose()
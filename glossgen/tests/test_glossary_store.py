@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from glossgen.config.app_config import AppConfig
+from glossgen.state.glossary_store import CompactGlossary, GlossaryStore
+
+
+def _glossary():
+    return pd.DataFrame({
+        'column_name': ['id', 'name', 'notes'],
+        'data_type': ['INTEGER', 'VARCHAR(50)', None],
+        'description': ['Identifier', None, float('nan')],
+        'uniqueness_percentage': [100.0, 87.5, None],
+        'null_percentage': [0.0, 12.5, 50.0],
+        'is_primary_key': [True, False, None],
+        'sample_data': [[1, 2, 3], ['a', None, 'b'], None],
+        'owner': ['ops', 'ops', 'sales']
+    })
+
+
+def _values(series):
+    return [None if not isinstance(value, list) and pd.isna(value) else value for value in series]
+
+
+def test_round_trip_keeps_values_and_missing_markers():
+    frame = GlossaryStore({'items': _glossary()})['items']
+
+    assert list(frame.columns) == list(_glossary().columns)
+    assert frame['column_name'].tolist() == ['id', 'name', 'notes']
+    assert _values(frame['data_type']) == ['INTEGER', 'VARCHAR(50)', None]
+    assert _values(frame['description']) == ['Identifier', None, None]
+    assert frame['uniqueness_percentage'].tolist()[:2] == [100.0, 87.5]
+    assert np.isnan(frame['uniqueness_percentage'].iloc[2])
+    assert frame['is_primary_key'].tolist() == [True, False, None]
+    assert frame['sample_data'].tolist() == [['1', '2', '3'], ['a', 'b'], []]
+    assert frame['owner'].tolist() == ['ops', 'ops', 'sales']
+
+
+def test_samples_are_bounded():
+    long_value = "x" * (AppConfig.GLOSSARY_SAMPLE_CHARS + 20)
+    df = pd.DataFrame({'column_name': ['text'], 'sample_data': [[long_value] * (AppConfig.GLOSSARY_SAMPLE_VALUES + 3)]})
+
+    sample = GlossaryStore({'t': df})['t']['sample_data'].iloc[0]
+
+    assert len(sample) == AppConfig.GLOSSARY_SAMPLE_VALUES
+    assert all(len(value) == AppConfig.GLOSSARY_SAMPLE_CHARS and value.endswith("…") for value in sample)
+
+
+def test_views_are_copies_written_back_explicitly():
+    store = GlossaryStore({'items': _glossary()})
+    view = store['items']
+    view.loc[1, 'description'] = "Display name"
+
+    assert pd.isna(store['items']['description'].iloc[1])
+    store['items'] = view
+    assert store['items']['description'].iloc[1] == "Display name"
+
+
+def test_column_names_are_interned_across_tables():
+    store = GlossaryStore({'a': _glossary(), 'b': _glossary()})
+
+    assert store.compact('a').data['column_name'][0] is store.compact('b').data['column_name'][0]
+
+
+def test_fingerprint_follows_content_and_snapshots_track_writes():
+    store = GlossaryStore({'a': _glossary(), 'b': _glossary()})
+    snapshot = store.copy()
+    before = store.fingerprint()
+
+    assert GlossaryStore({'a': _glossary(), 'b': _glossary()}).fingerprint() == before
+    store['a'] = store['a']
+    assert store.fingerprint() == before
+    assert not store.unchanged_since(snapshot, 'a')
+    assert store.unchanged_since(snapshot, 'b')
+
+    edited = store['b']
+    edited.loc[0, 'description'] = "Changed"
+    store['b'] = edited
+    assert store.fingerprint() != before
+    assert store.fingerprint(['a']) == snapshot.fingerprint(['a'])
+
+
+def test_from_columns_wraps_compact_data():
+    original = CompactGlossary(_glossary())
+    wrapped = CompactGlossary.from_columns(list(original.columns), original.data)
+
+    assert len(wrapped) == 3
+    assert wrapped.digest() == original.digest()
+    pd.testing.assert_frame_equal(wrapped.to_frame(), original.to_frame())
+
+
+def test_repeated_names_and_types_are_counted_once():
+    def glossary(names):
+        return CompactGlossary(pd.DataFrame({
+            'column_name': names,
+            'data_type': ['VARCHAR(255)'] * len(names),
+            'null_percentage': np.linspace(0, 100, len(names))
+        }))
+
+    repeated = glossary([f"column_{i % 40}" for i in range(2000)])
+    distinct = glossary([f"column_{i}" for i in range(2000)])
+
+    assert repeated.nbytes() < distinct.nbytes() / 2
+    assert repeated.data['null_percentage'].dtype == np.float32
+
+
+def test_mapping_interface():
+    store = GlossaryStore({'a': _glossary()})
+    store['b'] = _glossary().to_dict(orient='list')
+
+    assert sorted(store) == ['a', 'b'] and len(store) == 2 and 'b' in store
+    assert store.columns('b') == list(_glossary().columns)
+    del store['a']
+    with pytest.raises(KeyError):
+        store['a']
@@ -0,0 +1,120 @@
+import threading
+import time
+
+import pytest
+
+from glossgen.services.job_runner import CANCELLED, DONE, FAILED, JobRunner
+
+
+def _wait(job, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not job.finished and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert job.finished
+
+
+@pytest.fixture
+def runner():
+    return JobRunner(max_workers=2)
+
+
+def test_progress_and_partial_results(runner):
+    step = threading.Event()
+
+    def work(job, items):
+        job.set_total(len(items))
+        for item in items:
+            job.add_result(item, item.upper())
+            if item == "b":
+                step.wait(5)
+        return "finished"
+
+    job = runner.submit("test", work, owner="session", items=["a", "b", "c"])
+    deadline = time.monotonic() + 5
+    while job.completed < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert job.progress == pytest.approx(2 / 3)
+    assert job.snapshot_results() == {'a': "A", 'b': "B"}
+    step.set()
+    _wait(job)
+    assert job.status == DONE
+    assert job.result == "finished"
+    assert job.progress == 1.0
+    assert job.summary()['progress'] == "3/3"
+
+
+def test_cancel_stops_the_job_at_the_next_check(runner):
+    started = threading.Event()
+    interrupted = []
+
+    def work(job):
+        job.on_cancel(lambda: interrupted.append(True))
+        started.set()
+        while True:
+            job.check_cancelled()
+            time.sleep(0.01)
+
+    job = runner.submit("test", work, owner="session")
+    assert started.wait(5)
+    runner.cancel(job.job_id)
+    _wait(job)
+
+    assert job.status == CANCELLED
+    assert interrupted == [True]
+
+
+def test_errors_after_cancel_count_as_cancelled(runner):
+    started, release = threading.Event(), threading.Event()
+
+    def work(job):
+        started.set()
+        release.wait(5)
+        raise RuntimeError("connection closed by interrupt")
+
+    job = runner.submit("test", work, owner="session")
+    assert started.wait(5)
+    job.cancel()
+    release.set()
+    _wait(job)
+
+    assert job.status == CANCELLED
+    assert job.error is None
+
+
+def test_failed_job_keeps_its_error(runner):
+    def work(job):
+        job.warn("first item skipped")
+        raise ValueError("boom")
+
+    job = runner.submit("test", work, owner="session")
+    _wait(job)
+
+    assert job.status == FAILED
+    assert job.error == "boom"
+    assert job.warnings == ["first item skipped"]
+
+
+def test_cancel_callback_registered_late_runs_at_once(runner):
+    job = runner.submit("test", lambda job: None, owner="session")
+    _wait(job)
+    job.cancel()
+    calls = []
+
+    job.on_cancel(lambda: calls.append(True))
+
+    assert calls == [True]
+
+
+def test_jobs_are_listed_per_owner_and_purged_when_expired(runner):
+    first = runner.submit("test", lambda job: 1, owner="one")
+    second = runner.submit("test", lambda job: 2, owner="two")
+    _wait(first)
+    _wait(second)
+
+    assert runner.list_jobs("one") == [first]
+    assert runner.purge(ttl=60) == 0
+    first.finished_at -= 120
+    assert runner.purge(ttl=60) == 1
+    assert runner.get(first.job_id) is None
+    assert runner.get(second.job_id) is second
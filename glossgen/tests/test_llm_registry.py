@@ -0,0 +1,75 @@
+import sys
+import threading
+import types
+
+import pytest
+
+from glossgen.services.llm_registry import LLMClientRegistry
+from glossgen.utils import ai_utils
+
+
+class FakeChatOpenAI:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+@pytest.fixture
+def fake_openai(monkeypatch):
+    module = types.ModuleType("langchain_openai")
+    module.ChatOpenAI = FakeChatOpenAI
+    monkeypatch.setitem(sys.modules, "langchain_openai", module)
+    LLMClientRegistry.clear()
+    yield
+    LLMClientRegistry.clear()
+
+
+def _get_client(provider, endpoint=None):
+    """get_llm_client on a thread, failing instead of hanging if it deadlocks"""
+    result = {}
+    worker = threading.Thread(
+        target=lambda: result.setdefault(
+            'client', ai_utils.get_llm_client(provider, "sk-test", "gpt-4o-mini", endpoint)
+        ),
+        daemon=True
+    )
+    worker.start()
+    worker.join(timeout=5)
+    assert not worker.is_alive(), f"get_llm_client({provider!r}) did not return"
+    return result['client']
+
+
+@pytest.mark.parametrize("provider,endpoint", [
+    ("OpenAI", None),
+    ("OpenAI Compatible", "http://localhost:8000/v1"),
+    ("Deepseek", None),
+    ("Unknown", None),
+])
+def test_get_llm_client_creates_client_with_shared_http_pool(fake_openai, provider, endpoint):
+    client = _get_client(provider, endpoint)
+
+    assert isinstance(client, FakeChatOpenAI)
+    assert client.kwargs['http_client'] is not None
+    assert _get_client(provider, endpoint) is client
+    assert LLMClientRegistry.stats() == {'llm_clients': 1, 'http_pools': 1}
+
+
+def test_concurrent_requests_build_one_client(fake_openai):
+    built = []
+
+    def factory():
+        built.append(LLMClientRegistry.get_http_client(None))
+        return object()
+
+    key = LLMClientRegistry.make_key("OpenAI", "gpt-4o-mini", None, "sk-test", 0.2)
+    clients = []
+    threads = [
+        threading.Thread(target=lambda: clients.append(LLMClientRegistry.get_or_create(key, factory)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(built) == 1
+    assert len(clients) == 8 and all(client is clients[0] for client in clients)
@@ -0,0 +1,107 @@
+import time
+
+import httpx
+import pytest
+
+from glossgen.services.llm_resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    DeadlineExceededError,
+    ResilientCaller
+)
+from glossgen.tools.stub_llm_server import StubLLMServer
+
+
+class ProviderError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+def _post(server):
+    def request():
+        response = httpx.post(f"{server.url}/chat/completions", json={'model': 'stub', 'messages': []})
+        response.raise_for_status()
+        return response.json()
+    return request
+
+
+def _caller(threshold=2, reset_timeout=60.0):
+    caller = ResilientCaller(max_retries=0, backoff_base=0.0, backoff_max=0.0, deadline=5.0)
+    caller._breakers['stub'] = CircuitBreaker(failure_threshold=threshold, reset_timeout=reset_timeout)
+    return caller
+
+
+def _half_open(caller):
+    breaker = caller.breaker('stub')
+    breaker.state = CircuitBreaker.OPEN
+    breaker.opened_at = time.monotonic() - breaker.reset_timeout
+    return breaker
+
+
+def test_server_errors_open_the_circuit():
+    caller = _caller()
+    with StubLLMServer(error_rate=1.0, seed=1) as server:
+        for _ in range(2):
+            with pytest.raises(httpx.HTTPStatusError):
+                caller.call(_post(server), 'stub', 'stub')
+        with pytest.raises(CircuitOpenError):
+            caller.call(_post(server), 'stub', 'stub')
+        assert server.stats['requests'] == 2
+
+
+@pytest.mark.parametrize("status_code", [400, 401, 403, 404])
+def test_client_errors_do_not_open_the_circuit(status_code):
+    caller = _caller()
+
+    def bad_request():
+        raise ProviderError(status_code)
+
+    for _ in range(5):
+        with pytest.raises(ProviderError):
+            caller.call(bad_request, 'stub', 'stub')
+    assert caller.breaker('stub').state == CircuitBreaker.CLOSED
+
+
+def test_throttle_leaves_a_half_open_circuit_half_open():
+    caller = _caller()
+    breaker = _half_open(caller)
+    with StubLLMServer(throttle_rate=1.0, retry_after=0, seed=1) as server:
+        with pytest.raises(httpx.HTTPStatusError):
+            caller.call(_post(server), 'stub', 'stub')
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    # The probe was given back, so the next call may probe again
+    with StubLLMServer(seed=1) as server:
+        caller.call(_post(server), 'stub', 'stub')
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_deadline_waiting_for_a_slot_releases_the_probe():
+    caller = _caller()
+    breaker = _half_open(caller)
+    limiter = caller.limiter('stub')
+    limiter.paused_until = time.monotonic() + 60
+
+    with pytest.raises(DeadlineExceededError):
+        caller.call(lambda: None, 'stub', 'stub', deadline=0.05)
+
+    assert breaker.is_available()
+    limiter.paused_until = 0.0
+    assert caller.call(lambda: 'ok', 'stub', 'stub') == 'ok'
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_hung_request_is_abandoned_at_the_deadline():
+    caller = _caller()
+    limiter = caller.limiter('stub')
+    with StubLLMServer(latency=3.0, seed=1) as server:
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceededError):
+            caller.call(_post(server), 'stub', 'stub', deadline=0.5)
+        assert time.monotonic() - started < 1.5
+        # The abandoned request keeps its concurrency slot until it returns
+        assert limiter.in_flight == 1
+        deadline = time.monotonic() + 10
+        while limiter.in_flight and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert limiter.in_flight == 0
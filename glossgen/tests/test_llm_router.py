@@ -0,0 +1,110 @@
+import pytest
+
+from glossgen.services import llm_router
+from glossgen.services.llm_resilience import ResilientCaller
+from glossgen.services.llm_router import GenerationRouter, GenerationTarget
+
+
+class _FakeLLM:
+    def __init__(self, name, fail=False):
+        self.name = name
+        self.fail = fail
+        self.prompts = []
+
+    def invoke(self, prompt):
+        self.prompts.append(prompt)
+        if self.fail:
+            raise RuntimeError(f"{self.name} is down")
+        return f"{self.name}: {prompt}"
+
+
+def _target(name, llm, weight=1.0):
+    target = GenerationTarget(provider="Local Stub", model=name, endpoint=f"http://{name}", weight=weight)
+    target.get_llm = lambda temperature: llm
+    return target
+
+
+@pytest.fixture(autouse=True)
+def caller(monkeypatch):
+    caller = ResilientCaller(max_retries=0, backoff_base=0.0, backoff_max=0.0, deadline=5.0)
+    monkeypatch.setattr(llm_router, 'get_resilient_caller', lambda: caller)
+    monkeypatch.setattr(llm_router, '_stats', {})
+    return caller
+
+
+def test_failed_target_fails_over_to_the_next():
+    down, up = _FakeLLM("down", fail=True), _FakeLLM("up")
+    warnings = []
+    router = GenerationRouter([_target("down", down, weight=1000.0), _target("up", up)], on_failover=warnings.append)
+
+    results = {router.invoke("prompt") for _ in range(5)}
+
+    assert results == {"up: prompt"}
+    assert down.prompts
+    assert warnings and all("Local Stub@http://down/down failed" in warning for warning in warnings)
+
+
+def test_error_of_the_last_target_is_raised():
+    router = GenerationRouter([_target("a", _FakeLLM("a", fail=True)), _target("b", _FakeLLM("b", fail=True))])
+
+    with pytest.raises(RuntimeError, match="is down"):
+        router.invoke("prompt")
+
+
+def test_zero_weight_targets_are_excluded():
+    router = GenerationRouter([_target("off", _FakeLLM("off"), weight=0), _target("on", _FakeLLM("on"))])
+
+    assert [target.model for target in router.targets] == ["on"]
+    with pytest.raises(ValueError):
+        GenerationRouter([_target("off", _FakeLLM("off"), weight=0)])
+
+
+def test_traffic_follows_weight():
+    heavy, light = _FakeLLM("heavy"), _FakeLLM("light")
+    router = GenerationRouter([_target("heavy", heavy, weight=9.0), _target("light", light, weight=1.0)])
+    for target in router.targets:
+        # Equal observed latency, so only the weight differs
+        llm_router._stats[target.key] = llm_router._TargetStats()
+        llm_router._stats[target.key].calls = 1
+
+    firsts = [router._ordered_targets()[0].model for _ in range(2000)]
+
+    assert 0.8 < firsts.count("heavy") / len(firsts) < 0.97
+
+
+def test_open_circuit_target_is_tried_last(caller):
+    first, second = _target("first", _FakeLLM("first"), weight=100.0), _target("second", _FakeLLM("second"))
+    router = GenerationRouter([first, second])
+    breaker = caller.breaker(first.name)
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+    assert [target.model for target in router._ordered_targets()] == ["second", "first"]
+
+
+def test_map_yields_results_and_errors_per_item():
+    router = GenerationRouter([_target("a", _FakeLLM("a"))])
+
+    def work(item):
+        if item == 2:
+            raise ValueError("bad item")
+        return item * 10
+
+    outcomes = {item: (result, str(error) if error else None) for item, result, error in router.map(work, [1, 2, 3])}
+
+    assert outcomes == {1: (10, None), 2: (None, "bad item"), 3: (30, None)}
+
+
+def test_from_settings_skips_duplicates_and_incomplete_entries():
+    router = GenerationRouter.from_settings(
+        {'provider': "OpenAI", 'model': "gpt-4o", 'api_key': "sk-1"},
+        [
+            {'provider': "OpenAI", 'model': "gpt-4o"},
+            {'provider': "Azure OpenAI", 'model': ""},
+            {'provider': "Ollama", 'model': "llama3", 'endpoint': "http://localhost:11434", 'weight': 2}
+        ]
+    )
+
+    assert [(target.provider, target.model, target.weight) for target in router.targets] == [
+        ("OpenAI", "gpt-4o", 1.0), ("Ollama", "llama3", 2.0)
+    ]
@@ -0,0 +1,113 @@
+import io
+import zipfile
+
+import pandas as pd
+import pytest
+
+from glossgen.services.markdown_renderer import DocumentationRenderer, SectionCache
+from glossgen.state.glossary_store import GlossaryStore
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    SectionCache.clear()
+    monkeypatch.setattr(SectionCache, 'stats', {'hits': 0, 'misses': 0})
+
+
+def _glossaries():
+    return GlossaryStore({
+        'customers': pd.DataFrame({'column_name': ['id', 'name'], 'description': ['Customer id', 'Name | alias']}),
+        'orders': pd.DataFrame({'column_name': ['id', 'customer_id'], 'description': ['Order id', 'Buyer\nreference']}),
+        'audit/log': pd.DataFrame({'column_name': ['event'], 'description': ['What happened']}),
+    })
+
+
+def _relationships():
+    return pd.DataFrame([
+        {'table1': 'orders', 'column1': 'customer_id', 'table2': 'customers', 'column2': 'id', 'confidence': 95},
+    ])
+
+
+def _renderer(glossaries=None, descriptions=None, relationships=None):
+    glossaries = glossaries if glossaries is not None else _glossaries()
+    return DocumentationRenderer(
+        "shop",
+        list(glossaries),
+        descriptions if descriptions is not None else {'customers': "People who buy. More text.", 'orders': "Sales."},
+        relationships if relationships is not None else _relationships(),
+        glossaries
+    )
+
+
+def test_document_lists_tables_relationships_and_glossaries():
+    document = "".join(_renderer().sections())
+
+    assert document.startswith("# Database Documentation: shop\n")
+    assert "- **customers**: People who buy." in document
+    assert "- **audit/log**: No description defined." in document
+    assert "- orders.customer_id → customers.id (Confidence: 95%)" in document
+    assert document.index("### audit/log") < document.index("### customers") < document.index("### orders")
+    assert "| name | Name \\| alias |" in document
+    assert "| customer_id | Buyer reference |" in document
+
+
+def test_only_changed_sections_are_rendered_again():
+    glossaries = _glossaries()
+    "".join(_renderer(glossaries).sections())
+    assert SectionCache.stats == {'hits': 0, 'misses': 3}
+
+    edited = glossaries['orders']
+    edited.loc[0, 'description'] = "Order number"
+    glossaries['orders'] = edited
+    document = "".join(_renderer(glossaries).sections())
+
+    assert SectionCache.stats == {'hits': 2, 'misses': 4}
+    assert "| id | Order number |" in document
+
+
+def test_relationship_changes_invalidate_the_tables_involved():
+    "".join(_renderer().sections())
+
+    "".join(_renderer(relationships=_relationships().assign(confidence=60)).sections())
+
+    # customers and orders are re-rendered, audit/log is not
+    assert SectionCache.stats == {'hits': 1, 'misses': 5}
+
+
+def test_key_follows_content():
+    key = _renderer().key()
+
+    assert _renderer().key() == key
+    assert _renderer(descriptions={'customers': "Other."}).key() != key
+    assert _renderer(relationships=pd.DataFrame()).key() != key
+
+
+def test_split_archive_has_an_index_and_one_file_per_table():
+    renderer = _renderer()
+    content = io.BytesIO()
+    renderer.write_split_archive()(content)
+    archive = zipfile.ZipFile(content)
+
+    assert sorted(archive.namelist()) == [
+        "README.md", "tables/audit_log.md", "tables/customers.md", "tables/orders.md"
+    ]
+    readme = archive.read("README.md").decode('utf-8')
+    assert "- [audit/log](tables/audit_log.md)" in readme
+    assert "## Table Relationships" in readme
+    orders = archive.read("tables/orders.md").decode('utf-8')
+    assert orders == renderer.section('orders').lstrip("\n")
+    assert orders.startswith("### orders")
+
+
+def test_colliding_file_names_get_a_hash():
+    glossaries = GlossaryStore({
+        'a b': pd.DataFrame({'column_name': ['x']}),
+        'a_b': pd.DataFrame({'column_name': ['y']}),
+    })
+    content = io.BytesIO()
+    _renderer(glossaries, {}, pd.DataFrame()).write_split_archive()(content)
+
+    names = [name for name in zipfile.ZipFile(content).namelist() if name.startswith("tables/")]
+
+    assert len(set(names)) == 2
+    assert "tables/a_b.md" in names
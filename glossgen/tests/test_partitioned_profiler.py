@@ -0,0 +1,64 @@
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+
+from glossgen.config.app_config import AppConfig
+from glossgen.tools import partitioned_profiler
+from glossgen.tools.partitioned_profiler import profile_partitioned
+from glossgen.tools.sql import SchemaExtractor
+
+ROWS = 20000
+
+
+@pytest.fixture
+def extractor(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'profile.db'}")
+    pd.DataFrame({
+        'id': range(ROWS),
+        'category': [f"c{i % 50}" for i in range(ROWS)],
+        'amount': [None if i % 4 == 0 else i for i in range(ROWS)],
+    }).to_sql('sales', engine, index=False)
+    yield SchemaExtractor(engine)
+    engine.dispose()
+
+
+def test_partitions_merge_to_whole_table_counts(extractor):
+    profile = profile_partitioned(extractor, 'sales', partitions=8, concurrency=4)
+    assert profile.rows == ROWS
+    assert profile.nulls == {'id': 0, 'category': 0, 'amount': ROWS // 4}
+    assert profile.distinct['category'].count() == 50
+    assert profile.distinct['id'].count() == pytest.approx(ROWS, rel=0.03)
+    assert all(len(values) == AppConfig.PROFILE_SAMPLE_VALUES for values in profile.sample_data().values())
+
+
+def test_failed_server_side_range_redoes_the_whole_table_client_side(extractor, monkeypatch):
+    calls = []
+
+    def server_side(conn, table_sql, key_sql, columns, key_range):
+        calls.append(key_range)
+        if len(calls) == 3:
+            raise RuntimeError("function hashtextextended does not exist")
+        profile = partitioned_profiler.PartitionProfile(columns)
+        for counter in profile.distinct.values():
+            counter.sketch.hash_name = "hashtextextended"
+        return profile
+
+    monkeypatch.setattr(partitioned_profiler, '_server_side_aggregates', lambda engine: True)
+    monkeypatch.setattr(partitioned_profiler, '_profile_range_postgresql', server_side)
+
+    profile = profile_partitioned(extractor, 'sales', partitions=8, concurrency=1)
+    assert calls
+    assert profile.rows == ROWS
+    assert profile.distinct['category'].count() == 50
+    assert {counter.sketch.hash_name for counter in profile.distinct.values()} == {"pandas"}
+
+
+def test_cached_samples_are_cleared(extractor, monkeypatch):
+    monkeypatch.setattr(AppConfig, 'PROFILE_PARTITION_MIN_ROWS', 1)
+    monkeypatch.setattr(extractor, 'estimate_row_counts', lambda: {'sales': ROWS})
+    assert extractor.profile_partitioned('sales') is not None
+    assert 'sales' in extractor._partition_samples
+
+    extractor.clear_cached_profiles()
+    assert extractor._partition_samples == {}
+    assert extractor._row_estimates is None
@@ -0,0 +1,137 @@
+import io
+import json
+import os
+import zipfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from glossgen.config.app_config import AppConfig
+from glossgen.services.project_store import (
+    MANIFEST_FILE,
+    extract_project_archive,
+    list_projects,
+    load_project,
+    project_archive_writer,
+    project_directory,
+    save_project
+)
+from glossgen.state.glossary_store import GlossaryStore
+
+
+def _glossaries(tables=3):
+    return GlossaryStore({
+        f"table_{index}": pd.DataFrame({
+            'column_name': [f"col_{index}_{row}" for row in range(index + 1)],
+            'data_type': ['INTEGER'] * (index + 1),
+            'description': [None if row % 2 else f"Column {row} of table {index}" for row in range(index + 1)],
+            'null_percentage': [float(row) for row in range(index + 1)],
+            'is_primary_key': [row == 0 for row in range(index + 1)],
+            'sample_data': [[str(row), 'x'] for row in range(index + 1)],
+            **({'owner': ['ops'] * (index + 1)} if index == 1 else {})
+        })
+        for index in range(tables)
+    })
+
+
+def _relationships():
+    return pd.DataFrame([
+        {'table1': 'table_0', 'column1': 'col_0_0', 'table2': 'table_1', 'column2': 'col_1_0', 'confidence': 0.9},
+        {'table1': 'table_1', 'column1': 'col_1_0', 'table2': 'table_2', 'column2': 'col_2_1', 'confidence': 0.5},
+    ])
+
+
+def _descriptions():
+    return {'table_0': "First table", 'table_2': "Third table"}
+
+
+def test_save_and_load_round_trip(tmp_path, monkeypatch):
+    # Several row groups, so slicing by manifest row counts crosses batches
+    monkeypatch.setattr(AppConfig, 'PROJECT_TABLES_PER_ROW_GROUP', 2)
+    glossaries = _glossaries()
+    save_project(str(tmp_path), "shop", glossaries, _descriptions(), _relationships())
+
+    project = load_project(str(tmp_path))
+
+    assert project['db_name'] == "shop"
+    assert list(project['glossaries']) == list(glossaries)
+    for table in glossaries:
+        assert project['glossaries'].compact(table).digest() == glossaries.compact(table).digest()
+        pd.testing.assert_frame_equal(project['glossaries'][table], glossaries[table])
+    assert project['descriptions'] == _descriptions()
+    pd.testing.assert_frame_equal(project['relationship_matrix'], _relationships(), check_dtype=False)
+
+
+def test_load_selected_tables_and_columns(tmp_path):
+    save_project(str(tmp_path), "shop", _glossaries(), _descriptions(), _relationships())
+
+    project = load_project(str(tmp_path), columns=['column_name', 'description'], tables=['table_1', 'table_2'])
+
+    assert list(project['glossaries']) == ['table_1', 'table_2']
+    assert project['glossaries'].columns('table_2') == ['column_name', 'description']
+    assert project['glossaries']['table_2']['column_name'].tolist() == ['col_2_0', 'col_2_1', 'col_2_2']
+    assert project['descriptions'] == {'table_2': "Third table"}
+    assert project['relationship_matrix'][['table1', 'table2']].values.tolist() == [['table_1', 'table_2']]
+
+
+def test_empty_project_round_trip(tmp_path):
+    save_project(str(tmp_path), "empty", GlossaryStore(), {}, None)
+
+    project = load_project(str(tmp_path))
+
+    assert len(project['glossaries']) == 0
+    assert project['descriptions'] == {}
+    assert project['relationship_matrix'].empty
+
+
+def test_unsupported_version_is_rejected(tmp_path):
+    save_project(str(tmp_path), "shop", _glossaries(1), {}, None)
+    manifest_path = tmp_path / MANIFEST_FILE
+    manifest = json.loads(manifest_path.read_text())
+    manifest['version'] = 99
+    manifest_path.write_text(json.dumps(manifest))
+
+    with pytest.raises(ValueError, match="Unsupported project version"):
+        load_project(str(tmp_path))
+
+
+def test_archive_round_trip(tmp_path):
+    archive = io.BytesIO()
+    project_archive_writer("shop", _glossaries(), _descriptions(), _relationships())(archive)
+    archive.seek(0)
+
+    directory = extract_project_archive(archive, str(tmp_path / "restored"))
+    project = load_project(directory)
+
+    assert list(project['glossaries']) == ['table_0', 'table_1', 'table_2']
+    assert project['descriptions'] == _descriptions()
+
+
+def test_extract_refuses_foreign_archives_and_existing_projects(tmp_path):
+    foreign = io.BytesIO()
+    with zipfile.ZipFile(foreign, 'w') as archive:
+        archive.writestr(MANIFEST_FILE, "{}")
+    foreign.seek(0)
+    with pytest.raises(ValueError, match="Not a GlossGen project"):
+        extract_project_archive(foreign)
+
+    existing = tmp_path / "existing"
+    existing.mkdir()
+    (existing / "keep.txt").write_text("keep")
+    archive = io.BytesIO()
+    project_archive_writer("shop", _glossaries(1), {}, None)(archive)
+    archive.seek(0)
+    with pytest.raises(ValueError, match="already exists"):
+        extract_project_archive(archive, str(existing))
+    assert os.listdir(existing) == ["keep.txt"]
+
+
+def test_projects_are_listed_by_safe_name(tmp_path, monkeypatch):
+    monkeypatch.setattr(AppConfig, 'PROJECTS_DIR', str(tmp_path))
+    directory = project_directory("../My shop/2024")
+
+    save_project(directory, "shop", _glossaries(1), {}, None)
+
+    assert os.path.dirname(directory) == str(tmp_path)
+    assert list_projects() == [os.path.basename(directory)]
@@ -0,0 +1,82 @@
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import create_engine
+
+from glossgen.services import query_runner
+from glossgen.services.job_runner import Job, JobRunner, CANCELLED
+from glossgen.services.query_runner import PAGE_RESULT, run_query_job
+
+SLOW_QUERY = (
+    "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 1000000000) "
+    "SELECT COUNT(*) FROM n"
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'query.db'}")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE t (i INTEGER)")
+        conn.exec_driver_sql("INSERT INTO t VALUES " + ", ".join(f"({i})" for i in range(25)))
+    yield engine
+    engine.dispose()
+
+
+def test_rows_are_published_in_pages(engine):
+    job = Job("query", "test")
+    summary = run_query_job(job, engine, "SELECT i FROM t", page_size=10, max_rows=22)
+    pages = [job.results[key] for key in sorted(job.results) if key.startswith(PAGE_RESULT)]
+    assert [len(page) for page in pages] == [10, 10, 2]
+    assert summary['rows'] == 22
+    assert summary['truncated'].startswith("row limit")
+
+
+def test_cancel_interrupts_a_running_statement(engine):
+    runner = JobRunner(max_workers=1)
+    job = runner.submit("query", run_query_job, "test", engine=engine, sql=SLOW_QUERY, timeout=60)
+    while job.status != "running":
+        time.sleep(0.01)
+    time.sleep(0.2)
+    started = time.monotonic()
+    job.cancel()
+    while not job.finished:
+        time.sleep(0.01)
+    assert job.status == CANCELLED
+    assert time.monotonic() - started < 5
+
+
+class _FakeMySQLConnection:
+    def __init__(self, statements):
+        self.dialect = type('Dialect', (), {'name': 'mysql'})()
+        self.statements = statements
+
+    def execute(self, statement):
+        self.statements.append(str(statement))
+        return type('Result', (), {'scalar': lambda self: 42})()
+
+
+def test_mysql_statements_are_killed_from_a_second_connection():
+    statements = []
+
+    class Engine:
+        @contextmanager
+        def connect(self):
+            yield _FakeMySQLConnection(statements)
+
+    interrupt = query_runner._interrupter(_FakeMySQLConnection(statements), object(), Engine())
+    lock, running = threading.Lock(), [True]
+    query_runner._interrupt(interrupt, lock, running)
+    assert statements == ["SELECT CONNECTION_ID()", "KILL QUERY 42"]
+
+    # Once the connection is back in the pool, its id may run someone else's statement
+    running[0] = False
+    query_runner._interrupt(interrupt, lock, running)
+    assert statements[-1] == "KILL QUERY 42" and len(statements) == 2
+
+
+def test_drivers_without_cancellation_are_reported():
+    conn = type('Conn', (), {'dialect': type('Dialect', (), {'name': 'other'})()})()
+    assert query_runner._interrupter(conn, object(), None) is None
@@ -0,0 +1,121 @@
+import pandas as pd
+import pytest
+
+from glossgen.services.job_runner import Job
+from glossgen.services.relationships import (
+    RELATIONSHIP_COLUMNS,
+    RelationshipCache,
+    apply_overlay,
+    diff_overlay,
+    empty_overlay,
+    overlay_from_matrix,
+    run_relationship_job
+)
+
+
+class _Extractor:
+    def __init__(self, source_key="files:test", fingerprint="v1"):
+        self.source_key = source_key
+        self.schema_fingerprint = fingerprint
+        self.analyzed = []
+
+    def get_relationship_matrix_for_two_tables(self, table1, table2):
+        self.analyzed.append((table1, table2))
+        return pd.DataFrame([{
+            'table1': table1, 'column1': 'id', 'table2': table2, 'column2': f"{table1}_id", 'confidence': 0.9
+        }])
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(RelationshipCache, '_pairs', type(RelationshipCache._pairs)())
+
+
+def _rows(matrix):
+    return sorted(matrix[['table1', 'table2']].itertuples(index=False, name=None))
+
+
+def test_changed_selection_only_analyzes_new_pairs():
+    extractor = _Extractor()
+    first = run_relationship_job(Job("relationships", "session"), extractor, ["a", "b"])
+    job = Job("relationships", "session")
+    second = run_relationship_job(job, extractor, ["c", "b", "a"])
+
+    assert _rows(first) == [("a", "b")]
+    assert extractor.analyzed == [("a", "b"), ("a", "c"), ("b", "c")]
+    assert job.total == 2
+    assert _rows(second) == [("a", "b"), ("a", "c"), ("b", "c")]
+    assert _rows(RelationshipCache.matrix(extractor, ["a", "c"])) == [("a", "c")]
+
+
+def test_matrix_is_missing_until_every_pair_is_analyzed():
+    extractor = _Extractor()
+    RelationshipCache.put(extractor, ("a", "b"), pd.DataFrame(columns=RELATIONSHIP_COLUMNS))
+
+    assert RelationshipCache.matrix(extractor, ["a", "b", "c"]) is None
+    assert RelationshipCache.matrix(extractor, ["a", "b"]).empty
+
+
+def test_schema_change_and_other_sources_miss_the_cache():
+    extractor = _Extractor()
+    run_relationship_job(Job("relationships", "session"), extractor, ["a", "b"])
+
+    assert RelationshipCache.missing_pairs(_Extractor(fingerprint="v2"), ["a", "b"]) == [("a", "b")]
+    assert RelationshipCache.missing_pairs(_Extractor(source_key="files:other"), ["a", "b"]) == [("a", "b")]
+    assert RelationshipCache.missing_pairs(extractor, ["a", "b"]) == []
+
+
+def test_least_recently_used_pairs_are_evicted(monkeypatch):
+    monkeypatch.setattr("glossgen.config.app_config.AppConfig.RELATIONSHIP_CACHE_SIZE", 2)
+    extractor = _Extractor()
+    RelationshipCache.put(extractor, ("a", "b"), pd.DataFrame(columns=RELATIONSHIP_COLUMNS))
+    RelationshipCache.put(extractor, ("a", "c"), pd.DataFrame(columns=RELATIONSHIP_COLUMNS))
+    RelationshipCache.matrix(extractor, ["a", "b"])
+    RelationshipCache.put(extractor, ("b", "c"), pd.DataFrame(columns=RELATIONSHIP_COLUMNS))
+
+    assert RelationshipCache.missing_pairs(extractor, ["a", "b", "c"]) == [("a", "c")]
+
+
+def _matrix(*rows):
+    return pd.DataFrame(
+        [{'table1': t1, 'column1': c1, 'table2': t2, 'column2': c2, 'confidence': conf}
+         for t1, c1, t2, c2, conf in rows],
+        columns=RELATIONSHIP_COLUMNS
+    )
+
+
+def test_overlay_keeps_removals_additions_and_changes():
+    base = _matrix(("a", "id", "b", "a_id", 0.9), ("a", "id", "c", "a_id", 0.8))
+    edited = _matrix(("a", "id", "b", "a_id", 0.5), ("b", "id", "c", "b_id", 1.0))
+
+    overlay = diff_overlay(base, edited, empty_overlay(), ["a", "b", "c"])
+    applied = apply_overlay(base, overlay, ["a", "b", "c"])
+
+    assert sorted(applied.itertuples(index=False, name=None)) == [
+        ("a", "id", "b", "a_id", 0.5), ("b", "id", "c", "b_id", 1.0)
+    ]
+
+
+def test_overlay_survives_recomputation_and_hidden_tables():
+    base = _matrix(("a", "id", "b", "a_id", 0.9), ("a", "id", "c", "a_id", 0.8))
+    overlay = diff_overlay(base, _matrix(("a", "id", "b", "a_id", 0.9)), empty_overlay(), ["a", "b", "c"])
+
+    # Only a and b are shown now; the removal of the a/c row must survive the edit
+    narrowed = diff_overlay(
+        _matrix(("a", "id", "b", "a_id", 0.9)),
+        _matrix(("a", "id", "b", "a_id", 0.7)),
+        overlay,
+        ["a", "b"]
+    )
+
+    assert _rows(apply_overlay(base, narrowed, ["a", "b", "c"])) == [("a", "b")]
+    assert apply_overlay(base, narrowed, ["a", "b", "c"])['confidence'].tolist() == [0.7]
+
+
+def test_overlay_from_matrix_pins_restored_rows():
+    restored = _matrix(("a", "id", "b", "a_id", 0.4))
+    computed = _matrix(("a", "id", "b", "a_id", 0.9))
+
+    applied = apply_overlay(computed, overlay_from_matrix(restored), ["a", "b"])
+
+    assert applied['confidence'].tolist() == [0.4]
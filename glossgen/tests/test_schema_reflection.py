@@ -0,0 +1,93 @@
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, event, text
+
+from glossgen.config.app_config import AppConfig
+from glossgen.tools.sql import SchemaExtractor
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    # Attached SQLite databases are schemas, which stands in for PostgreSQL/SQL Server schemas here
+    monkeypatch.setattr(AppConfig, 'MULTI_SCHEMA_DIALECTS', AppConfig.MULTI_SCHEMA_DIALECTS + ['sqlite'])
+    attached = {name: str(tmp_path / f"{name}.db") for name in ('sales', 'staging_2024', 'staging_2025')}
+    engine = create_engine(f"sqlite:///{tmp_path / 'main.db'}")
+
+    @event.listens_for(engine, "connect")
+    def attach(dbapi_connection, connection_record):
+        for name, path in attached.items():
+            dbapi_connection.execute(f"ATTACH DATABASE '{path}' AS {name}")
+
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE customers (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(text("CREATE TABLE sales.orders (id INTEGER PRIMARY KEY, customer_id INTEGER, total REAL)"))
+        conn.execute(text("CREATE TABLE sales.customers (id INTEGER PRIMARY KEY, region TEXT)"))
+        conn.execute(text("CREATE TABLE staging_2024.orders (id INTEGER)"))
+        conn.execute(text("CREATE TABLE staging_2025.orders (id INTEGER)"))
+        conn.execute(text("INSERT INTO customers VALUES (1, 'main customer')"))
+        conn.execute(text("INSERT INTO sales.customers VALUES (1, 'north'), (2, 'south')"))
+    yield engine
+    engine.dispose()
+
+
+def test_every_schema_is_reflected_with_qualified_names(engine):
+    extractor = SchemaExtractor(engine, [], [])
+
+    assert extractor.schemas == [None, 'sales', 'staging_2024', 'staging_2025']
+    assert sorted(extractor.schema_info) == [
+        'customers', 'sales.customers', 'sales.orders', 'staging_2024.orders', 'staging_2025.orders'
+    ]
+    assert extractor.schema_info['sales.orders']['schema'] == 'sales'
+    assert extractor.schema_info['sales.orders']['name'] == 'orders'
+    assert [column['name'] for column in extractor.schema_info['sales.orders']['columns']] == [
+        'id', 'customer_id', 'total'
+    ]
+    assert extractor.schema_info['sales.orders']['primary_key']['constrained_columns'] == ['id']
+
+
+def test_exclude_patterns_drop_schemas(engine):
+    extractor = SchemaExtractor(engine, [], ['STAGING_*'])
+
+    assert extractor.schemas == [None, 'sales']
+    assert sorted(extractor.schema_info) == ['customers', 'sales.customers', 'sales.orders']
+
+
+def test_include_patterns_can_leave_out_the_default_schema(engine):
+    extractor = SchemaExtractor(engine, ['sales'], [])
+
+    assert extractor.schemas == ['sales']
+    assert sorted(extractor.schema_info) == ['sales.customers', 'sales.orders']
+
+
+def test_same_table_name_in_two_schemas_reads_the_right_one(engine):
+    extractor = SchemaExtractor(engine, [], [])
+
+    assert extractor.table_sql('customers') == 'customers'
+    assert extractor.table_sql('sales.customers') == 'sales.customers'
+    assert extractor.get_preview('customers')['name'].tolist() == ['main customer']
+    assert extractor.get_preview('sales.customers')['region'].tolist() == ['north', 'south']
+
+
+def test_quoted_names_stay_quoted(engine):
+    with engine.begin() as conn:
+        conn.execute(text('CREATE TABLE sales."order lines" (id INTEGER)'))
+    extractor = SchemaExtractor(engine, ['sales'], [])
+
+    assert extractor.table_sql('sales.order lines') == 'sales."order lines"'
+    assert isinstance(extractor.get_preview('sales.order lines'), pd.DataFrame)
+
+
+def test_single_schema_dialects_only_reflect_the_default_schema(engine, monkeypatch):
+    monkeypatch.setattr(AppConfig, 'MULTI_SCHEMA_DIALECTS', ['postgresql', 'mssql'])
+    extractor = SchemaExtractor(engine, [], [])
+
+    assert extractor.schemas == [None]
+    assert list(extractor.schema_info) == ['customers']
+
+
+def test_schema_changes_change_the_fingerprint(engine):
+    before = SchemaExtractor(engine, [], []).schema_fingerprint
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE sales.orders ADD COLUMN currency TEXT"))
+
+    assert SchemaExtractor(engine, [], []).schema_fingerprint != before
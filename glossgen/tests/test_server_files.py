@@ -0,0 +1,39 @@
+import os
+
+import pytest
+
+from glossgen.config.app_config import AppConfig
+from glossgen.services.server_files import resolve_server_paths
+
+
+@pytest.fixture
+def root(tmp_path, monkeypatch):
+    root = tmp_path / "files"
+    root.mkdir()
+    (root / "orders.csv").write_text("id\n1\n")
+    (tmp_path / "secret.csv").write_text("id\n1\n")
+    monkeypatch.setattr(AppConfig, "SERVER_FILES_DIR", str(root))
+    return root
+
+
+def test_disabled_by_default(monkeypatch):
+    monkeypatch.setattr(AppConfig, "SERVER_FILES_DIR", "")
+    assert resolve_server_paths("", ["csv"]) == []
+    with pytest.raises(ValueError):
+        resolve_server_paths("/etc/passwd", ["csv"])
+
+
+def test_resolves_files_inside_the_directory(root):
+    assert resolve_server_paths("orders.csv\n\n", ["csv"]) == [("orders.csv", str(root / "orders.csv"))]
+
+
+@pytest.mark.parametrize("path", ["../secret.csv", "/etc/passwd", "missing.csv", ".", "link.csv", "orders.csv/.."])
+def test_refuses_paths_outside_the_directory(root, path):
+    os.symlink(root.parent / "secret.csv", root / "link.csv")
+    with pytest.raises(ValueError, match="Not an allowed file"):
+        resolve_server_paths(path, ["csv"])
+
+
+def test_refuses_other_extensions(root):
+    with pytest.raises(ValueError):
+        resolve_server_paths("orders.csv", ["parquet"])
@@ -0,0 +1,61 @@
+import os
+import threading
+import time
+
+import pytest
+
+from glossgen.services.llm_router import GenerationRouter, GenerationTarget
+from glossgen.services.single_flight import FileLockSingleFlight, _router_signature
+
+
+@pytest.fixture
+def flight(tmp_path):
+    directory = tmp_path / "flights"
+    return FileLockSingleFlight(str(directory))
+
+
+def test_overlapping_callers_share_one_result(flight):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.3)
+        return len(calls)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flight.do('key', compute))) for _ in range(4)]
+    threads[0].start()
+    time.sleep(0.1)
+    for thread in threads[1:]:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert calls == [1]
+    assert results == [1, 1, 1, 1]
+    assert os.listdir(flight.directory) == []
+
+
+def test_later_callers_compute_again(flight):
+    assert flight.do('key', lambda: 'first') == 'first'
+    assert flight.do('key', lambda: 'second') == 'second'
+    assert os.listdir(flight.directory) == []
+
+
+def test_rejects_directory_writable_by_others(tmp_path):
+    directory = tmp_path / "shared"
+    directory.mkdir()
+    directory.chmod(0o777)
+    with pytest.raises(RuntimeError):
+        FileLockSingleFlight(str(directory))
+
+
+def _chain(api_key):
+    router = GenerationRouter([GenerationTarget("OpenAI", "gpt-4o-mini", api_key=api_key)], temperature=0.2)
+    return type('Chain', (), {'router': router})()
+
+
+def test_router_signature_separates_api_keys():
+    assert _router_signature(_chain("key-a")) == _router_signature(_chain("key-a"))
+    assert _router_signature(_chain("key-a")) != _router_signature(_chain("key-b"))
+    assert "key-a" not in _router_signature(_chain("key-a"))
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from glossgen.utils.sketches import DistinctCounter, HyperLogLog, Reservoir, hash_values
+
+
+def _sketch(values, hash_name="pandas"):
+    sketch = HyperLogLog(12, hash_name)
+    sketch.add_hashes(hash_values(pd.Series(values)))
+    return sketch
+
+
+def test_hyperloglog_merge_is_the_sketch_of_the_union():
+    left, right = _sketch(range(0, 60000)), _sketch(range(40000, 100000))
+    merged = left.merge(right)
+    assert np.array_equal(merged.registers, _sketch(range(100000)).registers)
+    assert merged.estimate() == pytest.approx(100000, rel=0.05)
+
+
+@pytest.mark.parametrize("other", [HyperLogLog(12, "hashtextextended"), HyperLogLog(14)])
+def test_hyperloglog_refuses_sketches_of_another_hash_or_precision(other):
+    with pytest.raises(ValueError):
+        _sketch(range(10)).merge(other)
+
+
+def test_distinct_counter_merge_stays_exact_until_the_limit():
+    left, right = DistinctCounter(100, 12), DistinctCounter(100, 12)
+    left.add(pd.Series(range(0, 60)))
+    right.add(pd.Series(range(30, 90)))
+    merged = left.merge(right)
+    assert merged.exact and merged.count() == 90
+
+    right.add(pd.Series(range(90, 200)))
+    merged = left.merge(right)
+    assert not merged.exact
+    assert merged.count() == pytest.approx(200, rel=0.1)
+
+
+def test_distinct_counter_from_database_sketch_does_not_merge_with_client_counter():
+    server = DistinctCounter.from_sketch(HyperLogLog(12, "hashtextextended"), 100)
+    client = DistinctCounter(100, 12)
+    client.add(pd.Series([1, 2, 3]))
+    with pytest.raises(ValueError):
+        server.merge(client)
+
+
+def test_reservoir_merge_draws_in_proportion_to_values_seen():
+    drawn_from_small = 0
+    for seed in range(200):
+        small, large = Reservoir(5, seed), Reservoir(5, seed + 1000)
+        small.add(pd.Series(['s'] * 10))
+        large.add(pd.Series(['l'] * 90))
+        merged = small.merge(large)
+        assert merged.seen == 100 and len(merged.items) == 5
+        drawn_from_small += merged.items.count('s')
+    assert drawn_from_small / (200 * 5) == pytest.approx(0.1, abs=0.04)
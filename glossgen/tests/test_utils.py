@@ -0,0 +1,60 @@
+import pytest
+
+from glossgen.utils.utils import parse_glossary_response
+
+
+def _columns(items):
+    return {item['column_name']: item['description'] for item in items}
+
+
+def test_parses_wrapped_response_with_defects():
+    content = (
+        '```json\n{"glossary": [{"column_name": "a", "description": "x",},\n'
+        '{"column_name": "b", "description": "line\nbreak"}]}\n```'
+    )
+    items, missing = parse_glossary_response(content, ['a', 'b'])
+    assert _columns(items) == {'a': 'x', 'b': 'line\nbreak'}
+    assert missing == []
+
+
+def test_keeps_complete_entries_of_an_unclosed_wrapper():
+    content = '{"glossary": [{"column_name":"a","description":"x"},{"column_name":"b","descr'
+    items, missing = parse_glossary_response(content, ['a', 'b'])
+    assert _columns(items) == {'a': 'x'}
+    assert missing == ['b']
+
+
+@pytest.mark.parametrize("tail", [
+    '',
+    ', "extra": "p, q',
+    ', "extra": "p, \\"q,',
+    ', "count": 12',
+    ', "stats": {"min": 1, "ma',
+    ', "examples": ["u", "v',
+    ', "ext',
+    ',',
+])
+def test_truncated_entry_keeps_its_complete_members(tail):
+    content = '{"glossary": [{"column_name": "a", "description": "x"' + tail
+    items, missing = parse_glossary_response(content, ['a'])
+    assert _columns(items) == {'a': 'x'}
+    assert missing == []
+
+
+def test_entry_cut_before_its_description_is_missing():
+    items, missing = parse_glossary_response('[{"column_name": "a", "description": "par', ['a'])
+    assert items == []
+    assert missing == ['a']
+
+
+def test_malformed_entry_does_not_hide_the_others():
+    content = '[{"column_name": "a", "description": }, {"column_name": "b", "description": "y"}]'
+    items, missing = parse_glossary_response(content, ['a', 'b'])
+    assert _columns(items) == {'b': 'y'}
+    assert missing == ['a']
+
+
+def test_first_entry_per_column_wins():
+    content = '[{"column_name": "a", "description": "x"}, {"column_name": "a", "description": "y"}]'
+    items, _ = parse_glossary_response(content)
+    assert _columns(items) == {'a': 'x'}